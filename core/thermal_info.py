@@ -3,7 +3,6 @@ ThermalInfo核心类
 整个系统的核心数据结构，统一管理所有热分析相关数据
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from loguru import logger
@@ -18,6 +17,7 @@ from models.thermal_para import ThermalPara
 from models.constraints import Constraints
 from models.vertical_interconnect_manager import VerticalInterconnectManager
 from models.power_map import DieStackPowerMap
+from models.json_support import json_loads, json_dumps
 from core.material_manager import MaterialInfosMgr
 from parser.shape_parser import ShapeParser, ShapeParsingError
 
@@ -405,6 +405,7 @@ class ThermalInfo:
         for material_data in materials_data:
             material = MaterialInfo.from_dict(material_data)
             self.materials_mgr.add_material(material)
+        logger.debug(f"Loaded {len(materials_data)} materials")
 
         # 加载模板（templates）
         templates_data = data.get("templates", [])
@@ -484,8 +485,8 @@ class ThermalInfo:
         """
         data = self.to_dict()
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(file_path, 'wb') as f:
+            f.write(json_dumps(data))
 
         logger.info(f"Saved ThermalInfo to: {file_path}")
 
@@ -496,8 +497,8 @@ class ThermalInfo:
         Args:
             file_path: 加载路径
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = json_loads(f.read())
 
         self.from_dict(data)
         self.set_json_file_dir(file_path)
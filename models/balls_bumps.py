@@ -31,7 +31,6 @@ class BallBump:
         try:
             self.name = json_data.get("name", "")
             self.parameters = json_data.copy()
-            logger.debug(f"Loaded BallBump: {self.name}")
             
         except Exception as e:
             logger.error(f"Failed to load BallBump from JSON: {e}")
@@ -59,7 +58,6 @@ class BallsBumps:
     def add_ball_bump(self, ball_bump: BallBump) -> None:
         """添加球状凸点"""
         self.ball_bumps.append(ball_bump)
-        logger.debug(f"Added ball bump: {ball_bump.name}")
     
     def get_ball_bumps(self) -> List[BallBump]:
         """获取所有球状凸点"""
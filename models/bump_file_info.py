@@ -50,8 +50,6 @@ class BumpModel:
             self.height = json_data.get("height", 0.0)
             self.material = json_data.get("material", "")
             
-            logger.debug(f"Loaded BumpModel: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load BumpModel from JSON: {e}")
             raise
@@ -118,8 +116,6 @@ class BumpInstance:
             if "bumpModel" in json_data:
                 self.bump_model = BumpModel(json_data["bumpModel"])
             
-            logger.debug(f"Loaded BumpInstance: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load BumpInstance from JSON: {e}")
             raise
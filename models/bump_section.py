@@ -43,8 +43,6 @@ class BumpArray:
             self.width = json_data.get("width", 0.0)
             self.material = json_data.get("material", "")
             
-            logger.debug(f"Loaded BumpArray: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load BumpArray from JSON: {e}")
             raise
@@ -25,7 +25,6 @@ class CompositeMaterial:
             percentage: 体积分数 (0.0-1.0)
         """
         self.materials.append((material_name, percentage))
-        logger.debug(f"Added material {material_name} with percentage {percentage}")
     
     def get_effective_conductivity(self, materials_mgr, temperature: float = 293.15) -> 'Conductivity':
         """
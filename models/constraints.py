@@ -68,8 +68,6 @@ class Constraint:
             self.unit = json_data.get("unit", "")
             self.description = json_data.get("description", "")
             
-            logger.debug(f"Loaded Constraint: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load Constraint from JSON: {e}")
             raise
@@ -103,7 +101,6 @@ class Constraints:
     def add_constraint(self, constraint: Constraint) -> None:
         """添加约束条件"""
         self.constraints.append(constraint)
-        logger.debug(f"Added constraint: {constraint.get_name()}")
     
     def get_constraints(self) -> List[Constraint]:
         """获取所有约束条件"""
@@ -0,0 +1,253 @@
+"""
+形状包含判定内核
+六棱柱、圆角矩形（棱柱）、倒角矩形（棱柱）、正多边形（棱柱）、圆柱体和长方体的单点判定，纯算术实现；
+安装numba时编译为机器码，否则以普通Python函数运行。
+*_many 为批量版本，对点数组逐点调用单点内核，编译后释放GIL
+"""
+
+import math
+
+import numpy as np
+
+from models.numba_support import njit
+
+# 六棱柱斜边斜率 tan(30°)
+HEX_SLOPE = math.tan(math.pi / 6)
+
+
+@njit(cache=True)
+def hex_contains(px, py, pz, cx, cy, cz, r, r_half, half_h, slope):
+    """检查点是否在六棱柱内
+
+    r_half 为 r / 2；中间矩形区域（|dx| <= r / 2）最常见，先于斜边判断。
+    斜边区域内 slope * (r - |dx|) 不超过 r，无需再单独检查 |dy| > r
+    """
+    if abs(pz - cz) > half_h:
+        return False
+    adx = abs(px - cx)
+    if adx > r:
+        return False
+    ady = abs(py - cy)
+    if adx <= r_half:
+        return ady <= r
+    return ady <= slope * (r - adx)
+
+
+@njit(cache=True)
+def rounded_rect_contains(dx, dy, half_w, half_d, inner_w, inner_d, radius_sq):
+    """检查相对中心偏移为 (dx, dy) 的点是否在圆角矩形内
+
+    inner_w、inner_d 为圆角圆心相对中心的偏移（半尺寸减去圆角半径），radius_sq 为半径平方。
+    各轴超出圆心偏移的部分（不足时取0）即点到最近圆角圆心的距离分量
+    """
+    adx = abs(dx)
+    ady = abs(dy)
+    if adx > half_w or ady > half_d:
+        return False
+    ox = max(adx - inner_w, 0.0)
+    oy = max(ady - inner_d, 0.0)
+    return ox * ox + oy * oy <= radius_sq
+
+
+@njit(cache=True)
+def chamfered_rect_contains(dx, dy, half_w, half_d, inner_w, inner_d, chamfer):
+    """检查相对中心偏移为 (dx, dy) 的点是否在倒角矩形内
+
+    inner_w、inner_d 为倒角起点相对中心的偏移，各轴超出部分（不足时取0）之和不超过倒角长度
+    """
+    adx = abs(dx)
+    ady = abs(dy)
+    if adx > half_w or ady > half_d:
+        return False
+    ox = max(adx - inner_w, 0.0)
+    oy = max(ady - inner_d, 0.0)
+    return ox + oy <= chamfer
+
+
+@njit(cache=True)
+def rrect_contains(px, py, pz, cx, cy, cz, half_w, half_d, half_h, inner_w, inner_d, radius_sq):
+    """检查点是否在圆角矩形棱柱内（底面判定见rounded_rect_contains）"""
+    if abs(pz - cz) > half_h:
+        return False
+    return rounded_rect_contains(px - cx, py - cy, half_w, half_d, inner_w, inner_d, radius_sq)
+
+
+@njit(cache=True)
+def chamfer_contains(px, py, pz, cx, cy, cz, half_w, half_d, half_h, chamfer):
+    """检查点是否在倒角矩形棱柱内（底面判定见chamfered_rect_contains）"""
+    if abs(pz - cz) > half_h:
+        return False
+    return chamfered_rect_contains(px - cx, py - cy, half_w, half_d,
+                                   half_w - chamfer, half_d - chamfer, chamfer)
+
+
+@njit(cache=True)
+def polygon_contains(dx, dy, radius_sq, apothem, apothem_sq, rays, normals):
+    """检查相对中心偏移为 (dx, dy) 的点是否在正多边形内
+
+    rays 为 (边数, 2) 的顶点方向单位向量数组（第k条为 k × 2π / 边数 方向），
+    normals 为对应各边外法向量数组。点所在的角度区间用外积符号二分查找，不调用atan2
+    """
+    r2 = dx * dx + dy * dy
+    # 外接圆之外必在多边形外，内切圆之内必在多边形内
+    if r2 > radius_sq:
+        return False
+    if r2 <= apothem_sq:
+        return True
+    sides = normals.shape[0]
+    # 点的极角位于 [0, π) 时为上半平面
+    upper = dy > 0.0 or (dy == 0.0 and dx >= 0.0)
+    lo = 0
+    hi = sides
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        # 判断点的极角是否不小于第mid条顶点射线的角度：
+        # 同一半平面内两角之差落在 (-π, π)，外积符号即可给出先后
+        if 2 * mid <= sides:
+            ge = (not upper) or rays[mid, 0] * dy - rays[mid, 1] * dx >= 0.0
+        else:
+            ge = (not upper) and rays[mid, 0] * dy - rays[mid, 1] * dx >= 0.0
+        if ge:
+            lo = mid
+        else:
+            hi = mid
+    return dx * normals[lo, 0] + dy * normals[lo, 1] <= apothem
+
+
+@njit(cache=True)
+def nsided_contains(px, py, pz, cx, cy, cz, half_h, radius_sq, apothem, apothem_sq, rays, normals):
+    """检查点是否在正多边形棱柱内（底面判定见polygon_contains）"""
+    if abs(pz - cz) > half_h:
+        return False
+    return polygon_contains(px - cx, py - cy, radius_sq, apothem, apothem_sq, rays, normals)
+
+
+@njit(cache=True)
+def cylinder_contains(px, py, pz, cx, cy, cz, half_h, radius_sq):
+    """检查点是否在圆柱体内"""
+    if abs(pz - cz) > half_h:
+        return False
+    dx = px - cx
+    dy = py - cy
+    return dx * dx + dy * dy <= radius_sq
+
+
+@njit(cache=True)
+def box_contains(px, py, pz, cx, cy, cz, half_x, half_y, half_z):
+    """检查点是否在轴对齐长方体内（取各轴超出半尺寸的最大值与0比较）"""
+    return max(abs(px - cx) - half_x, abs(py - cy) - half_y, abs(pz - cz) - half_z) <= 0.0
+
+
+@njit(cache=True, nogil=True)
+def hex_contains_many(points, cx, cy, cz, r, r_half, half_h, slope):
+    """批量检查 (N, 3) 点数组中各点是否在六棱柱内"""
+    n = points.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = hex_contains(points[i, 0], points[i, 1], points[i, 2], cx, cy, cz, r, r_half, half_h, slope)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rrect_contains_many(points, cx, cy, cz, half_w, half_d, half_h, inner_w, inner_d, radius_sq):
+    """批量检查 (N, 3) 点数组中各点是否在圆角矩形棱柱内"""
+    n = points.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = rrect_contains(points[i, 0], points[i, 1], points[i, 2],
+                                cx, cy, cz, half_w, half_d, half_h, inner_w, inner_d, radius_sq)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def chamfer_contains_many(points, cx, cy, cz, half_w, half_d, half_h, chamfer):
+    """批量检查 (N, 3) 点数组中各点是否在倒角矩形棱柱内"""
+    n = points.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = chamfer_contains(points[i, 0], points[i, 1], points[i, 2],
+                                  cx, cy, cz, half_w, half_d, half_h, chamfer)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rounded_rect_contains_many(xs, ys, cx, cy, half_w, half_d, inner_w, inner_d, radius_sq):
+    """批量检查 (N,) 坐标数组给出的各点是否在圆角矩形内"""
+    n = xs.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = rounded_rect_contains(xs[i] - cx, ys[i] - cy, half_w, half_d, inner_w, inner_d, radius_sq)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def chamfered_rect_contains_many(xs, ys, cx, cy, half_w, half_d, inner_w, inner_d, chamfer):
+    """批量检查 (N,) 坐标数组给出的各点是否在倒角矩形内"""
+    n = xs.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = chamfered_rect_contains(xs[i] - cx, ys[i] - cy, half_w, half_d, inner_w, inner_d, chamfer)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def polygon_contains_many(xs, ys, cx, cy, radius_sq, apothem, apothem_sq, rays, normals):
+    """批量检查 (N,) 坐标数组给出的各点是否在正多边形内"""
+    n = xs.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = polygon_contains(xs[i] - cx, ys[i] - cy, radius_sq, apothem, apothem_sq, rays, normals)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def nsided_contains_many(points, cx, cy, cz, half_h, radius_sq, apothem, apothem_sq, rays, normals):
+    """批量检查 (N, 3) 点数组中各点是否在正多边形棱柱内"""
+    n = points.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = nsided_contains(points[i, 0], points[i, 1], points[i, 2], cx, cy, cz,
+                                 half_h, radius_sq, apothem, apothem_sq, rays, normals)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def cylinder_contains_many(points, cx, cy, cz, half_h, radius_sq):
+    """批量检查 (N, 3) 点数组中各点是否在圆柱体内"""
+    n = points.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = cylinder_contains(points[i, 0], points[i, 1], points[i, 2], cx, cy, cz, half_h, radius_sq)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def box_contains_many(points, cx, cy, cz, half_x, half_y, half_z):
+    """批量检查 (N, 3) 点数组中各点是否在轴对齐长方体内"""
+    n = points.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = box_contains(points[i, 0], points[i, 1], points[i, 2], cx, cy, cz, half_x, half_y, half_z)
+    return out
+
+__all__ = [
+    "HEX_SLOPE",
+    "hex_contains",
+    "rrect_contains",
+    "chamfer_contains",
+    "rounded_rect_contains",
+    "chamfered_rect_contains",
+    "polygon_contains",
+    "nsided_contains",
+    "cylinder_contains",
+    "box_contains",
+    "hex_contains_many",
+    "rrect_contains_many",
+    "chamfer_contains_many",
+    "rounded_rect_contains_many",
+    "chamfered_rect_contains_many",
+    "polygon_contains_many",
+    "nsided_contains_many",
+    "cylinder_contains_many",
+    "box_contains_many",
+]
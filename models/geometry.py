@@ -3,10 +3,59 @@
 包含Section、BaseComponent、SectionComponent等几何相关类
 """
 
-from typing import List, Dict, Optional, Any, Tuple
+import sys
+from itertools import count as _count
+from typing import List, Dict, Optional, Any, Tuple, NamedTuple
 from enum import Enum
 from loguru import logger
 
+from models.shape import Vector3D
+from models.composite import CompositeMaterial
+
+
+# 缺省组件名称计数器（进程内单调递增）
+_COMPONENT_COUNTER = _count()
+
+# parser包的__init__会导入section_parser，而section_parser依赖本模块，
+# 因此ShapeParser只能延迟导入；导入一次后缓存在模块全局变量中
+_ShapeParser = None
+
+
+def _get_shape_parser_cls():
+    """获取ShapeParser类（延迟导入并缓存）"""
+    global _ShapeParser
+    if _ShapeParser is None:
+        from parser.shape_parser import ShapeParser as _ShapeParser
+    return _ShapeParser
+
+
+class BBox(NamedTuple):
+    """轴对齐边界框 (min_x, min_y, min_z, max_x, max_y, max_z)，兼容按下标访问"""
+    min_x: float
+    min_y: float
+    min_z: float
+    max_x: float
+    max_y: float
+    max_z: float
+    
+    @property
+    def length(self) -> float:
+        """X方向尺寸"""
+        return self.max_x - self.min_x
+    
+    @property
+    def width(self) -> float:
+        """Y方向尺寸"""
+        return self.max_y - self.min_y
+    
+    @property
+    def height(self) -> float:
+        """Z方向尺寸"""
+        return self.max_z - self.min_z
+
+
+_ZERO_BBOX = BBox(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
 
 class ComponentType(Enum):
     """组件类型枚举"""
@@ -75,15 +124,24 @@ class Section(BaseComponent):
         child.boolean_operation = operation
         self.children.append(child)
     
-    def get_children_bounding_box_union(self) -> Tuple[float, float, float, float, float, float]:
+    def get_children_bounding_box_union(self) -> BBox:
         """
         计算所有子组件的bounding box并集
         
         Returns:
-            Tuple[float, float, float, float, float, float]: (min_x, min_y, min_z, max_x, max_y, max_z)
+            BBox: (min_x, min_y, min_z, max_x, max_y, max_z)
         """
-        if not self.children:
-            return (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        n = len(self.children)
+        if n == 0:
+            return _ZERO_BBOX
+        
+        # 单个子组件时直接返回其边界框
+        if n == 1:
+            shape = getattr(self.children[0], 'shape', None)
+            if not shape:
+                return _ZERO_BBOX
+            b = shape.get_bounding_box()
+            return BBox(b.min_x, b.min_y, b.min_z, b.max_x, b.max_y, b.max_z)
         
         # 初始化边界框
         min_x = float('inf')
@@ -108,9 +166,9 @@ class Section(BaseComponent):
         
         # 如果没有有效的bounding box，返回默认值
         if min_x == float('inf'):
-            return (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            return _ZERO_BBOX
         
-        return (min_x, min_y, min_z, max_x, max_y, max_z)
+        return BBox(min_x, min_y, min_z, max_x, max_y, max_z)
     
     def get_effective_dimensions(self) -> Tuple[float, float, float]:
         """
@@ -128,11 +186,7 @@ class Section(BaseComponent):
         
         # 否则使用子组件的bounding box并集
         bbox = self.get_children_bounding_box_union()
-        length = bbox[3] - bbox[0]  # max_x - min_x
-        width = bbox[4] - bbox[1]   # max_y - min_y
-        height = bbox[5] - bbox[2]  # max_z - min_z
-        
-        return (length, width, height)
+        return (bbox.length, bbox.width, bbox.height)
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
@@ -147,7 +201,8 @@ class Section(BaseComponent):
         """从JSON数据加载，包含完整的解析逻辑"""
         # 设置基本信息
         self.name = data.get("name", "")
-        self.layer = data.get("layer", "")
+        layer = data.get("layer", "")
+        self.layer = sys.intern(layer) if isinstance(layer, str) else layer
         type_str = data.get("type", "")
         if type_str:
             try:
@@ -176,8 +231,7 @@ class Section(BaseComponent):
         
         # 解析形状
         if "shape" in data:
-            from parser.shape_parser import ShapeParser
-            shape_parser = ShapeParser()
+            shape_parser = _get_shape_parser_cls()()
             try:
                 shape_string = data["shape"]
                 self.shape = shape_parser.parse_shape_string(shape_string)
@@ -208,6 +262,7 @@ class Section(BaseComponent):
                         self.shape.length = effective_dims[0]
                         self.shape.width = effective_dims[1]
                         self.shape.height = effective_dims[2]
+                        self.shape.mark_modified()
                         logger.debug(f"Updated section {self.name} dimensions from children: {effective_dims}")
         
         # 解析材料
@@ -216,7 +271,6 @@ class Section(BaseComponent):
             if isinstance(materials_data, list) and materials_data:
                 # 处理复合材料
                 if len(materials_data) > 1:
-                    from models.composite import CompositeMaterial
                     composite_material = CompositeMaterial()
                     
                     for mat_data in materials_data:
@@ -301,8 +355,7 @@ class SectionComponent(BaseComponent):
         """从JSON数据加载，包含完整的解析逻辑"""
         # 处理name字段，如果缺失则生成默认名称
         if "name" not in data or not data["name"]:
-            import uuid
-            component_name = f"component_{uuid.uuid4().hex[:8]}"
+            component_name = f"component_{next(_COMPONENT_COUNTER):08x}"
             logger.debug(f"Generated default name for component: {component_name}")
         else:
             component_name = data["name"]
@@ -311,17 +364,19 @@ class SectionComponent(BaseComponent):
         
         # 设置模板名称（如果有）
         if "template_name" in data:
-            self.set_template_name(data["template_name"])
+            self.set_template_name(sys.intern(data["template_name"]))
         
         # 设置类型
         if "type" in data:
-            self.set_type(data["type"])
+            component_type = data["type"]
+            if isinstance(component_type, str):
+                component_type = sys.intern(component_type)
+            self.set_type(component_type)
         
         # 设置位置
         if "position" in data:
             pos_data = data["position"]
             if isinstance(pos_data, dict):
-                from models.shape import Vector3D
                 x = float(pos_data.get("x", 0.0))
                 y = float(pos_data.get("y", 0.0))
                 z = float(pos_data.get("z", 0.0))
@@ -399,7 +454,7 @@ class SectionComponent(BaseComponent):
         if "boolean_operation" in data:
             operation = data["boolean_operation"]
             if operation in ["union", "difference", "intersection"]:
-                self.set_boolean_operation(operation)
+                self.set_boolean_operation(sys.intern(operation))
         
         # 设置描述
         if "description" in data:
@@ -434,15 +489,12 @@ class SectionComponent(BaseComponent):
         
         # 解析template字符串，提取template名称和位置
         # 格式: "GeneratedByC4bump_BUMP([-405000.000000,1458000.000000,1208880.000000])"
-        import re
-        match = re.match(r'^([^(]+)\(\[([^\]]+)\]\)', template_string)
-        if not match:
+        template_name, sep, rest = template_string.partition('([')
+        position_str, end_sep, _ = rest.partition('])')
+        if not sep or not end_sep or not template_name or not position_str or '(' in template_name:
             logger.debug(f"Failed to parse template string: {template_string}")
             return None
         
-        template_name = match.group(1)
-        position_str = match.group(2)
-        
         # 解析位置
         try:
             position_values = [float(x.strip()) for x in position_str.split(',')]
@@ -525,8 +577,7 @@ class SectionComponent(BaseComponent):
                         
                         # 解析形状
                         try:
-                            from parser.shape_parser import ShapeParser
-                            shape_parser = ShapeParser()
+                            shape_parser = _get_shape_parser_cls()()
                             parsed_shape = shape_parser.parse_shape_string(shape_with_position)
                             result['shape'] = parsed_shape
                             logger.debug(f"Parsed shape for template {template_name}: {shape_with_position}")
@@ -0,0 +1,72 @@
+"""
+JSON支持
+orjson为可选依赖，未安装时使用标准库json；读写均以UTF-8字节串进行
+"""
+
+import json
+import math
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # orjson为可选依赖，未安装时使用标准库json
+    orjson = None
+
+
+def json_loads(raw: bytes) -> Any:
+    """解析JSON字节串，优先使用orjson"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson不接受NaN/Infinity等非标准写法，交给标准库再试一次
+            pass
+    return json.loads(raw)
+
+
+def _json_default(obj: Any) -> Any:
+    """标准库json遇到NumPy数组/标量时转换为列表/Python标量"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """数据中是否含有NaN或Infinity"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in "fc":
+            return not np.isfinite(obj).all()
+        return obj.dtype == object and any(map(_has_non_finite, obj.ravel().tolist()))
+    if isinstance(obj, np.floating):
+        return not np.isfinite(obj)
+    return False
+
+
+def json_dumps(data: Any) -> bytes:
+    """
+    序列化为UTF-8编码、缩进2格的JSON字节串，优先使用orjson
+    
+    两种实现输出一致：非字符串键转换为字符串，NumPy数组和标量按列表/数值输出。
+    orjson会把NaN/Infinity写为null，因此数据中含有这些值时改用标准库，
+    与原来一样写为NaN/Infinity，保证json_loads读回的数据不变。
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                           | orjson.OPT_NON_STR_KEYS)
+        # 只有输出中出现null时才需要检查是否为orjson改写的NaN/Infinity
+        if b"null" not in raw or not _has_non_finite(data):
+            return raw
+    return json.dumps(data, indent=2, ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
+
+__all__ = ["json_loads", "json_dumps"]
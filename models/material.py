@@ -3,10 +3,48 @@
 包含MaterialInfo、Conductivity、TemperaturePoint等材料相关类
 """
 
-from typing import Dict, List, Optional, Any
+import sys
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+import numpy as np
 from loguru import logger
 
+from models.numba_support import njit, HAS_NUMBA
+
+
+# 每个材料的插值结果缓存容量（按插入顺序淘汰）
+_INTERPOLATION_CACHE_SIZE = 64
+
+
+@njit(cache=True)
+def _lerp1d(xs, ys, t):
+    """标量属性线性插值内核，超出范围时取端点值"""
+    n = xs.shape[0]
+    if t <= xs[0]:
+        return float(ys[0])
+    if t >= xs[n - 1]:
+        return float(ys[n - 1])
+    i = np.searchsorted(xs, t)
+    w = (t - xs[i - 1]) / (xs[i] - xs[i - 1])
+    return float(ys[i - 1] + w * (ys[i] - ys[i - 1]))
+
+
+@njit(cache=True)
+def _lerp3(xs, vs, t):
+    """三方向热导率线性插值内核，vs形状为(N, 3)"""
+    n = xs.shape[0]
+    if t <= xs[0]:
+        return float(vs[0, 0]), float(vs[0, 1]), float(vs[0, 2])
+    if t >= xs[n - 1]:
+        return float(vs[n - 1, 0]), float(vs[n - 1, 1]), float(vs[n - 1, 2])
+    i = np.searchsorted(xs, t)
+    w = (t - xs[i - 1]) / (xs[i] - xs[i - 1])
+    return (float(vs[i - 1, 0] + w * (vs[i, 0] - vs[i - 1, 0])),
+            float(vs[i - 1, 1] + w * (vs[i, 1] - vs[i - 1, 1])),
+            float(vs[i - 1, 2] + w * (vs[i, 2] - vs[i - 1, 2])))
+
 
 @dataclass
 class Conductivity:
@@ -14,6 +52,8 @@ class Conductivity:
     热导率类
     表示材料在x、y、z三个方向的热导率
     """
+    __slots__ = ('x', 'y', 'z', '_iso', '_avg')
+    
     x: float
     y: float
     z: float
@@ -30,6 +70,10 @@ class Conductivity:
         self.x = x
         self.y = y if y is not None else x
         self.z = z if z is not None else x
+        
+        # 构造后视为不可变，预先计算各向同性判断和平均值
+        self._iso = abs(self.x - self.y) < 1e-6 and abs(self.x - self.z) < 1e-6
+        self._avg = (self.x + self.y + self.z) / 3.0
     
     def is_isotropic(self) -> bool:
         """
@@ -38,7 +82,7 @@ class Conductivity:
         Returns:
             bool: 是否为各向同性
         """
-        return abs(self.x - self.y) < 1e-6 and abs(self.x - self.z) < 1e-6
+        return self._iso
     
     def get_average(self) -> float:
         """
@@ -47,7 +91,28 @@ class Conductivity:
         Returns:
             float: 平均热导率
         """
-        return (self.x + self.y + self.z) / 3.0
+        return self._avg
+    
+    @classmethod
+    def _raw(cls, x: float, y: float, z: float) -> 'Conductivity':
+        """
+        直接以三个方向的值创建对象，不经过__init__的缺省值处理，供批量加载使用
+        
+        Args:
+            x: x方向热导率
+            y: y方向热导率
+            z: z方向热导率
+            
+        Returns:
+            Conductivity: 热导率对象
+        """
+        obj = cls.__new__(cls)
+        obj.x = x
+        obj.y = y
+        obj.z = z
+        obj._iso = abs(x - y) < 1e-6 and abs(x - z) < 1e-6
+        obj._avg = (x + y + z) / 3.0
+        return obj
     
     def to_dict(self) -> Dict[str, float]:
         """
@@ -86,6 +151,9 @@ class TemperaturePoint:
     温度点类
     表示在特定温度下的材料属性
     """
+    __slots__ = ('temperature', 'conductivity', 'density', 'heat_capacity',
+                 'electrical_migration', 'solar_reflectance')
+    
     temperature: float  # 温度 (K)
     conductivity: Conductivity  # 热导率
     density: float  # 密度 (kg/m³)
@@ -148,7 +216,23 @@ class MaterialInfo:
         self.material_type = material_type
         self.temperature_map: Dict[float, TemperaturePoint] = {}
         
-        logger.debug(f"Created MaterialInfo: {name}")
+        # 插值结果缓存，键为(属性数组名, 温度)，温度点变化时失效
+        self._cache: 'OrderedDict[Tuple[str, float], Any]' = OrderedDict()
+        
+        # validate()中温度点数据的验证结果，温度点变化时失效
+        self._valid: Optional[bool] = None
+        
+        # 按温度排序的温度点视图缓存，温度点变化时失效
+        self._sorted_points: Optional[List[Tuple[float, TemperaturePoint]]] = None
+        self._sorted_temps: Optional[List[float]] = None
+        
+        # 按温度排序后的SoA数组缓存，首次插值时构建，温度点变化时失效
+        self._temps: Optional[np.ndarray] = None
+        self._conductivity: Optional[np.ndarray] = None  # (N, 3)
+        self._density: Optional[np.ndarray] = None
+        self._heat_capacity: Optional[np.ndarray] = None
+        self._electrical_migration: Optional[np.ndarray] = None
+        self._solar_reflectance: Optional[np.ndarray] = None
     
     def add_temperature_point(self, temperature: float, conductivity_x: float, 
                             conductivity_y: float = None, conductivity_z: float = None,
@@ -178,7 +262,41 @@ class MaterialInfo:
         )
         
         self.temperature_map[temperature] = point
-        logger.debug(f"Added temperature point for {self.name} at {temperature}K")
+        self._invalidate()
+    
+    def _invalidate(self) -> None:
+        """温度点变化后清除插值缓存"""
+        self._sorted_points = None
+        self._sorted_temps = None
+        self._temps = None
+        self._cache.clear()
+        self._valid = None
+    
+    def _get_sorted_points(self) -> List[Tuple[float, TemperaturePoint]]:
+        """
+        获取按温度排序的(温度, 温度点)列表，结果缓存到温度点变化为止
+        
+        Returns:
+            List[Tuple[float, TemperaturePoint]]: 排序后的温度点列表
+        """
+        if self._sorted_points is None:
+            self._sorted_points = sorted(self.temperature_map.items(), key=lambda x: x[0])
+            self._sorted_temps = [t for t, _ in self._sorted_points]
+        return self._sorted_points
+    
+    def _finalize(self) -> None:
+        """
+        按温度排序一次，构建插值使用的SoA数组
+        """
+        points = [p for _, p in self._get_sorted_points()]
+        self._temps = np.array([p.temperature for p in points], dtype=np.float64)
+        self._conductivity = np.array(
+            [(p.conductivity.x, p.conductivity.y, p.conductivity.z) for p in points],
+            dtype=np.float64).reshape(-1, 3)
+        self._density = np.array([p.density for p in points], dtype=np.float64)
+        self._heat_capacity = np.array([p.heat_capacity for p in points], dtype=np.float64)
+        self._electrical_migration = np.array([p.electrical_migration for p in points], dtype=np.float64)
+        self._solar_reflectance = np.array([p.solar_reflectance for p in points], dtype=np.float64)
     
     def get_conductivity(self, temperature: float = 293.15) -> Conductivity:
         """
@@ -196,10 +314,22 @@ class MaterialInfo:
         
         # 如果只有一个温度点，直接返回
         if len(self.temperature_map) == 1:
-            return list(self.temperature_map.values())[0].conductivity
+            return next(iter(self.temperature_map.values())).conductivity
         
         # 线性插值
-        return self._interpolate_property(temperature, lambda p: p.conductivity)
+        return Conductivity(*self._interpolate_conductivity_raw(temperature))
+    
+    def _interpolate_conductivity_raw(self, temperature: float) -> Tuple[float, float, float]:
+        """
+        插值计算热导率，返回(x, y, z)元组而不创建Conductivity对象
+        
+        Args:
+            temperature: 目标温度 (K)
+            
+        Returns:
+            Tuple[float, float, float]: x、y、z方向热导率
+        """
+        return self._lookup('_conductivity', temperature)
     
     def get_density(self, temperature: float = 293.15) -> float:
         """
@@ -211,7 +341,9 @@ class MaterialInfo:
         Returns:
             float: 密度
         """
-        return self._interpolate_property(temperature, lambda p: p.density)
+        if not self.temperature_map:
+            return None
+        return self._lookup('_density', temperature)
     
     def get_heat_capacity(self, temperature: float = 293.15) -> float:
         """
@@ -223,60 +355,191 @@ class MaterialInfo:
         Returns:
             float: 比热容
         """
-        return self._interpolate_property(temperature, lambda p: p.heat_capacity)
+        if not self.temperature_map:
+            return None
+        return self._lookup('_heat_capacity', temperature)
     
-    def _interpolate_property(self, temperature: float, property_getter) -> Any:
+    def get_electrical_migration(self, temperature: float = 293.15) -> float:
         """
-        线性插值算法
+        获取指定温度下的电迁移率
         
         Args:
-            temperature: 目标温度
-            property_getter: 属性获取函数
+            temperature: 目标温度 (K)
+            
+        Returns:
+            float: 电迁移率
+        """
+        if not self.temperature_map:
+            return None
+        return self._lookup('_electrical_migration', temperature)
+    
+    def get_solar_reflectance(self, temperature: float = 293.15) -> float:
+        """
+        获取指定温度下的太阳反射率
+        
+        Args:
+            temperature: 目标温度 (K)
+            
+        Returns:
+            float: 太阳反射率
+        """
+        if not self.temperature_map:
+            return None
+        return self._lookup('_solar_reflectance', temperature)
+    
+    def _lookup(self, values_attr: str, temperature: float) -> Any:
+        """
+        带缓存的属性插值，同一温度的重复查询直接返回缓存结果
+        
+        Args:
+            values_attr: SoA属性数组的属性名，如'_density'
+            temperature: 目标温度 (K)
             
         Returns:
             Any: 插值结果
         """
+        key = (values_attr, temperature)
+        cache = self._cache
+        value = cache.get(key)
+        if value is None:
+            if self._temps is None:
+                self._finalize()
+            value = self._interpolate_property(temperature, getattr(self, values_attr))
+            cache[key] = value
+            if len(cache) > _INTERPOLATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return value
+    
+    def _interpolate_property(self, temperature: float, values: np.ndarray) -> Any:
+        """
+        线性插值算法（需先调用_finalize构建SoA数组）
+        
+        Args:
+            temperature: 目标温度
+            values: 与温度数组对齐的属性数组，形状为(N,)或(N, 3)
+            
+        Returns:
+            Any: 标量属性返回float，热导率返回(x, y, z)元组；超出温度范围时取端点值
+        """
+        if HAS_NUMBA:
+            if values.ndim == 2:
+                return _lerp3(self._temps, values, float(temperature))
+            return _lerp1d(self._temps, values, float(temperature))
+        
+        # 无numba时在缓存的温度列表上用C实现的bisect定位区间
+        temps = self._sorted_temps
+        if temperature <= temps[0]:
+            result = values[0]
+        elif temperature >= temps[-1]:
+            result = values[-1]
+        else:
+            i = bisect_left(temps, temperature)
+            t0 = temps[i - 1]
+            weight = (temperature - t0) / (temps[i] - t0)
+            a = values[i - 1]
+            result = a + weight * (values[i] - a)
+        
+        if values.ndim == 2:
+            return tuple(result.tolist())
+        return float(result)
+    
+    def get_conductivity_batch(self, temperatures: np.ndarray) -> np.ndarray:
+        """
+        批量获取多个温度下的热导率
+        
+        Args:
+            temperatures: 目标温度数组 (K)
+            
+        Returns:
+            np.ndarray: 形状为(N, 3)的热导率数组，列依次为x、y、z
+        """
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        if not self.temperature_map:
+            logger.warning(f"No temperature data for material {self.name}")
+            return np.zeros(temperatures.shape + (3,), dtype=np.float64)
+        if self._temps is None:
+            self._finalize()
+        return self._interpolate_batch(temperatures, self._conductivity)
+    
+    def get_density_batch(self, temperatures: np.ndarray) -> Optional[np.ndarray]:
+        """
+        批量获取多个温度下的密度
+        
+        Args:
+            temperatures: 目标温度数组 (K)
+            
+        Returns:
+            Optional[np.ndarray]: 密度数组，无温度数据时返回None
+        """
         if not self.temperature_map:
             return None
+        if self._temps is None:
+            self._finalize()
+        return self._interpolate_batch(np.asarray(temperatures, dtype=np.float64), self._density)
+    
+    def get_heat_capacity_batch(self, temperatures: np.ndarray) -> Optional[np.ndarray]:
+        """
+        批量获取多个温度下的比热容
         
-        # 按温度排序
-        sorted_points = sorted(self.temperature_map.items(), key=lambda x: x[0])
+        Args:
+            temperatures: 目标温度数组 (K)
+            
+        Returns:
+            Optional[np.ndarray]: 比热容数组，无温度数据时返回None
+        """
+        if not self.temperature_map:
+            return None
+        if self._temps is None:
+            self._finalize()
+        return self._interpolate_batch(np.asarray(temperatures, dtype=np.float64), self._heat_capacity)
+    
+    def get_electrical_migration_batch(self, temperatures: np.ndarray) -> Optional[np.ndarray]:
+        """
+        批量获取多个温度下的电迁移率
         
-        # 边界检查
-        min_temp = sorted_points[0][0]
-        max_temp = sorted_points[-1][0]
+        Args:
+            temperatures: 目标温度数组 (K)
+            
+        Returns:
+            Optional[np.ndarray]: 电迁移率数组，无温度数据时返回None
+        """
+        if not self.temperature_map:
+            return None
+        if self._temps is None:
+            self._finalize()
+        return self._interpolate_batch(np.asarray(temperatures, dtype=np.float64), self._electrical_migration)
+    
+    def get_solar_reflectance_batch(self, temperatures: np.ndarray) -> Optional[np.ndarray]:
+        """
+        批量获取多个温度下的太阳反射率
         
-        if temperature <= min_temp:
-            return property_getter(sorted_points[0][1])
-        elif temperature >= max_temp:
-            return property_getter(sorted_points[-1][1])
+        Args:
+            temperatures: 目标温度数组 (K)
+            
+        Returns:
+            Optional[np.ndarray]: 太阳反射率数组，无温度数据时返回None
+        """
+        if not self.temperature_map:
+            return None
+        if self._temps is None:
+            self._finalize()
+        return self._interpolate_batch(np.asarray(temperatures, dtype=np.float64), self._solar_reflectance)
+    
+    def _interpolate_batch(self, temperatures: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        向量化线性插值，由numpy.interp完成区间查找与端点截断
         
-        # 查找相邻温度点
-        for i in range(len(sorted_points) - 1):
-            temp1, point1 = sorted_points[i]
-            temp2, point2 = sorted_points[i + 1]
+        Args:
+            temperatures: 目标温度数组
+            values: 与温度数组对齐的属性数组，形状为(N,)或(N, 3)
             
-            if temp1 <= temperature <= temp2:
-                # 执行线性插值
-                value1 = property_getter(point1)
-                value2 = property_getter(point2)
-                
-                # 计算插值权重
-                weight = (temperature - temp1) / (temp2 - temp1)
-                
-                # 线性插值
-                if isinstance(value1, Conductivity):
-                    # 热导率插值
-                    interpolated_x = value1.x + weight * (value2.x - value1.x)
-                    interpolated_y = value1.y + weight * (value2.y - value1.y)
-                    interpolated_z = value1.z + weight * (value2.z - value1.z)
-                    return Conductivity(interpolated_x, interpolated_y, interpolated_z)
-                else:
-                    # 标量插值
-                    return value1 + weight * (value2 - value1)
-        
-        # 如果没找到合适的区间，返回最近的值
-        return property_getter(sorted_points[-1][1])
+        Returns:
+            np.ndarray: 插值结果，超出温度范围时取端点值
+        """
+        if values.ndim > 1:
+            return np.stack([np.interp(temperatures, self._temps, values[:, k])
+                             for k in range(values.shape[1])], axis=-1)
+        return np.interp(temperatures, self._temps, values)
     
     def is_temperature_dependent(self) -> bool:
         """
@@ -297,8 +560,8 @@ class MaterialInfo:
         if not self.temperature_map:
             return (0.0, 0.0)
         
-        temperatures = list(self.temperature_map.keys())
-        return (min(temperatures), max(temperatures))
+        sorted_points = self._get_sorted_points()
+        return (sorted_points[0][0], sorted_points[-1][0])
     
     def validate(self) -> bool:
         """
@@ -311,16 +574,31 @@ class MaterialInfo:
             logger.error("Material name is empty")
             return False
         
+        # 温度点数据的验证结果缓存到温度点变化为止
+        if self._valid is not None:
+            return self._valid
+        
+        self._valid = self._validate_temperature_points()
+        return self._valid
+    
+    def _validate_temperature_points(self) -> bool:
+        """
+        验证温度点数据
+        
+        Returns:
+            bool: 验证是否通过
+        """
         if not self.temperature_map:
             logger.error(f"Material {self.name} has no temperature data")
             return False
         
-        # 验证温度点数据
+        # 直接遍历字典键检查温度，避免逐项解包
+        negative = next((temp for temp in self.temperature_map if temp < 0), None)
+        if negative is not None:
+            logger.error(f"Invalid temperature: {negative}K")
+            return False
+        
         for temp, point in self.temperature_map.items():
-            if temp < 0:
-                logger.error(f"Invalid temperature: {temp}K")
-                return False
-            
             if point.density <= 0:
                 logger.warning(f"Material {self.name} has non-positive density at {temp}K")
             
@@ -340,7 +618,12 @@ class MaterialInfo:
         return {
             "name": self.name,
             "type": self.material_type,
-            "temperature_points": [point.to_dict() for point in self.temperature_map.values()]
+            # 与BTD输入格式一致的扁平数值列表，from_dict可直接读回
+            "t_kx_ky_kz_rho_hc_em_ref_properties": [
+                [p.temperature, p.conductivity.x, p.conductivity.y, p.conductivity.z,
+                 p.density, p.heat_capacity, p.electrical_migration, p.solar_reflectance]
+                for p in self.temperature_map.values()
+            ]
         }
     
     @classmethod
@@ -354,9 +637,10 @@ class MaterialInfo:
         Returns:
             MaterialInfo: 材料信息对象
         """
+        material_type = data.get("type", "thermal")
         material = cls(
             name=data["name"],
-            material_type=data.get("type", "thermal")
+            material_type=sys.intern(material_type) if isinstance(material_type, str) else material_type
         )
         
         # 检查是否是BTD格式的数据
@@ -376,11 +660,10 @@ class MaterialInfo:
                         electrical_migration = float(prop_data[6]) if len(prop_data) > 6 else 0.0
                         solar_reflectance = float(prop_data[7]) if len(prop_data) > 7 else 0.0
                         
-                        material.add_temperature_point(
+                        # 三个方向均已给出，跳过Conductivity.__init__的缺省值处理
+                        material.temperature_map[temperature] = TemperaturePoint(
                             temperature=temperature,
-                            conductivity_x=kx,
-                            conductivity_y=ky,
-                            conductivity_z=kz,
+                            conductivity=Conductivity._raw(kx, ky, kz),
                             density=density,
                             heat_capacity=heat_capacity,
                             electrical_migration=electrical_migration,
@@ -392,6 +675,7 @@ class MaterialInfo:
             for point_data in temperature_points_data:
                 point = TemperaturePoint.from_dict(point_data)
                 material.temperature_map[point.temperature] = point
+        material._invalidate()
         
         return material
 
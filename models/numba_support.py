@@ -0,0 +1,19 @@
+"""
+numba支持
+numba为可选依赖，未安装时njit退化为不做任何处理的装饰器，数值内核以普通Python函数运行
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba.njit的替代实现，直接返回原函数"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit", "HAS_NUMBA"]
@@ -10,6 +10,8 @@ from loguru import logger
 class PackagePara:
     """封装参数类，对应C++的PackagePara"""
     
+    __slots__ = ('parameters', '_mutated')
+    
     def __init__(self, json_data: Optional[Dict[str, Any]] = None):
         """
         初始化PackagePara
@@ -20,6 +22,8 @@ class PackagePara:
         # 这里需要根据C++的PackagePara类添加具体的属性
         # 由于没有看到具体的C++代码，我先创建一个基础结构
         self.parameters: Dict[str, Any] = {}
+        # parameters是否已与加载时传入的字典脱离（写时复制）
+        self._mutated: bool = True
         
         # 从JSON加载数据
         if json_data:
@@ -28,17 +32,25 @@ class PackagePara:
     def from_json(self, json_data: Dict[str, Any]) -> None:
         """从JSON数据加载"""
         try:
-            self.parameters = json_data.copy()
-            logger.debug("Loaded PackagePara from JSON")
+            # 仅保留引用，首次修改时再复制
+            self.parameters = json_data
+            self._mutated = False
             
         except Exception as e:
             logger.error(f"Failed to load PackagePara from JSON: {e}")
             raise
     
+    def set(self, key: str, value: Any) -> None:
+        """设置参数，首次修改前复制加载时引用的字典"""
+        if not self._mutated:
+            self.parameters = self.parameters.copy()
+            self._mutated = True
+        self.parameters[key] = value
+    
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
         try:
-            return self.parameters.copy()
+            return dict(self.parameters)
             
         except Exception as e:
             logger.error(f"Failed to convert PackagePara to JSON: {e}")
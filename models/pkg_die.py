@@ -3,7 +3,8 @@ PkgDie模型类
 对应C++的PkgDie类，管理封装芯片组件
 """
 
-from typing import List, Optional, Dict, Any
+import sys
+from typing import List, Optional, Dict, Any, Tuple
 from loguru import logger
 
 from models.geometry import Section, ComponentType
@@ -12,9 +13,25 @@ from .stacked_die import StackedDieSection
 from .package_para import PackagePara
 
 
+def _get_alias(d: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+    """按顺序返回第一个存在的键对应的值，用于兼容多种字段命名"""
+    for key in keys:
+        if key in d:
+            return d[key]
+    return default
+
+
+def _intern(value: Any) -> Any:
+    """驻留字符串，多个组件间重复的取值共享同一对象"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class PkgComponent(StackedDieSection):
     """封装芯片组件类，对应C++的PkgComponent，继承自StackedDieSection"""
 
+    # 任一组件的模型名称变化时递增，PkgDie据此判断名称索引是否过期
+    _name_version: int = 0
+
     def __init__(self, json_data: Optional[Dict[str, Any]] = None):
         """
         初始化PkgComponent
@@ -59,6 +76,17 @@ class PkgComponent(StackedDieSection):
         """设置引用标识"""
         self.ref_des = ref_des
 
+    @property
+    def mdl_name(self) -> str:
+        """模型名称"""
+        return self._mdl_name
+
+    @mdl_name.setter
+    def mdl_name(self, mdl_name: str) -> None:
+        """设置模型名称，并使各PkgDie的名称索引失效"""
+        self._mdl_name = mdl_name
+        PkgComponent._name_version += 1
+
     def get_mdl_name(self) -> str:
         """获取模型名称"""
         return self.mdl_name
@@ -122,14 +150,11 @@ class PkgComponent(StackedDieSection):
 
             # 然后加载PkgComponent特有的属性
             # 支持BTD格式的字段名
-            self.ref_des = json_data.get(
-                "ref_des", json_data.get("refDes", ""))
-            self.mdl_name = json_data.get("name", json_data.get("mdlName", ""))
-            self.attach_layer = json_data.get(
-                "attach_layer", json_data.get("attachLayer", ""))
-            self.die = json_data.get("die", "")
-            self.has_stacked_dies = json_data.get(
-                "has_stacked_dies", json_data.get("hasStackedDies", False))
+            self.ref_des = _intern(_get_alias(json_data, "ref_des", "refDes", default=""))
+            self.mdl_name = _intern(_get_alias(json_data, "name", "mdlName", default=""))
+            self.attach_layer = _intern(_get_alias(json_data, "attach_layer", "attachLayer", default=""))
+            self.die = _intern(json_data.get("die", ""))
+            self.has_stacked_dies = _get_alias(json_data, "has_stacked_dies", "hasStackedDies", default=False)
 
             # 处理材料信息
             material_name = json_data.get("material", "")
@@ -141,45 +166,30 @@ class PkgComponent(StackedDieSection):
 
             # 加载堆叠芯片
             if "dies" in json_data:
-                stacked_dies_data = json_data.get(
-                    "dies", json_data.get("dies", []))
+                stacked_dies_data = json_data["dies"]
                 for die_data in stacked_dies_data:
                     stacked_die = StackedDieSection(die_data)
                     self.stacked_dies.append(stacked_die)
 
             # 加载封装参数
             if "package_parameters" in json_data or "packagePara" in json_data:
-                package_para_data = json_data.get(
-                    "package_parameters", json_data.get("packagePara", {}))
+                package_para_data = _get_alias(json_data, "package_parameters", "packagePara", default={})
                 self.package_para.from_json(package_para_data)
 
-            logger.debug(f"Loaded PkgComponent: {self.mdl_name}")
-
         except Exception as e:
             logger.error(f"Failed to load PkgComponent from JSON: {e}")
             raise
 
-    def to_json(self) -> Dict[str, Any]:
-        """转换为JSON数据"""
-        try:
-            # 首先获取父类的JSON数据
-            data = super().to_json()
-
-            # 然后添加PkgComponent特有的属性
-            data.update({
-                "refDes": self.ref_des,
-                "mdlName": self.mdl_name,
-                "attachLayer": self.attach_layer,
-                "die": self.die,
-                "hasStackedDies": self.has_stacked_dies,
-                "stackedDies": [die.to_json() for die in self.stacked_dies],
-                "packagePara": self.package_para.to_json()
-            })
-            return data
-
-        except Exception as e:
-            logger.error(f"Failed to convert PkgComponent to JSON: {e}")
-            raise
+    def _to_json_fields(self, data: Dict[str, Any]) -> None:
+        """在堆叠芯片字段之后写入PkgComponent特有属性"""
+        super()._to_json_fields(data)
+        data["refDes"] = self.ref_des
+        data["mdlName"] = self.mdl_name
+        data["attachLayer"] = self.attach_layer
+        data["die"] = self.die
+        data["hasStackedDies"] = self.has_stacked_dies
+        data["stackedDies"] = [die.to_json() for die in self.stacked_dies]
+        data["packagePara"] = self.package_para.to_json()
 
 
 class PkgDie:
@@ -187,28 +197,45 @@ class PkgDie:
 
     def __init__(self):
         """初始化PkgDie"""
-        self.components: List[PkgComponent] = []
+        self._components: List[PkgComponent] = []
+        self._components_view: Optional[Tuple[PkgComponent, ...]] = ()
+        # 按模型名称索引组件，同名时保留最先加入的组件；
+        # 为None或组件名称变化后（见PkgComponent._name_version）在下次查找时重建
+        self._by_name: Optional[Dict[str, PkgComponent]] = {}
+        self._by_name_version: int = PkgComponent._name_version
         logger.debug("PkgDie initialized")
 
+    @property
+    def components(self) -> Tuple[PkgComponent, ...]:
+        """所有组件（只读），增删组件需通过add_component/set_components"""
+        if self._components_view is None:
+            self._components_view = tuple(self._components)
+        return self._components_view
+
     def add_component(self, component: PkgComponent) -> None:
         """添加组件"""
-        self.components.append(component)
-        logger.debug(f"Added component: {component.get_mdl_name()}")
+        self._components.append(component)
+        self._components_view = None
+        if self._by_name is not None:
+            self._by_name.setdefault(component.get_mdl_name(), component)
 
     def set_components(self, components: List[PkgComponent]) -> None:
-        """设置组件列表"""
-        self.components = components
+        """设置组件列表（复制传入的列表，之后对原列表的修改不会反映到PkgDie）"""
+        self._components = list(components)
+        self._components_view = None
+        self._by_name = None
         logger.debug(f"Set {len(components)} components")
 
     def get_component(self, component_name: str) -> Optional[PkgComponent]:
-        """根据名称获取组件"""
-        for component in self.components:
-            if component.get_mdl_name() == component_name:
-                return component
-        return None
-
-    def get_components(self) -> List[PkgComponent]:
-        """获取所有组件"""
+        """根据名称获取组件，同名时返回最先加入的组件"""
+        if self._by_name is None or self._by_name_version != PkgComponent._name_version:
+            self._by_name = {component.get_mdl_name(): component
+                             for component in reversed(self._components)}
+            self._by_name_version = PkgComponent._name_version
+        return self._by_name.get(component_name)
+
+    def get_components(self) -> Tuple[PkgComponent, ...]:
+        """获取所有组件（只读）"""
         return self.components
 
     def from_json(self, json_data: Dict[str, Any]) -> None:
@@ -221,7 +248,7 @@ class PkgDie:
                     self.add_component(component)
 
             logger.debug(
-                f"Loaded PkgDie with {len(self.parts)} parts")
+                f"Loaded PkgDie with {len(self.components)} components")
 
         except Exception as e:
             logger.error(f"Failed to load PkgDie from JSON: {e}")
@@ -3,13 +3,232 @@ PowerMap模型类
 对应C++的PowerMap类，管理功率映射
 """
 
-from typing import List, Dict, Any, Optional
+import hashlib
+import math
+import os
+import tempfile
+from operator import attrgetter, methodcaller
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence, Union
+import numpy as np
 from loguru import logger
 
+from models.json_support import json_loads, json_dumps
+from models.numba_support import njit
+
+_to_json = methodcaller("to_json")
+
+
+def _as_grid(data: Any) -> np.ndarray:
+    """将嵌套列表转换为连续存储的二维float64数组，空数据返回(0, 0)数组"""
+    grid = np.asarray(data if data is not None else [], dtype=np.float64)
+    if grid.size == 0:
+        return np.zeros((0, 0), dtype=np.float64)
+    return grid.reshape(grid.shape[0], -1)
+
+
+def _uniform_spacing(coor: np.ndarray):
+    """
+    检测网格线是否等间距
+    
+    Returns:
+        (起点, 间距倒数)；非等间距时返回(0.0, 0.0)
+    """
+    if len(coor) < 2:
+        return 0.0, 0.0
+    step = float(coor[1] - coor[0])
+    if step <= 0.0 or not np.allclose(np.diff(coor), step, rtol=1e-6, atol=0.0):
+        return 0.0, 0.0
+    return float(coor[0]), 1.0 / step
+
+
+@njit(cache=True)
+def _locate(coor, v, origin, inv, right):
+    """
+    等价于np.searchsorted(coor, v, side='right' if right else 'left')
+    
+    等间距网格(inv > 0)按算术直接定位后最多修正一两步，为O(1)；否则二分查找。
+    """
+    if inv <= 0.0:
+        if right:
+            return np.searchsorted(coor, v, side='right')
+        return np.searchsorted(coor, v, side='left')
+    
+    n = coor.shape[0]
+    t = (v - origin) * inv
+    if not t > -1.0:
+        k = 0
+    elif t >= n:
+        k = n
+    else:
+        k = int(math.floor(t)) + 1
+    # 修正浮点舍入带来的偏差，保证与searchsorted结果一致
+    if right:
+        while k > 0 and coor[k - 1] > v:
+            k -= 1
+        while k < n and coor[k] <= v:
+            k += 1
+    else:
+        while k > 0 and coor[k - 1] >= v:
+            k -= 1
+        while k < n and coor[k] < v:
+            k += 1
+    return k
+
+
+@njit(cache=True)
+def _integrate_rect(xcoor, ycoor, power, llx, lly, urx, ury, x0, x_inv, y0, y_inv):
+    """
+    矩形范围内按相交面积加权的功率积分
+    
+    Returns:
+        (积分值, 矩形与网格的相交面积)
+    """
+    ny, nx = power.shape
+    ix0 = max(_locate(xcoor, llx, x0, x_inv, True) - 1, 0)
+    ix1 = min(_locate(xcoor, urx, x0, x_inv, False), nx)
+    iy0 = max(_locate(ycoor, lly, y0, y_inv, True) - 1, 0)
+    iy1 = min(_locate(ycoor, ury, y0, y_inv, False), ny)
+    
+    acc = 0.0
+    area = 0.0
+    if ix0 >= ix1 or iy0 >= iy1:
+        return acc, area
+    
+    # 边界网格只计入与矩形相交的部分
+    dx = np.empty(ix1 - ix0)
+    for ix in range(ix0, ix1):
+        dx[ix - ix0] = max(min(xcoor[ix + 1], urx) - max(xcoor[ix], llx), 0.0)
+    for iy in range(iy0, iy1):
+        dy = min(ycoor[iy + 1], ury) - max(ycoor[iy], lly)
+        if dy <= 0.0:
+            continue
+        for ix in range(ix0, ix1):
+            w = dx[ix - ix0] * dy
+            acc += power[iy, ix] * w
+            area += w
+    return acc, area
+
+
+def _is_ascending(coor: np.ndarray) -> bool:
+    """坐标是否严格递增"""
+    return bool(np.all(coor[1:] > coor[:-1]))
+
+
+def _check_grid_edges(xcoor: np.ndarray, ycoor: np.ndarray, shape: tuple,
+                      ascending: bool) -> None:
+    """
+    检查网格线坐标与功率网格是否匹配
+    
+    Args:
+        xcoor: X方向网格线坐标，长度应为nx+1
+        ycoor: Y方向网格线坐标，长度应为ny+1
+        shape: 功率网格形状(ny, nx)
+        ascending: 坐标是否严格递增（由调用方预先检测）
+        
+    Raises:
+        ValueError: 坐标长度与网格形状不符或坐标不严格递增
+    """
+    ny, nx = shape
+    if len(xcoor) != nx + 1 or len(ycoor) != ny + 1:
+        raise ValueError(f"Power map grid edges do not match power shape ({ny}, {nx}): "
+                         f"expected {nx + 1} xcoor and {ny + 1} ycoor, "
+                         f"got {len(xcoor)} and {len(ycoor)}")
+    if not ascending:
+        raise ValueError("Power map xcoor and ycoor must be strictly ascending")
+
+
+# PowerMap中的网格数组：JSON键 -> 属性名
+_GRID_FIELDS = (
+    ("xcoor", "xcoor"),
+    ("ycoor", "ycoor"),
+    ("power", "power"),
+    ("volumetricPower", "volumetric_power"),
+    ("metalDensity", "metal_density"),
+)
+
+
+def _npz_cache_path(file_path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None) -> Path:
+    """
+    功率映射文件对应的二进制缓存路径
+    
+    未指定缓存目录时位于源文件旁（源文件名后追加.npz）；指定时位于该目录下，
+    文件名中加入源文件绝对路径的摘要，避免不同目录的同名文件相互覆盖。
+    """
+    file_path = Path(file_path)
+    if cache_dir is None:
+        return file_path.with_name(file_path.name + ".npz")
+    digest = hashlib.sha1(str(file_path.resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(cache_dir) / f"{file_path.name}.{digest}.npz"
+
+
+def _load_npz_cache(file_path: Path, cache_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    从二进制缓存恢复JSON数据，网格以NumPy数组形式填回原位置
+    
+    Returns:
+        缓存不存在、早于源文件或无法读取时返回None
+    """
+    try:
+        if not cache_path.is_file() or cache_path.stat().st_mtime < file_path.stat().st_mtime:
+            return None
+        with np.load(cache_path, allow_pickle=False) as cache:
+            json_data = json_loads(cache["__meta__"].tobytes())
+            for i, layer_data in enumerate(json_data.get("layers", [])):
+                powermap_data = layer_data.get("powermap")
+                if powermap_data is None:
+                    continue
+                for key, _ in _GRID_FIELDS:
+                    powermap_data[key] = cache[f"layer{i}_{key}"]
+        return json_data
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable power map cache {cache_path}: {e}")
+        return None
+
+
+def _save_npz_cache(cache_path: Path, json_data: Dict[str, Any], dspm: 'DieStackPowerMap') -> None:
+    """将网格数组与其余JSON数据分别写入二进制缓存，写入失败只记录警告"""
+    grid_keys = {key for key, _ in _GRID_FIELDS}
+    arrays = {}
+    meta = dict(json_data)
+    meta_layers = []
+    for i, (layer_data, layer) in enumerate(zip(json_data.get("layers", []), dspm.layers)):
+        if "powermap" in layer_data:
+            layer_data = dict(layer_data)
+            layer_data["powermap"] = {k: v for k, v in layer_data["powermap"].items()
+                                      if k not in grid_keys}
+            for key, attr in _GRID_FIELDS:
+                arrays[f"layer{i}_{key}"] = getattr(layer.powermap, attr)
+        meta_layers.append(layer_data)
+    if "layers" in meta:
+        meta["layers"] = meta_layers
+    arrays["__meta__"] = np.frombuffer(json_dumps(meta), dtype=np.uint8)
+    
+    # 先写入同目录下的临时文件再原子替换，并发读取者不会看到写了一半的缓存
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=cache_path.parent, prefix=cache_path.name + ".",
+                                         suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            np.savez(f, **arrays)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write power map cache {cache_path}: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
 
 class Area:
     """区域类，对应C++的Area"""
     
+    # JSON键与属性名一一对应，to_json按此顺序输出
+    _JSON_KEYS = ("areaName", "llx", "lly", "lrx", "lry", "sLayer", "eLayer",
+                  "metalFactor", "dyPwrFactor", "lkgPwrFactor")
+    _ATTRS = ("area_name", "llx", "lly", "lrx", "lry", "s_layer", "e_layer",
+              "metal_factor", "dy_pwr_factor", "lkg_pwr_factor")
+    _get_attrs = attrgetter(*_ATTRS)
+    
     def __init__(self, json_data: Optional[Dict[str, Any]] = None):
         """
         初始化Area
@@ -34,44 +253,81 @@ class Area:
     
     def from_json(self, json_data: Dict[str, Any]) -> None:
         """从JSON数据加载"""
-        try:
-            self.area_name = json_data.get("areaName", "")
-            self.llx = json_data.get("llx", 0.0)
-            self.lly = json_data.get("lly", 0.0)
-            self.lrx = json_data.get("lrx", 0.0)
-            self.lry = json_data.get("lry", 0.0)
-            self.s_layer = json_data.get("sLayer", "")
-            self.e_layer = json_data.get("eLayer", "")
-            self.metal_factor = json_data.get("metalFactor", 0.0)
-            self.dy_pwr_factor = json_data.get("dyPwrFactor", 0.0)
-            self.lkg_pwr_factor = json_data.get("lkgPwrFactor", 0.0)
-            
-            logger.debug(f"Loaded Area: {self.area_name}")
-            
-        except Exception as e:
-            logger.error(f"Failed to load Area from JSON: {e}")
-            raise
+        self.area_name = json_data.get("areaName", "")
+        self.llx = json_data.get("llx", 0.0)
+        self.lly = json_data.get("lly", 0.0)
+        self.lrx = json_data.get("lrx", 0.0)
+        self.lry = json_data.get("lry", 0.0)
+        self.s_layer = json_data.get("sLayer", "")
+        self.e_layer = json_data.get("eLayer", "")
+        self.metal_factor = json_data.get("metalFactor", 0.0)
+        self.dy_pwr_factor = json_data.get("dyPwrFactor", 0.0)
+        self.lkg_pwr_factor = json_data.get("lkgPwrFactor", 0.0)
     
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
-        try:
-            data = {
-                "areaName": self.area_name,
-                "llx": self.llx,
-                "lly": self.lly,
-                "lrx": self.lrx,
-                "lry": self.lry,
-                "sLayer": self.s_layer,
-                "eLayer": self.e_layer,
-                "metalFactor": self.metal_factor,
-                "dyPwrFactor": self.dy_pwr_factor,
-                "lkgPwrFactor": self.lkg_pwr_factor
-            }
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to convert Area to JSON: {e}")
-            raise
+        return dict(zip(self._JSON_KEYS, self._get_attrs(self)))
+    
+    @classmethod
+    def _from_row(cls, *values: Any) -> 'Area':
+        """按_ATTRS顺序给出的字段值直接构造，不经过from_json"""
+        area = cls.__new__(cls)
+        for attr, value in zip(cls._ATTRS, values):
+            setattr(area, attr, value)
+        return area
+
+
+# DieStackPowerMap中区域的列式存储：(列属性名, 默认值)，顺序与Area._JSON_KEYS/_ATTRS一致
+_AREA_COLUMNS = (
+    ("area_names", ""),
+    ("areas_llx", 0.0),
+    ("areas_lly", 0.0),
+    ("areas_lrx", 0.0),
+    ("areas_lry", 0.0),
+    ("s_layers", ""),
+    ("e_layers", ""),
+    ("metal_factors", 0.0),
+    ("dy_factors", 0.0),
+    ("lkg_factors", 0.0),
+)
+
+
+def _area_column(values, default: Any, count: int) -> np.ndarray:
+    """将一列区域字段转换为数组：数值列为float64，字符串列为object"""
+    if isinstance(default, float):
+        return np.fromiter(values, dtype=np.float64, count=count)
+    column = np.empty(count, dtype=object)
+    column[:] = list(values)
+    return column
+
+
+class _AreaView(Sequence):
+    """
+    DieStackPowerMap.areas的只读视图
+    
+    区域数据保存在列数组中，按下标访问时才构造对应的Area对象；
+    修改返回的Area不会写回，需通过DieStackPowerMap.add_area/set_area
+    或整体赋值DieStackPowerMap.areas来修改区域。
+    """
+    
+    __slots__ = ("_owner",)
+    
+    def __init__(self, owner: 'DieStackPowerMap'):
+        self._owner = owner
+    
+    def __len__(self) -> int:
+        return len(self._owner.area_names)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        owner = self._owner
+        return Area._from_row(*(getattr(owner, column)[index] if isinstance(default, str)
+                                else float(getattr(owner, column)[index])
+                                for column, default in _AREA_COLUMNS))
+    
+    def __repr__(self) -> str:
+        return f"<{len(self)} areas of {self._owner.die_name!r}>"
 
 
 class PowerMap:
@@ -84,27 +340,98 @@ class PowerMap:
         Args:
             json_data: JSON数据字典
         """
-        self.xcoor: List[float] = []  # X坐标数组
-        self.ycoor: List[float] = []  # Y坐标数组
-        self.power: List[List[float]] = []  # 功率数组
-        self.volumetric_power: List[List[float]] = []  # 体积功率数组
-        self.metal_density: List[List[float]] = []  # 金属密度数组
+        # 网格线坐标，长度分别为nx+1、ny+1；网格数据按行(y)存储，形状为(ny, nx)
+        self.xcoor: np.ndarray = np.zeros(0, dtype=np.float64)  # X坐标数组
+        self.ycoor: np.ndarray = np.zeros(0, dtype=np.float64)  # Y坐标数组
+        self.power: np.ndarray = np.zeros((0, 0), dtype=np.float64)  # 功率数组
+        self.volumetric_power: np.ndarray = np.zeros((0, 0), dtype=np.float64)  # 体积功率数组
+        self.metal_density: np.ndarray = np.zeros((0, 0), dtype=np.float64)  # 金属密度数组
         self.has_metal: bool = False  # 是否有金属
         
+        # 等间距网格的起点和间距倒数（间距倒数为0表示非等间距，按二分查找定位）
+        self._x0: float = 0.0
+        self._dx_inv: float = 0.0
+        self._y0: float = 0.0
+        self._dy_inv: float = 0.0
+        # 网格线坐标是否严格递增，加载时只记录，用到网格线时才报错
+        self._edges_ascending: bool = True
+        
         # 从JSON加载数据
         if json_data:
             self.from_json(json_data)
     
+    @property
+    def nx(self) -> int:
+        """X方向网格数"""
+        return self.power.shape[1]
+    
+    @property
+    def ny(self) -> int:
+        """Y方向网格数"""
+        return self.power.shape[0]
+    
+    @property
+    def power_flat(self) -> np.ndarray:
+        """按行展开的一维功率视图（不复制），网格(ix, iy)位于下标iy * nx + ix"""
+        return self.power.reshape(-1)
+    
     def get_grid_power(self, bottom_left_x: float, bottom_left_y: float, 
                        top_right_x: float, top_right_y: float) -> float:
-        """获取网格功率（平均功率）"""
-        # 这里需要实现具体的逻辑
-        return 0.0
+        """获取网格功率（矩形范围内按相交面积加权的平均功率）"""
+        if self.power.size == 0:
+            return 0.0
+        self.validate_grid()
+        
+        acc, area = _integrate_rect(self.xcoor, self.ycoor, self.power,
+                                    float(bottom_left_x), float(bottom_left_y),
+                                    float(top_right_x), float(top_right_y),
+                                    self._x0, self._dx_inv, self._y0, self._dy_inv)
+        if area <= 0.0:
+            return 0.0
+        return float(acc / area)
+    
+    def validate_grid(self) -> None:
+        """
+        检查网格线坐标长度为(nx+1, ny+1)且严格递增，功率为空时不检查
+        
+        递增性使用update_grid_spacing时记录的结果，检查为O(1)。
+        加载时不做检查，只在积分、施加区域因子等用到网格线时调用。
+        
+        Raises:
+            ValueError: 网格线坐标与功率网格不匹配
+        """
+        if self.power.size:
+            _check_grid_edges(self.xcoor, self.ycoor, self.power.shape, self._edges_ascending)
+    
+    def update_grid_spacing(self) -> None:
+        """重新检测xcoor/ycoor是否等间距及严格递增，直接修改网格线坐标后需调用"""
+        self._edges_ascending = _is_ascending(self.xcoor) and _is_ascending(self.ycoor)
+        self._x0, self._dx_inv = _uniform_spacing(self.xcoor)
+        self._y0, self._dy_inv = _uniform_spacing(self.ycoor)
     
     def compute_volumetric_power(self, thickness: float) -> None:
         """计算体积功率"""
-        # 这里需要实现具体的逻辑
-        pass
+        if thickness <= 0:
+            logger.warning(f"Invalid thickness for volumetric power: {thickness}")
+            return
+        self.volumetric_power = self.power * (1.0 / thickness)
+    
+    def load_and_compute_volumetric(self, json_data: Dict[str, Any], thickness: float) -> None:
+        """
+        从JSON数据加载并同时得到体积功率
+        
+        JSON中已给出volumetricPower时直接使用；否则在加载power后立即按厚度计算，
+        结果写入预分配的数组，不产生中间临时数组。
+        
+        Args:
+            json_data: JSON数据字典
+            thickness: 所在层厚度
+        """
+        self.from_json(json_data)
+        if self.volumetric_power.size or not self.power.size or thickness <= 0:
+            return
+        self.volumetric_power = np.empty_like(self.power)
+        np.multiply(self.power, 1.0 / thickness, out=self.volumetric_power)
     
     def print(self) -> None:
         """打印功率映射信息"""
@@ -113,36 +440,25 @@ class PowerMap:
     
     def from_json(self, json_data: Dict[str, Any]) -> None:
         """从JSON数据加载"""
-        try:
-            self.xcoor = json_data.get("xcoor", [])
-            self.ycoor = json_data.get("ycoor", [])
-            self.power = json_data.get("power", [])
-            self.volumetric_power = json_data.get("volumetricPower", [])
-            self.metal_density = json_data.get("metalDensity", [])
-            self.has_metal = json_data.get("hasMetal", False)
-            
-            logger.debug(f"Loaded PowerMap: {len(self.xcoor)}x{len(self.ycoor)} grid")
-            
-        except Exception as e:
-            logger.error(f"Failed to load PowerMap from JSON: {e}")
-            raise
+        self.xcoor = np.asarray(json_data.get("xcoor", []), dtype=np.float64)
+        self.ycoor = np.asarray(json_data.get("ycoor", []), dtype=np.float64)
+        self.power = _as_grid(json_data.get("power"))
+        self.volumetric_power = _as_grid(json_data.get("volumetricPower"))
+        self.metal_density = _as_grid(json_data.get("metalDensity"))
+        self.has_metal = json_data.get("hasMetal", False)
+        self.update_grid_spacing()
     
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
-        try:
-            data = {
-                "xcoor": self.xcoor,
-                "ycoor": self.ycoor,
-                "power": self.power,
-                "volumetricPower": self.volumetric_power,
-                "metalDensity": self.metal_density,
-                "hasMetal": self.has_metal
-            }
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to convert PowerMap to JSON: {e}")
-            raise
+        data = {
+            "xcoor": self.xcoor.tolist(),
+            "ycoor": self.ycoor.tolist(),
+            "power": self.power.tolist(),
+            "volumetricPower": self.volumetric_power.tolist(),
+            "metalDensity": self.metal_density.tolist(),
+            "hasMetal": self.has_metal
+        }
+        return data
 
 
 class PowerMapLayer:
@@ -173,39 +489,27 @@ class PowerMapLayer:
     
     def from_json(self, json_data: Dict[str, Any]) -> None:
         """从JSON数据加载"""
-        try:
-            self.name = json_data.get("name", "")
-            self.base_z = json_data.get("baseZ", 0.0)
-            self.thickness = json_data.get("thickness", 0.0)
-            self.metal_thermal_conductivity = json_data.get("metalThermalConductivity", 0.0)
-            self.silicon_thermal_conductivity = json_data.get("siliconThermalConductivity", 0.0)
-            
-            # 加载功率映射
-            if "powermap" in json_data:
-                self.powermap.from_json(json_data["powermap"])
-            
-            logger.debug(f"Loaded PowerMapLayer: {self.name}")
-            
-        except Exception as e:
-            logger.error(f"Failed to load PowerMapLayer from JSON: {e}")
-            raise
+        self.name = json_data.get("name", "")
+        self.base_z = json_data.get("baseZ", 0.0)
+        self.thickness = json_data.get("thickness", 0.0)
+        self.metal_thermal_conductivity = json_data.get("metalThermalConductivity", 0.0)
+        self.silicon_thermal_conductivity = json_data.get("siliconThermalConductivity", 0.0)
+        
+        # 加载功率映射
+        if "powermap" in json_data:
+            self.powermap.load_and_compute_volumetric(json_data["powermap"], self.thickness)
     
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
-        try:
-            data = {
-                "name": self.name,
-                "baseZ": self.base_z,
-                "thickness": self.thickness,
-                "metalThermalConductivity": self.metal_thermal_conductivity,
-                "siliconThermalConductivity": self.silicon_thermal_conductivity,
-                "powermap": self.powermap.to_json()
-            }
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to convert PowerMapLayer to JSON: {e}")
-            raise
+        data = {
+            "name": self.name,
+            "baseZ": self.base_z,
+            "thickness": self.thickness,
+            "metalThermalConductivity": self.metal_thermal_conductivity,
+            "siliconThermalConductivity": self.silicon_thermal_conductivity,
+            "powermap": self.powermap.to_json()
+        }
+        return data
 
 
 class DieStackPowerMap:
@@ -238,7 +542,17 @@ class DieStackPowerMap:
         self.level_pwrs: List[Dict[str, Any]] = []  # 层级功率
         self.layers: List[PowerMapLayer] = []  # 功率映射层
         self.probes: List[Dict[str, Any]] = []  # 探针
-        self.areas: List[Area] = []  # 区域
+        # 区域按列存储（见_AREA_COLUMNS），areas属性按需提供Area对象
+        self.area_names: np.ndarray = np.empty(0, dtype=object)
+        self.areas_llx: np.ndarray = np.empty(0, dtype=np.float64)
+        self.areas_lly: np.ndarray = np.empty(0, dtype=np.float64)
+        self.areas_lrx: np.ndarray = np.empty(0, dtype=np.float64)
+        self.areas_lry: np.ndarray = np.empty(0, dtype=np.float64)
+        self.s_layers: np.ndarray = np.empty(0, dtype=object)
+        self.e_layers: np.ndarray = np.empty(0, dtype=object)
+        self.metal_factors: np.ndarray = np.empty(0, dtype=np.float64)
+        self.dy_factors: np.ndarray = np.empty(0, dtype=np.float64)
+        self.lkg_factors: np.ndarray = np.empty(0, dtype=np.float64)
         
         # 其他参数
         self.temperature: float = 25.0
@@ -250,10 +564,46 @@ class DieStackPowerMap:
             self.from_json(json_data)
     
     @staticmethod
-    def parse_die_stack_power_map(file_path: str, die_thickness: int = 0) -> 'DieStackPowerMap':
-        """解析芯片堆叠功率映射文件"""
-        # 这里需要实现具体的文件解析逻辑
-        return DieStackPowerMap()
+    def parse_die_stack_power_map(file_path: Union[str, Path], die_thickness: int = 0,
+                                  use_cache: bool = False,
+                                  cache_dir: Optional[Union[str, Path]] = None) -> 'DieStackPowerMap':
+        """
+        解析芯片堆叠功率映射文件
+        
+        整个文件以字节串读入后一次解析（优先orjson），功率网格随后在
+        PowerMap.from_json中直接转换为连续存储的NumPy数组。
+        缓存默认关闭；启用后首次解析会把网格数组写入.npz缓存（默认位于源文件旁，
+        源文件所在目录只读或共享时应指定cache_dir），之后只要缓存不早于源文件
+        就直接从中读取网格，跳过JSON数值解析。
+        
+        Args:
+            file_path: 功率映射JSON文件路径
+            die_thickness: 芯片厚度（暂未使用）
+            use_cache: 是否读写.npz二进制缓存
+            cache_dir: 缓存目录，指定时即启用缓存
+            
+        Returns:
+            DieStackPowerMap: 解析得到的芯片堆叠功率映射
+        """
+        file_path = Path(file_path)
+        use_cache = use_cache or cache_dir is not None
+        cache_path = _npz_cache_path(file_path, cache_dir)
+        # 功率映射各层级的from_json不再单独捕获异常，统一在此记录完整堆栈
+        try:
+            if use_cache:
+                json_data = _load_npz_cache(file_path, cache_path)
+                if json_data is not None:
+                    logger.debug(f"Loaded power map grids from cache {cache_path}")
+                    return DieStackPowerMap(json_data)
+            
+            json_data = json_loads(DieStackPowerMap.read_file(file_path))
+            dspm = DieStackPowerMap(json_data)
+            if use_cache:
+                _save_npz_cache(cache_path, json_data, dspm)
+            return dspm
+        except Exception:
+            logger.exception(f"Failed to parse die stack power map {file_path}")
+            raise
     
     def set_base_z(self, base_z_start: float) -> None:
         """设置基础Z坐标"""
@@ -271,10 +621,94 @@ class DieStackPowerMap:
         pass
     
     @staticmethod
-    def read_file(file_path: str) -> str:
-        """读取文件内容"""
-        # 这里需要实现具体的文件读取逻辑
-        return ""
+    def read_file(file_path: Union[str, Path]) -> bytes:
+        """读取文件内容（原始字节，不做解码）"""
+        return Path(file_path).read_bytes()
+    
+    @property
+    def areas(self) -> _AreaView:
+        """区域（只读视图，按下标构造Area对象）"""
+        return _AreaView(self)
+    
+    @areas.setter
+    def areas(self, areas: List[Area]) -> None:
+        """用Area对象列表整体替换区域"""
+        n = len(areas)
+        for (column, default), attr in zip(_AREA_COLUMNS, Area._ATTRS):
+            setattr(self, column, _area_column((getattr(a, attr) for a in areas), default, n))
+    
+    def add_area(self, area: Area) -> None:
+        """
+        在末尾追加一个区域（替代原先的areas.append）
+        
+        Args:
+            area: 要追加的区域
+        """
+        for (column, default), attr in zip(_AREA_COLUMNS, Area._ATTRS):
+            value = _area_column((getattr(area, attr),), default, 1)
+            setattr(self, column, np.concatenate((getattr(self, column), value)))
+    
+    def set_area(self, index: int, area: Area) -> None:
+        """
+        替换指定下标的区域，修改某个区域的字段时先取出Area修改后再写回
+        
+        Args:
+            index: 区域下标，支持负数
+            area: 新的区域数据
+        """
+        for (column, default), attr in zip(_AREA_COLUMNS, Area._ATTRS):
+            value = getattr(area, attr)
+            getattr(self, column)[index] = value if isinstance(default, str) else float(value)
+    
+    def _load_area_columns(self, areas_data: List[Dict[str, Any]]) -> None:
+        """直接由区域的JSON数据构建列数组，不创建Area对象"""
+        n = len(areas_data)
+        for (column, default), key in zip(_AREA_COLUMNS, Area._JSON_KEYS):
+            setattr(self, column, _area_column((a.get(key, default) for a in areas_data), default, n))
+    
+    def _areas_to_json(self) -> List[Dict[str, Any]]:
+        """由列数组直接生成区域的JSON列表"""
+        keys = Area._JSON_KEYS
+        rows = zip(*(getattr(self, column).tolist() for column, _ in _AREA_COLUMNS))
+        return [dict(zip(keys, row)) for row in rows]
+    
+    def areas_containing(self, x: float, y: float) -> np.ndarray:
+        """
+        判断点(x, y)落在哪些区域内
+        
+        Returns:
+            np.ndarray: 与areas等长的布尔掩码
+        """
+        return ((self.areas_llx <= x) & (x <= self.areas_lrx) &
+                (self.areas_lly <= y) & (y <= self.areas_lry))
+    
+    def apply_factors_to_powermap(self, pm: PowerMap) -> None:
+        """
+        将各区域的动态功率因子作用到功率映射上
+        
+        网格中心落在区域内的网格功率乘以该区域的dy_pwr_factor，
+        落在多个区域内时各因子连乘，不在任何区域内的网格保持不变。
+        
+        Args:
+            pm: 要修改的功率映射
+            
+        Raises:
+            ValueError: 功率映射的网格线坐标与功率网格不匹配
+        """
+        if pm.power.size == 0 or self.dy_factors.size == 0:
+            return
+        pm.validate_grid()
+        # 网格中心严格递增，每个区域覆盖的网格为连续的行、列区间
+        cx = 0.5 * (pm.xcoor[:-1] + pm.xcoor[1:])
+        cy = 0.5 * (pm.ycoor[:-1] + pm.ycoor[1:])
+        ix0 = np.searchsorted(cx, self.areas_llx, side='left').tolist()
+        ix1 = np.searchsorted(cx, self.areas_lrx, side='right').tolist()
+        iy0 = np.searchsorted(cy, self.areas_lly, side='left').tolist()
+        iy1 = np.searchsorted(cy, self.areas_lry, side='right').tolist()
+        power = pm.power
+        for k, factor in enumerate(self.dy_factors.tolist()):
+            if ix0[k] < ix1[k] and iy0[k] < iy1[k]:
+                power[iy0[k]:iy1[k], ix0[k]:ix1[k]] *= factor
     
     def print(self) -> None:
         """打印芯片堆叠功率映射信息"""
@@ -285,83 +719,67 @@ class DieStackPowerMap:
     
     def from_json(self, json_data: Dict[str, Any]) -> None:
         """从JSON数据加载"""
-        try:
-            # 加载单位信息
-            self.length_unit = json_data.get("lengthUnit", "")
-            self.power_unit = json_data.get("powerUnit", "")
-            self.thermal_conductivity_unit = json_data.get("thermalConductivityUnit", "")
-            self.process_encryption = json_data.get("processEncryption", False)
-            
-            # 加载芯片信息
-            self.die_name = json_data.get("dieName", "")
-            self.die_area_min_x = json_data.get("dieAreaMinx", 0.0)
-            self.die_area_min_y = json_data.get("dieAreaMiny", 0.0)
-            self.die_area_max_x = json_data.get("dieAreaMaxx", 0.0)
-            self.die_area_max_y = json_data.get("dieAreaMaxy", 0.0)
-            self.die_area_nx = json_data.get("dieAreaNx", 0)
-            self.die_area_ny = json_data.get("dieAreaNy", 0)
-            self.number_of_layers = json_data.get("numberOfLayers", 0)
-            
-            # 加载其他参数
-            self.temperature = json_data.get("temperature", 25.0)
-            self.gbl_x_len = json_data.get("gblXLen", 0.0)
-            self.gbl_y_len = json_data.get("gblYLen", 0.0)
-            
-            # 加载层级功率
-            self.level_pwrs = json_data.get("levelPwrs", [])
-            
-            # 加载功率映射层
-            if "layers" in json_data:
-                layers_data = json_data["layers"]
-                for layer_data in layers_data:
-                    layer = PowerMapLayer(layer_data)
-                    self.layers.append(layer)
-            
-            # 加载探针
-            self.probes = json_data.get("probes", [])
-            
-            # 加载区域
-            if "areas" in json_data:
-                areas_data = json_data["areas"]
-                for area_data in areas_data:
-                    area = Area(area_data)
-                    self.areas.append(area)
-            
-            logger.debug(f"Loaded DieStackPowerMap: {self.die_name}")
-            
-        except Exception as e:
-            logger.error(f"Failed to load DieStackPowerMap from JSON: {e}")
-            raise
+        # 加载单位信息
+        self.length_unit = json_data.get("lengthUnit", "")
+        self.power_unit = json_data.get("powerUnit", "")
+        self.thermal_conductivity_unit = json_data.get("thermalConductivityUnit", "")
+        self.process_encryption = json_data.get("processEncryption", False)
+        
+        # 加载芯片信息
+        self.die_name = json_data.get("dieName", "")
+        self.die_area_min_x = json_data.get("dieAreaMinx", 0.0)
+        self.die_area_min_y = json_data.get("dieAreaMiny", 0.0)
+        self.die_area_max_x = json_data.get("dieAreaMaxx", 0.0)
+        self.die_area_max_y = json_data.get("dieAreaMaxy", 0.0)
+        self.die_area_nx = json_data.get("dieAreaNx", 0)
+        self.die_area_ny = json_data.get("dieAreaNy", 0)
+        self.number_of_layers = json_data.get("numberOfLayers", 0)
+        
+        # 加载其他参数
+        self.temperature = json_data.get("temperature", 25.0)
+        self.gbl_x_len = json_data.get("gblXLen", 0.0)
+        self.gbl_y_len = json_data.get("gblYLen", 0.0)
+        
+        # 加载层级功率
+        self.level_pwrs = json_data.get("levelPwrs", [])
+        
+        # 加载功率映射层
+        if "layers" in json_data:
+            self.layers = [PowerMapLayer(layer_data) for layer_data in json_data["layers"]]
+        
+        # 加载探针
+        self.probes = json_data.get("probes", [])
+        
+        # 加载区域
+        if "areas" in json_data:
+            self._load_area_columns(json_data["areas"])
+        
+        logger.debug(f"Loaded DieStackPowerMap: {self.die_name}")
     
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
-        try:
-            data = {
-                "lengthUnit": self.length_unit,
-                "powerUnit": self.power_unit,
-                "thermalConductivityUnit": self.thermal_conductivity_unit,
-                "processEncryption": self.process_encryption,
-                "dieName": self.die_name,
-                "dieAreaMinx": self.die_area_min_x,
-                "dieAreaMiny": self.die_area_min_y,
-                "dieAreaMaxx": self.die_area_max_x,
-                "dieAreaMaxy": self.die_area_max_y,
-                "dieAreaNx": self.die_area_nx,
-                "dieAreaNy": self.die_area_ny,
-                "numberOfLayers": self.number_of_layers,
-                "levelPwrs": self.level_pwrs,
-                "layers": [layer.to_json() for layer in self.layers],
-                "probes": self.probes,
-                "areas": [area.to_json() for area in self.areas],
-                "temperature": self.temperature,
-                "gblXLen": self.gbl_x_len,
-                "gblYLen": self.gbl_y_len
-            }
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to convert DieStackPowerMap to JSON: {e}")
-            raise
+        data = {
+            "lengthUnit": self.length_unit,
+            "powerUnit": self.power_unit,
+            "thermalConductivityUnit": self.thermal_conductivity_unit,
+            "processEncryption": self.process_encryption,
+            "dieName": self.die_name,
+            "dieAreaMinx": self.die_area_min_x,
+            "dieAreaMiny": self.die_area_min_y,
+            "dieAreaMaxx": self.die_area_max_x,
+            "dieAreaMaxy": self.die_area_max_y,
+            "dieAreaNx": self.die_area_nx,
+            "dieAreaNy": self.die_area_ny,
+            "numberOfLayers": self.number_of_layers,
+            "levelPwrs": self.level_pwrs,
+            "layers": list(map(_to_json, self.layers)),
+            "probes": self.probes,
+            "areas": self._areas_to_json(),
+            "temperature": self.temperature,
+            "gblXLen": self.gbl_x_len,
+            "gblYLen": self.gbl_y_len
+        }
+        return data
 
 
 class BoardDieStacks:
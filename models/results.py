@@ -3,13 +3,22 @@ Results模型类
 对应C++的Results类，管理计算结果
 """
 
+from operator import attrgetter, methodcaller
 from typing import Dict, Any, Optional, List
+import numpy as np
 from loguru import logger
 
+_to_json = methodcaller("to_json")
+
 
 class TemperatureResult:
     """温度结果类，对应C++的TemperatureResult"""
     
+    # JSON键与属性名一一对应，to_json按此顺序输出
+    _JSON_KEYS = ("componentName", "nodeId", "temperature", "unit")
+    _ATTRS = ("component_name", "node_id", "temperature", "unit")
+    _get_attrs = attrgetter(*_ATTRS)
+    
     def __init__(self, json_data: Optional[Dict[str, Any]] = None):
         """
         初始化TemperatureResult
@@ -44,37 +53,34 @@ class TemperatureResult:
     
     def from_json(self, json_data: Dict[str, Any]) -> None:
         """从JSON数据加载"""
-        try:
-            self.component_name = json_data.get("componentName", "")
-            self.node_id = json_data.get("nodeId", "")
-            self.temperature = json_data.get("temperature", 0.0)
-            self.unit = json_data.get("unit", "K")
-            
-            logger.debug(f"Loaded TemperatureResult: {self.component_name}")
-            
-        except Exception as e:
-            logger.error(f"Failed to load TemperatureResult from JSON: {e}")
-            raise
+        self.component_name = json_data.get("componentName", "")
+        self.node_id = json_data.get("nodeId", "")
+        self.temperature = json_data.get("temperature", 0.0)
+        self.unit = json_data.get("unit", "K")
     
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
-        try:
-            data = {
-                "componentName": self.component_name,
-                "nodeId": self.node_id,
-                "temperature": self.temperature,
-                "unit": self.unit
-            }
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to convert TemperatureResult to JSON: {e}")
-            raise
+        return dict(zip(self._JSON_KEYS, self._get_attrs(self)))
+    
+    @classmethod
+    def _from_row(cls, component_name: str, node_id: str, temperature: float, unit: str) -> 'TemperatureResult':
+        """由各字段值直接构造，供Results批量加载时跳过from_json"""
+        result = cls.__new__(cls)
+        result.component_name = component_name
+        result.node_id = node_id
+        result.temperature = temperature
+        result.unit = unit
+        return result
 
 
 class HeatFluxResult:
     """热流密度结果类，对应C++的HeatFluxResult"""
     
+    # JSON键与属性名一一对应，to_json按此顺序输出
+    _JSON_KEYS = ("componentName", "surfaceName", "heatFluxX", "heatFluxY", "heatFluxZ", "unit")
+    _ATTRS = ("component_name", "surface_name", "heat_flux_x", "heat_flux_y", "heat_flux_z", "unit")
+    _get_attrs = attrgetter(*_ATTRS)
+    
     def __init__(self, json_data: Optional[Dict[str, Any]] = None):
         """
         初始化HeatFluxResult
@@ -119,36 +125,16 @@ class HeatFluxResult:
     
     def from_json(self, json_data: Dict[str, Any]) -> None:
         """从JSON数据加载"""
-        try:
-            self.component_name = json_data.get("componentName", "")
-            self.surface_name = json_data.get("surfaceName", "")
-            self.heat_flux_x = json_data.get("heatFluxX", 0.0)
-            self.heat_flux_y = json_data.get("heatFluxY", 0.0)
-            self.heat_flux_z = json_data.get("heatFluxZ", 0.0)
-            self.unit = json_data.get("unit", "W/m²")
-            
-            logger.debug(f"Loaded HeatFluxResult: {self.component_name}")
-            
-        except Exception as e:
-            logger.error(f"Failed to load HeatFluxResult from JSON: {e}")
-            raise
+        self.component_name = json_data.get("componentName", "")
+        self.surface_name = json_data.get("surfaceName", "")
+        self.heat_flux_x = json_data.get("heatFluxX", 0.0)
+        self.heat_flux_y = json_data.get("heatFluxY", 0.0)
+        self.heat_flux_z = json_data.get("heatFluxZ", 0.0)
+        self.unit = json_data.get("unit", "W/m²")
     
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
-        try:
-            data = {
-                "componentName": self.component_name,
-                "surfaceName": self.surface_name,
-                "heatFluxX": self.heat_flux_x,
-                "heatFluxY": self.heat_flux_y,
-                "heatFluxZ": self.heat_flux_z,
-                "unit": self.unit
-            }
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to convert HeatFluxResult to JSON: {e}")
-            raise
+        return dict(zip(self._JSON_KEYS, self._get_attrs(self)))
 
 
 class Results:
@@ -156,20 +142,84 @@ class Results:
     
     def __init__(self):
         """初始化Results"""
-        self.temperature_results: List[TemperatureResult] = []
+        self._temperature_results: List[TemperatureResult] = []
+        # 按属性名缓存的列数组（只读），温度结果列表变化时清空
+        self._columns: Dict[str, np.ndarray] = {}
         self.heat_flux_results: List[HeatFluxResult] = []
         self.simulation_time: float = 0.0
         self.convergence_status: str = "unknown"
     
+    @property
+    def temperature_results(self) -> List[TemperatureResult]:
+        """温度结果列表"""
+        return self._temperature_results
+    
+    @temperature_results.setter
+    def temperature_results(self, results: List[TemperatureResult]) -> None:
+        """整体替换温度结果，并清空列缓存"""
+        self._temperature_results = list(results)
+        self._columns.clear()
+    
+    # 以下列数组在首次访问时由temperature_results生成并缓存，之后访问为O(1)。
+    # 通过add_temperature_result、from_json或整体赋值修改结果时缓存自动清空；
+    # 直接修改列表或其中对象的字段后需调用invalidate_columns。
+    
+    @property
+    def component_names(self) -> np.ndarray:
+        """各温度结果的组件名称列"""
+        return self._column("component_name")
+    
+    @property
+    def node_ids(self) -> np.ndarray:
+        """各温度结果的节点ID列"""
+        return self._column("node_id")
+    
+    @property
+    def temperature_units(self) -> np.ndarray:
+        """各温度结果的单位列"""
+        return self._column("unit")
+    
+    @property
+    def temperatures(self) -> np.ndarray:
+        """
+        各温度结果的温度列
+        
+        Raises:
+            ValueError: 存在温度为None的结果（不静默转换为NaN）
+        """
+        return self._column("temperature")
+    
+    def invalidate_columns(self) -> None:
+        """清空列缓存，直接修改temperature_results列表或其中对象后调用"""
+        self._columns.clear()
+    
+    def _column(self, attr: str) -> np.ndarray:
+        """获取某个属性的只读列数组，缓存失效或长度不符时重新生成"""
+        results = self._temperature_results
+        column = self._columns.get(attr)
+        if column is None or len(column) != len(results):
+            values = list(map(attrgetter(attr), results))
+            if attr == "temperature":
+                if None in values:
+                    index = values.index(None)
+                    raise ValueError(f"Temperature result {index} ({results[index].node_id!r}) "
+                                     f"has no temperature value")
+                column = np.array(values, dtype=np.float64)
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            column.setflags(write=False)
+            self._columns[attr] = column
+        return column
+    
     def add_temperature_result(self, result: TemperatureResult) -> None:
         """添加温度结果"""
-        self.temperature_results.append(result)
-        logger.debug(f"Added temperature result: {result.get_component_name()}")
+        self._temperature_results.append(result)
+        self._columns.clear()
     
     def add_heat_flux_result(self, result: HeatFluxResult) -> None:
         """添加热流密度结果"""
         self.heat_flux_results.append(result)
-        logger.debug(f"Added heat flux result: {result.get_component_name()}")
     
     def get_temperature_results(self) -> List[TemperatureResult]:
         """获取所有温度结果"""
@@ -201,37 +251,34 @@ class Results:
             self.simulation_time = json_data.get("simulationTime", 0.0)
             self.convergence_status = json_data.get("convergenceStatus", "unknown")
             
-            # 加载温度结果
+            # 加载温度结果，逐条直接构造行对象，不经过from_json
             if "temperatureResults" in json_data:
-                temp_results_data = json_data["temperatureResults"]
-                for result_data in temp_results_data:
-                    result = TemperatureResult(result_data)
-                    self.add_temperature_result(result)
+                from_row = TemperatureResult._from_row
+                self.temperature_results.extend([
+                    from_row(r.get("componentName", ""), r.get("nodeId", ""),
+                             r.get("temperature", 0.0), r.get("unit", "K"))
+                    for r in json_data["temperatureResults"]
+                ])
+                self._columns.clear()
             
             # 加载热流密度结果
             if "heatFluxResults" in json_data:
-                flux_results_data = json_data["heatFluxResults"]
-                for result_data in flux_results_data:
-                    result = HeatFluxResult(result_data)
-                    self.add_heat_flux_result(result)
+                self.heat_flux_results.extend([HeatFluxResult(result_data)
+                                               for result_data in json_data["heatFluxResults"]])
             
             logger.debug(f"Loaded Results with {len(self.temperature_results)} temperature results and {len(self.heat_flux_results)} heat flux results")
             
-        except Exception as e:
-            logger.error(f"Failed to load Results from JSON: {e}")
+        except Exception:
+            # 结果各条目的from_json不再单独捕获异常，统一在此记录完整堆栈
+            logger.exception("Failed to load Results from JSON")
             raise
     
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
-        try:
-            data = {
-                "simulationTime": self.simulation_time,
-                "convergenceStatus": self.convergence_status,
-                "temperatureResults": [result.to_json() for result in self.temperature_results],
-                "heatFluxResults": [result.to_json() for result in self.heat_flux_results]
-            }
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to convert Results to JSON: {e}")
-            raise
+        data = {
+            "simulationTime": self.simulation_time,
+            "convergenceStatus": self.convergence_status,
+            "temperatureResults": list(map(_to_json, self.temperature_results)),
+            "heatFluxResults": list(map(_to_json, self.heat_flux_results))
+        }
+        return data
@@ -4,12 +4,23 @@
 """
 
 import math
+from math import fabs
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
 from loguru import logger
 
+from models.containment import (
+    HEX_SLOPE, hex_contains, rrect_contains, chamfer_contains,
+    hex_contains_many, rrect_contains_many, chamfer_contains_many,
+    nsided_contains, polygon_contains,
+    nsided_contains_many, polygon_contains_many,
+    rounded_rect_contains_many, chamfered_rect_contains_many, cylinder_contains_many, box_contains_many,
+)
+from models.numba_support import HAS_NUMBA
+
 
 # ============================================================================
 # 枚举类型定义
@@ -44,27 +55,60 @@ class Shape2DType(Enum):
     N_SIDED_POLYGON = "n_sided_polygon"
 
 
+# 形状类型的整数编号（按枚举定义顺序），用于按类型分派的热点循环和列表索引的分派表
+SHAPE_TYPE_IDS = {t: i for i, t in enumerate(ShapeType)}
+SHAPE_2D_TYPE_IDS = {t: i for i, t in enumerate(Shape2DType)}
+
+# 六边形相关常量，只在导入时计算一次
+_SQRT3 = math.sqrt(3)
+_SQRT3_OVER_2 = _SQRT3 * 0.5
+_HEX_AREA_COEF = 1.5 * _SQRT3  # 正六边形面积 = 系数 × r²
+# 圆角矩形四个圆角相对直角少掉的面积 = 系数 × r²
+_FOUR_MINUS_PI = 4.0 - math.pi
+# atan2结果取模到 [0, 2π)：Python浮点取模对负角恰为加2π，对非负角原样返回
+_TWO_PI = 2.0 * math.pi
+
+
 # ============================================================================
 # 基础数据结构
 # ============================================================================
 
-@dataclass
 class Vector3D:
-    """3D向量类"""
-    x: float
-    y: float
-    z: float
+    """3D向量类
+
+    使用 __slots__ 存储分量；运算结果通过 _make 构造，跳过 __init__ 中的 float() 转换。
+    """
+    __slots__ = ('x', 'y', 'z')
     
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         self.x = float(x)
         self.y = float(y)
         self.z = float(z)
     
+    @classmethod
+    def _make(cls, x: float, y: float, z: float) -> 'Vector3D':
+        """直接构造实例（调用方保证分量已是float）"""
+        v = object.__new__(cls)
+        v.x = x
+        v.y = y
+        v.z = z
+        return v
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(x={self.x!r}, y={self.y!r}, z={self.z!r})"
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+    
+    __hash__ = None
+    
     def __add__(self, other: 'Vector3D') -> 'Vector3D':
-        return Vector3D(self.x + other.x, self.y + other.y, self.z + other.z)
+        return Vector3D._make(self.x + other.x, self.y + other.y, self.z + other.z)
     
     def __sub__(self, other: 'Vector3D') -> 'Vector3D':
-        return Vector3D(self.x - other.x, self.y - other.y, self.z - other.z)
+        return Vector3D._make(self.x - other.x, self.y - other.y, self.z - other.z)
     
     def __mul__(self, scalar: float) -> 'Vector3D':
         return Vector3D(self.x * scalar, self.y * scalar, self.z * scalar)
@@ -77,28 +121,49 @@ class Vector3D:
         return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
     
     def normalize(self) -> 'Vector3D':
-        """归一化向量"""
-        mag = self.magnitude()
-        if mag == 0:
-            return Vector3D(0, 0, 0)
-        return self / mag
+        """归一化向量（乘以长度倒数）"""
+        x, y, z = self.x, self.y, self.z
+        mag2 = x * x + y * y + z * z
+        if mag2 == 0.0:
+            return Vector3D._make(0.0, 0.0, 0.0)
+        inv = 1.0 / math.sqrt(mag2)
+        return Vector3D._make(x * inv, y * inv, z * inv)
 
 
-@dataclass
 class Vector2D:
-    """2D向量类"""
-    x: float
-    y: float
+    """2D向量类
+
+    使用 __slots__ 存储分量；运算结果通过 _make 构造，跳过 __init__ 中的 float() 转换。
+    """
+    __slots__ = ('x', 'y')
     
     def __init__(self, x: float = 0.0, y: float = 0.0):
         self.x = float(x)
         self.y = float(y)
     
+    @classmethod
+    def _make(cls, x: float, y: float) -> 'Vector2D':
+        """直接构造实例（调用方保证分量已是float）"""
+        v = object.__new__(cls)
+        v.x = x
+        v.y = y
+        return v
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(x={self.x!r}, y={self.y!r})"
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.x, self.y) == (other.x, other.y)
+    
+    __hash__ = None
+    
     def __add__(self, other: 'Vector2D') -> 'Vector2D':
-        return Vector2D(self.x + other.x, self.y + other.y)
+        return Vector2D._make(self.x + other.x, self.y + other.y)
     
     def __sub__(self, other: 'Vector2D') -> 'Vector2D':
-        return Vector2D(self.x - other.x, self.y - other.y)
+        return Vector2D._make(self.x - other.x, self.y - other.y)
     
     def __mul__(self, scalar: float) -> 'Vector2D':
         return Vector2D(self.x * scalar, self.y * scalar)
@@ -111,16 +176,89 @@ class Vector2D:
         return math.sqrt(self.x * self.x + self.y * self.y)
     
     def normalize(self) -> 'Vector2D':
-        """归一化向量"""
+        """归一化向量（乘以长度倒数）"""
+        x, y = self.x, self.y
+        mag2 = x * x + y * y
+        if mag2 == 0.0:
+            return Vector2D._make(0.0, 0.0)
+        inv = 1.0 / math.sqrt(mag2)
+        return Vector2D._make(x * inv, y * inv)
+
+
+class Vector3DArray:
+    """3D向量数组类
+
+    以 (N, 3) 的 float64 数组连续存储一组向量，批量运算一次完成，
+    避免逐个 Vector3D 对象的 Python 循环。
+    """
+    __slots__ = ('_data',)
+    
+    def __init__(self, data=None):
+        if data is None:
+            self._data = np.empty((0, 3), dtype=np.float64)
+        else:
+            self._data = np.asarray(data, dtype=np.float64).reshape(-1, 3)
+    
+    @classmethod
+    def from_vectors(cls, vectors: List[Vector3D]) -> 'Vector3DArray':
+        """从 Vector3D 列表构建"""
+        data = np.fromiter(
+            (c for v in vectors for c in (v.x, v.y, v.z)),
+            dtype=np.float64, count=3 * len(vectors),
+        )
+        return cls(data)
+    
+    @property
+    def data(self) -> np.ndarray:
+        """底层 (N, 3) 数组"""
+        return self._data
+    
+    def __len__(self) -> int:
+        return self._data.shape[0]
+    
+    def __getitem__(self, index: int) -> Vector3D:
+        x, y, z = self._data[index].tolist()
+        return Vector3D._make(x, y, z)
+    
+    def __iter__(self):
+        make = Vector3D._make
+        for x, y, z in self._data.tolist():
+            yield make(x, y, z)
+    
+    def __repr__(self) -> str:
+        return f"Vector3DArray({len(self)} vectors)"
+    
+    def magnitude(self) -> np.ndarray:
+        """计算每个向量的长度
+
+        Returns:
+            np.ndarray: 形状为 (N,) 的长度数组
+        """
+        return np.sqrt((self._data * self._data).sum(axis=1))
+    
+    def normalize(self) -> 'Vector3DArray':
+        """归一化所有向量（零向量保持为零）"""
         mag = self.magnitude()
-        if mag == 0:
-            return Vector2D(0, 0)
-        return self / mag
+        safe = np.where(mag == 0.0, 1.0, mag)
+        return Vector3DArray(self._data / safe[:, None])
+    
+    def translate(self, offset: Vector3D) -> 'Vector3DArray':
+        """平移所有向量"""
+        return Vector3DArray(self._data + (offset.x, offset.y, offset.z))
+
+
+def _as_point_array(points) -> np.ndarray:
+    """将Vector3DArray或可转换为(N, 3)数组的数据统一为float64的(N, 3)数组"""
+    if isinstance(points, Vector3DArray):
+        return points.data
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
 
 
 @dataclass
 class BoundingBox3D:
-    """3D边界框类"""
+    """3D边界框类（构造后视为不可变，尺寸和体积在构造时计算）"""
+    __slots__ = ('min_x', 'min_y', 'min_z', 'max_x', 'max_y', 'max_z',
+                 '_dx', '_dy', '_dz', '_volume')
     min_x: float
     min_y: float
     min_z: float
@@ -136,28 +274,50 @@ class BoundingBox3D:
         self.max_x = float(max_x)
         self.max_y = float(max_y)
         self.max_z = float(max_z)
+        self._dx = self.max_x - self.min_x
+        self._dy = self.max_y - self.min_y
+        self._dz = self.max_z - self.min_z
+        self._volume = self._dx * self._dz * self._dy
     
     def width(self) -> float:
-        return self.max_x - self.min_x
+        return self._dx
     
     def height(self) -> float:
-        return self.max_z - self.min_z
+        return self._dz
     
     def depth(self) -> float:
-        return self.max_y - self.min_y
+        return self._dy
     
     def volume(self) -> float:
-        return self.width() * self.height() * self.depth()
+        return self._volume
     
     def contains_point(self, point: Vector3D) -> bool:
         return (self.min_x <= point.x <= self.max_x and
                 self.min_y <= point.y <= self.max_y and
                 self.min_z <= point.z <= self.max_z)
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量判断点是否在边界框内
+
+        Args:
+            points: Vector3DArray 或可转换为 (N, 3) 数组的数据
+
+        Returns:
+            np.ndarray: 形状为 (N,) 的布尔掩码
+        """
+        pts = _as_point_array(points)
+        x = pts[:, 0]
+        y = pts[:, 1]
+        z = pts[:, 2]
+        return ((self.min_x <= x) & (x <= self.max_x) &
+                (self.min_y <= y) & (y <= self.max_y) &
+                (self.min_z <= z) & (z <= self.max_z))
 
 
 @dataclass
 class BoundingBox2D:
     """2D边界框类"""
+    __slots__ = ('min_x', 'min_y', 'max_x', 'max_y')
     min_x: float
     min_y: float
     max_x: float
@@ -183,6 +343,49 @@ class BoundingBox2D:
                 self.min_y <= point.y <= self.max_y)
 
 
+class BoundingBox2DArray:
+    """2D边界框数组类
+
+    以 (M, 4) 的 float64 数组存储一组边界框，列依次为 min_x, min_y, max_x, max_y，
+    用于一次判断某点落在哪些边界框内。
+    """
+    __slots__ = ('bounds',)
+    
+    def __init__(self, bounds=None):
+        if bounds is None:
+            self.bounds = np.empty((0, 4), dtype=np.float64)
+        else:
+            self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+    
+    @classmethod
+    def from_boxes(cls, boxes: List[BoundingBox2D]) -> 'BoundingBox2DArray':
+        """从 BoundingBox2D 列表构建"""
+        data = np.fromiter(
+            (c for b in boxes for c in (b.min_x, b.min_y, b.max_x, b.max_y)),
+            dtype=np.float64, count=4 * len(boxes),
+        )
+        return cls(data)
+    
+    def __len__(self) -> int:
+        return self.bounds.shape[0]
+    
+    def __getitem__(self, index: int) -> BoundingBox2D:
+        return BoundingBox2D(*self.bounds[index].tolist())
+    
+    def contains(self, px: float, py: float) -> np.ndarray:
+        """判断点 (px, py) 落在哪些边界框内
+
+        Returns:
+            np.ndarray: 形状为 (M,) 的布尔掩码
+        """
+        b = self.bounds
+        return (b[:, 0] <= px) & (px <= b[:, 2]) & (b[:, 1] <= py) & (py <= b[:, 3])
+    
+    def contains_point(self, point: Vector2D) -> np.ndarray:
+        """判断 Vector2D 点落在哪些边界框内"""
+        return self.contains(point.x, point.y)
+
+
 # ============================================================================
 # 形状基类
 # ============================================================================
@@ -190,6 +393,12 @@ class BoundingBox2D:
 class Shape(ABC):
     """3D形状基类"""
     
+    __slots__ = ('shape_type', 'type_id', 'position', 'rotation', 'is_modified', '_str_cache',
+                 '_bbox_cache', '_bbox_pos', '_bbox_arr', '_half_cache')
+    
+    # 边界框是否为 中心 ± _halves()，compute_bboxes据此批量计算
+    _CENTERED_BBOX: bool = True
+    
     def __init__(self, shape_type: ShapeType, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化3D形状
@@ -200,20 +409,113 @@ class Shape(ABC):
             rotation: 旋转角度（度）
         """
         self.shape_type = shape_type
+        self.type_id = SHAPE_TYPE_IDS[shape_type]
         self.position = position if position else Vector3D(0, 0, 0)
         self.rotation = float(rotation)
         self.is_modified = False
+        # 边界框和半尺寸缓存，由mark_modified清除；边界框另按位置校验
+        self._bbox_cache: Optional[BoundingBox3D] = None
+        self._bbox_pos: Optional[Tuple[float, float, float]] = None
+        self._bbox_arr: Optional[Tuple[BoundingBox3D, np.ndarray]] = None
+        self._half_cache: Optional[Tuple[float, float, float]] = None
+        # to_string结果缓存（字符串只含尺寸参数，不随位置变化）
+        self._str_cache: Optional[str] = None
+    
+    def mark_modified(self) -> None:
+        """标记形状已修改并清除缓存（直接修改尺寸属性后需调用）"""
+        self.is_modified = True
+        self._bbox_cache = None
+        self._bbox_arr = None
+        self._half_cache = None
+        self._str_cache = None
     
-    @abstractmethod
     def get_bounding_box(self) -> BoundingBox3D:
-        """获取3D边界框"""
+        """获取3D边界框（缓存结果，位置或尺寸变化后重新计算）"""
+        p = self.position
+        pos = (p.x, p.y, p.z)
+        if self._bbox_cache is None or self._bbox_pos != pos:
+            self._bbox_cache = self._compute_bounding_box()
+            self._bbox_pos = pos
+        return self._bbox_cache
+    
+    def get_bbox_array(self) -> np.ndarray:
+        """获取3D边界框的只读float64数组
+
+        Returns:
+            np.ndarray: 依次为 min_x, min_y, min_z, max_x, max_y, max_z 的 (6,) 数组，
+                与get_bounding_box的结果同步缓存
+        """
+        bbox = self.get_bounding_box()
+        cached = self._bbox_arr
+        if cached is not None and cached[0] is bbox:
+            return cached[1]
+        arr = np.array((bbox.min_x, bbox.min_y, bbox.min_z, bbox.max_x, bbox.max_y, bbox.max_z),
+                       dtype=np.float64)
+        arr.flags.writeable = False
+        self._bbox_arr = (bbox, arr)
+        return arr
+    
+    @abstractmethod
+    def _compute_bounding_box(self) -> BoundingBox3D:
+        """计算3D边界框"""
         pass
     
+    def _halves(self) -> Tuple[float, float, float]:
+        """X、Y、Z方向的半尺寸（缓存至下次mark_modified）"""
+        if self._half_cache is None:
+            self._half_cache = self._compute_halves()
+        return self._half_cache
+    
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸，默认取边界框尺寸的一半"""
+        bbox = self._compute_bounding_box()
+        return bbox.width() / 2, bbox.depth() / 2, bbox.height() / 2
+    
     @abstractmethod
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在形状内"""
         pass
     
+    def contains_points(self, points) -> np.ndarray:
+        """
+        批量检查点是否在形状内
+        
+        默认逐点调用contains_point，常用形状提供了向量化实现。
+        
+        Args:
+            points: Vector3DArray或可转换为(N, 3)数组的数据
+            
+        Returns:
+            np.ndarray: 形状为(N,)的布尔掩码
+        """
+        pts = _as_point_array(points)
+        make = Vector3D._make
+        return np.fromiter((self.contains_point(make(x, y, z)) for x, y, z in pts.tolist()),
+                           dtype=bool, count=len(pts))
+    
+    def _point_offsets(self, points):
+        """各点相对形状中心的偏移(dx, dy, dz)数组"""
+        pts = _as_point_array(points)
+        return (pts[:, 0] - self.position.x,
+                pts[:, 1] - self.position.y,
+                pts[:, 2] - self.position.z)
+    
+    @classmethod
+    def contains_point_batch(cls, shapes: List['Shape'], point: Vector3D) -> np.ndarray:
+        """
+        检查一个点落在一组同类型形状中的哪些形状内
+        
+        默认逐个调用contains_point，常用形状提供了读取参数数组后一次判断的实现。
+        
+        Args:
+            shapes: 均为cls类型的形状列表
+            point: 待检查的点
+            
+        Returns:
+            np.ndarray: 形状为(N,)的布尔掩码
+        """
+        return np.fromiter((s.contains_point(point) for s in shapes), dtype=bool, count=len(shapes))
+    
     @abstractmethod
     def volume(self) -> float:
         """计算体积"""
@@ -233,6 +535,8 @@ class Shape(ABC):
 class Shape2D(ABC):
     """2D形状基类"""
     
+    __slots__ = ('shape_type', 'type_id', 'position', 'rotation', 'is_modified')
+    
     def __init__(self, shape_type: Shape2DType, position: Vector2D = None, rotation: float = 0.0):
         """
         初始化2D形状
@@ -243,6 +547,7 @@ class Shape2D(ABC):
             rotation: 旋转角度（度）
         """
         self.shape_type = shape_type
+        self.type_id = SHAPE_2D_TYPE_IDS[shape_type]
         self.position = position if position else Vector2D(0, 0)
         self.rotation = float(rotation)
         self.is_modified = False
@@ -257,6 +562,38 @@ class Shape2D(ABC):
         """检查点是否在形状内"""
         pass
     
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在形状内，供棱柱等调用方免去构造向量对象"""
+        return self.contains_point(Vector2D._make(x, y))
+    
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆（以形状中心为圆心、包含整个形状）半径的平方，默认取边界框半对角线"""
+        bbox = self.get_bounding_box_2d()
+        half_w = (bbox.max_x - bbox.min_x) / 2
+        half_h = (bbox.max_y - bbox.min_y) / 2
+        return half_w * half_w + half_h * half_h
+    
+    def _point_offsets_xy(self, xs, ys):
+        """各点相对形状中心的偏移(dx, dy)数组"""
+        return (np.asarray(xs, dtype=np.float64) - self.position.x,
+                np.asarray(ys, dtype=np.float64) - self.position.y)
+    
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """
+        批量检查点是否在形状内（默认逐点调用_contains_xy，常用形状提供了向量化实现）
+        
+        Args:
+            xs: (N,) X坐标
+            ys: (N,) Y坐标
+            
+        Returns:
+            np.ndarray: 形状为(N,)的布尔掩码
+        """
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        ys = np.asarray(ys, dtype=np.float64).ravel()
+        return np.fromiter(map(self._contains_xy, xs.tolist(), ys.tolist()), dtype=bool, count=xs.size)
+    
     @abstractmethod
     def get_area(self) -> float:
         """计算面积"""
@@ -271,6 +608,10 @@ class Shape2D(ABC):
 class Cube(Shape):
     """立方体形状"""
     
+    __slots__ = ('length', 'width', 'height', '_equal_half')
+    
+    _FMT = "cube([%s,%s,%s], %s, %s, %s)"
+    
     def __init__(self, position: Vector3D = None, length: float = 1.0, width: float = 1.0, height: float = 1.0):
         """
         初始化立方体
@@ -285,6 +626,19 @@ class Cube(Shape):
         self.length = float(length)
         self.width = float(width)
         self.height = float(height)
+        self._update_equal_half()
+    
+    def _update_equal_half(self) -> None:
+        """三边相等时记录公共半边长，供contains_point走单次比较的快速路径"""
+        if self.length == self.width == self.height:
+            self._equal_half = self.length / 2
+        else:
+            self._equal_half = None
+    
+    def mark_modified(self) -> None:
+        """标记已修改并刷新缓存和等边快速路径"""
+        super().mark_modified()
+        self._update_equal_half()
     
     def get_length(self) -> float:
         """获取长度"""
@@ -293,7 +647,7 @@ class Cube(Shape):
     def set_length(self, length: float) -> None:
         """设置长度"""
         self.length = float(length)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_width(self) -> float:
         """获取宽度"""
@@ -302,7 +656,7 @@ class Cube(Shape):
     def set_width(self, width: float) -> None:
         """设置宽度"""
         self.width = float(width)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -311,13 +665,15 @@ class Cube(Shape):
     def set_height(self, height: float) -> None:
         """设置高度"""
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.length / 2, self.width / 2, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
-        half_length = self.length / 2
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_length, half_width, half_height = self._halves()
         
         return BoundingBox3D(
             self.position.x - half_length, self.position.y - half_width, self.position.z - half_height,
@@ -326,13 +682,48 @@ class Cube(Shape):
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在立方体内"""
-        half_length = self.length / 2
-        half_width = self.width / 2
-        half_height = self.height / 2
+        position = self.position
+        half = self._equal_half
+        if half is not None:
+            # 三边相等：切比雪夫距离不超过半边长即在内部
+            return max(fabs(point.x - position.x),
+                       fabs(point.y - position.y),
+                       fabs(point.z - position.z)) <= half
+        half_length, half_width, half_height = self._halves()
+        # 取各轴超出半尺寸的最大值，一次比较代替逐轴短路判断
+        return max(fabs(point.x - position.x) - half_length,
+                   fabs(point.y - position.y) - half_width,
+                   fabs(point.z - position.z) - half_height) <= 0.0
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在立方体内（向量化）"""
+        half_length, half_width, half_height = self._halves()
+        dx, dy, dz = self._point_offsets(points)
+        return ((np.abs(dx) <= half_length) &
+                (np.abs(dy) <= half_width) &
+                (np.abs(dz) <= half_height))
+    
+    @classmethod
+    def contains_point_batch(cls, shapes: List[Shape], point: Vector3D) -> np.ndarray:
+        """检查一个点落在一组立方体中的哪些内（向量化）"""
+        return _boxes_contain_point(shapes, point)
+    
+    @classmethod
+    def from_arrays(cls, positions, length, width, height, dtype=np.float64) -> 'CubeArray':
+        """
+        由参数数组批量构建立方体，按列存储而不逐个创建Cube对象
         
-        return (abs(point.x - self.position.x) <= half_length and
-                abs(point.y - self.position.y) <= half_width and
-                abs(point.z - self.position.z) <= half_height)
+        Args:
+            positions: (N, 3) 中心坐标
+            length: (N,) 或标量，X方向长度
+            width: (N,) 或标量，Y方向宽度
+            height: (N,) 或标量，Z方向高度
+            dtype: 存储精度，np.float64或np.float32
+            
+        Returns:
+            CubeArray: 立方体数组
+        """
+        return CubeArray(positions, length, width, height, dtype)
     
     def volume(self) -> float:
         """计算体积"""
@@ -344,12 +735,18 @@ class Cube(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"cube([{self.position.x},{self.position.y},{self.position.z}], {self.length}, {self.width}, {self.height})"
+        return self._FMT % (self.position.x, self.position.y, self.position.z, self.length, self.width, self.height)
 
 
 class HexagonalPrism(Shape):
     """六棱柱形状"""
     
+    __slots__ = ('diameter', 'radius', 'height', 'side_length', '_r_half')
+    
+    _FMT = "hexagonal_prism([%s,%s,%s], %s, %s)"
+    
+    _HEX_SLOPE: float = HEX_SLOPE  # tan(30°)
+    
     def __init__(self, position: Vector3D = None, diameter: float = 1.0, height: float = 1.0):
         """
         初始化六棱柱
@@ -365,7 +762,8 @@ class HexagonalPrism(Shape):
         self.diameter = float(diameter)
         self.height = float(height)
         self.radius = diameter / 2
-        self.side_length = diameter * math.sqrt(3) / 2
+        self._r_half = self.radius * 0.5
+        self.side_length = diameter * _SQRT3_OVER_2
     
     def get_diameter(self) -> float:
         """获取外接圆直径"""
@@ -377,8 +775,9 @@ class HexagonalPrism(Shape):
             raise ValueError("Diameter must be positive")
         self.diameter = float(diameter)
         self.radius = diameter / 2
-        self.side_length = diameter * math.sqrt(3) / 2
-        self.is_modified = True
+        self._r_half = self.radius * 0.5
+        self.side_length = diameter * _SQRT3_OVER_2
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -389,9 +788,13 @@ class HexagonalPrism(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.radius, self.radius, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
         half_height = self.height / 2
         
@@ -402,31 +805,28 @@ class HexagonalPrism(Shape):
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在六棱柱内"""
-        # 检查高度
-        half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
-            return False
-        
-        # 检查2D投影是否在六边形内
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
-        
-        # 六边形边界检查
-        if abs(dx) > self.radius or abs(dy) > self.radius:
-            return False
-        
-        # 检查是否在六边形边界内
-        if abs(dx) <= self.radius / 2:
-            return abs(dy) <= self.radius
-        else:
-            # 检查斜边
-            slope = math.tan(math.pi / 6)  # 30度角
-            return abs(dy) <= slope * (self.radius - abs(dx))
+        position = self.position
+        return hex_contains(point.x, point.y, point.z, position.x, position.y, position.z,
+                            self.radius, self._r_half, self.height / 2, self._HEX_SLOPE)
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在六棱柱内（向量化，判定规则与contains_point一致）"""
+        if HAS_NUMBA:
+            position = self.position
+            return hex_contains_many(_as_point_array(points), position.x, position.y, position.z,
+                                     self.radius, self._r_half, self.height / 2, self._HEX_SLOPE)
+        dx, dy, dz = self._point_offsets(points)
+        adx = np.abs(dx)
+        ady = np.abs(dy)
+        r = self.radius
+        slope = self._HEX_SLOPE
+        return ((np.abs(dz) <= self.height / 2) & (adx <= r) &
+                np.where(adx <= self._r_half, ady <= r, ady <= slope * (r - adx)))
     
     def volume(self) -> float:
         """计算体积"""
         # 六边形面积 × 高度
-        hex_area = 3 * math.sqrt(3) * self.radius * self.radius / 2
+        hex_area = _HEX_AREA_COEF * self.radius * self.radius
         return hex_area * self.height
     
     def get_2d_type(self) -> str:
@@ -435,12 +835,17 @@ class HexagonalPrism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"hexagonal_prism([{self.position.x},{self.position.y},{self.position.z}], {self.diameter}, {self.height})"
+        return self._FMT % (self.position.x, self.position.y, self.position.z, self.diameter, self.height)
 
 
 class ObliqueCube(Shape):
     """斜立方体形状"""
     
+    __slots__ = ('length', 'width', 'height', 'skew_x', 'skew_y', '_tan_skew_x', '_tan_skew_y')
+    
+    _FMT = "oblique_cube([%s,%s,%s], %s, %s, %s, %s, %s)"
+    _CENTERED_BBOX = False
+    
     def __init__(self, position: Vector3D = None, length: float = 1.0, width: float = 1.0, height: float = 1.0, 
                  skew_x: float = 0.0, skew_y: float = 0.0):
         """
@@ -462,6 +867,9 @@ class ObliqueCube(Shape):
         self.height = float(height)
         self.skew_x = float(skew_x)
         self.skew_y = float(skew_y)
+        # 沿Z方向的剪切系数：skew_x使Y截面随高度偏移，skew_y使X截面随高度偏移
+        self._tan_skew_x = math.tan(math.radians(self.skew_x))
+        self._tan_skew_y = math.tan(math.radians(self.skew_y))
     
     def get_skew_x(self) -> float:
         """获取X方向倾斜角度"""
@@ -470,7 +878,8 @@ class ObliqueCube(Shape):
     def set_skew_x(self, skew_x: float) -> None:
         """设置X方向倾斜角度"""
         self.skew_x = float(skew_x)
-        self.is_modified = True
+        self._tan_skew_x = math.tan(math.radians(self.skew_x))
+        self.mark_modified()
     
     def get_skew_y(self) -> float:
         """获取Y方向倾斜角度"""
@@ -479,20 +888,20 @@ class ObliqueCube(Shape):
     def set_skew_y(self, skew_y: float) -> None:
         """设置Y方向倾斜角度"""
         self.skew_y = float(skew_y)
-        self.is_modified = True
+        self._tan_skew_y = math.tan(math.radians(self.skew_y))
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算未倾斜时X、Y、Z方向的半尺寸"""
+        return self.length / 2, self.width / 2, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框（考虑倾斜）"""
-        half_length = self.length / 2
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_length, half_width, half_height = self._halves()
         
-        # 计算倾斜后的边界
-        skew_rad_x = math.radians(self.skew_x)
-        skew_rad_y = math.radians(self.skew_y)
-        
-        max_offset_x = half_width * abs(math.sin(skew_rad_y))
-        max_offset_y = half_length * abs(math.sin(skew_rad_x))
+        # 顶面和底面相对中心的最大剪切偏移
+        max_offset_x = half_height * abs(self._tan_skew_y)
+        max_offset_y = half_height * abs(self._tan_skew_x)
         
         return BoundingBox3D(
             self.position.x - half_length - max_offset_x, 
@@ -504,9 +913,23 @@ class ObliqueCube(Shape):
         )
     
     def contains_point(self, point: Vector3D) -> bool:
-        """检查点是否在斜立方体内"""
-        # 简化实现：使用边界框检查
-        return self.get_bounding_box().contains_point(point)
+        """检查点是否在斜立方体内（反剪切后按轴对齐立方体判断）"""
+        half_length, half_width, half_height = self._halves()
+        position = self.position
+        dz = point.z - position.z
+        if fabs(dz) > half_height:
+            return False
+        ux = point.x - position.x - dz * self._tan_skew_y
+        uy = point.y - position.y - dz * self._tan_skew_x
+        return fabs(ux) <= half_length and fabs(uy) <= half_width
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在斜立方体内（向量化）"""
+        half_length, half_width, half_height = self._halves()
+        dx, dy, dz = self._point_offsets(points)
+        return ((np.abs(dz) <= half_height) &
+                (np.abs(dx - dz * self._tan_skew_y) <= half_length) &
+                (np.abs(dy - dz * self._tan_skew_x) <= half_width))
     
     def volume(self) -> float:
         """计算体积"""
@@ -518,12 +941,16 @@ class ObliqueCube(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"oblique_cube([{self.position.x},{self.position.y},{self.position.z}], {self.length}, {self.width}, {self.height}, {self.skew_x}, {self.skew_y})"
+        return self._FMT % (self.position.x, self.position.y, self.position.z, self.length, self.width, self.height, self.skew_x, self.skew_y)
 
 
 class RectPrism(Shape):
     """矩形棱柱形状"""
     
+    __slots__ = ('length', 'width', 'height')
+    
+    _FMT = "rect_prism([%s,%s,%s], %s, %s, %s)"
+    
     def __init__(self, position: Vector3D = None, length: float = 1.0, width: float = 1.0, height: float = 1.0):
         """
         初始化矩形棱柱
@@ -541,11 +968,13 @@ class RectPrism(Shape):
         self.width = float(width)
         self.height = float(height)
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.length / 2, self.width / 2, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
-        half_length = self.length / 2
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_length, half_width, half_height = self._halves()
         
         return BoundingBox3D(
             self.position.x - half_length, self.position.y - half_width, self.position.z - half_height,
@@ -554,13 +983,25 @@ class RectPrism(Shape):
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在矩形棱柱内"""
-        half_length = self.length / 2
-        half_width = self.width / 2
-        half_height = self.height / 2
-        
-        return (abs(point.x - self.position.x) <= half_length and
-                abs(point.y - self.position.y) <= half_width and
-                abs(point.z - self.position.z) <= half_height)
+        half_length, half_width, half_height = self._halves()
+        position = self.position
+        # 取各轴超出半尺寸的最大值，一次比较代替逐轴短路判断
+        return max(fabs(point.x - position.x) - half_length,
+                   fabs(point.y - position.y) - half_width,
+                   fabs(point.z - position.z) - half_height) <= 0.0
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在矩形棱柱内（向量化）"""
+        half_length, half_width, half_height = self._halves()
+        dx, dy, dz = self._point_offsets(points)
+        return ((np.abs(dx) <= half_length) &
+                (np.abs(dy) <= half_width) &
+                (np.abs(dz) <= half_height))
+    
+    @classmethod
+    def contains_point_batch(cls, shapes: List[Shape], point: Vector3D) -> np.ndarray:
+        """检查一个点落在一组矩形棱柱中的哪些内（向量化）"""
+        return _boxes_contain_point(shapes, point)
     
     def volume(self) -> float:
         """计算体积"""
@@ -572,12 +1013,16 @@ class RectPrism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"rect_prism([{self.position.x},{self.position.y},{self.position.z}], {self.length}, {self.width}, {self.height})"
+        return self._FMT % (self.position.x, self.position.y, self.position.z, self.length, self.width, self.height)
 
 
 class SquarePrism(Shape):
     """方形棱柱形状"""
     
+    __slots__ = ('side', 'height')
+    
+    _FMT = "square_prism([%s,%s,%s], %s, %s)"
+    
     def __init__(self, position: Vector3D = None, side: float = 1.0, height: float = 1.0):
         """
         初始化方形棱柱
@@ -602,7 +1047,7 @@ class SquarePrism(Shape):
         if side <= 0:
             raise ValueError("Side must be positive")
         self.side = float(side)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -613,12 +1058,15 @@ class SquarePrism(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.side / 2, self.side / 2, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
-        half_side = self.side / 2
-        half_height = self.height / 2
+        half_side, _, half_height = self._halves()
         
         return BoundingBox3D(
             self.position.x - half_side, self.position.y - half_side, self.position.z - half_height,
@@ -627,12 +1075,25 @@ class SquarePrism(Shape):
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在方形棱柱内"""
-        half_side = self.side / 2
-        half_height = self.height / 2
-        
-        return (abs(point.x - self.position.x) <= half_side and
-                abs(point.y - self.position.y) <= half_side and
-                abs(point.z - self.position.z) <= half_height)
+        half_side, _, half_height = self._halves()
+        position = self.position
+        # 取各轴超出半尺寸的最大值，一次比较代替逐轴短路判断
+        return max(fabs(point.x - position.x) - half_side,
+                   fabs(point.y - position.y) - half_side,
+                   fabs(point.z - position.z) - half_height) <= 0.0
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在方形棱柱内（向量化）"""
+        half_side, _, half_height = self._halves()
+        dx, dy, dz = self._point_offsets(points)
+        return ((np.abs(dx) <= half_side) &
+                (np.abs(dy) <= half_side) &
+                (np.abs(dz) <= half_height))
+    
+    @classmethod
+    def contains_point_batch(cls, shapes: List[Shape], point: Vector3D) -> np.ndarray:
+        """检查一个点落在一组方形棱柱中的哪些内（向量化）"""
+        return _boxes_contain_point(shapes, point)
     
     def volume(self) -> float:
         """计算体积"""
@@ -644,12 +1105,16 @@ class SquarePrism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"square_prism([{self.position.x},{self.position.y},{self.position.z}], {self.side}, {self.height})"
+        return self._FMT % (self.position.x, self.position.y, self.position.z, self.side, self.height)
 
 
 class OblongXPrism(Shape):
     """X方向椭圆棱柱"""
     
+    __slots__ = ('length', 'width', 'height', 'radius_x', 'radius_y')
+    
+    _FMT = "oblong_x_prism([%s,%s,%s], %s, %s, %s)"
+    
     def __init__(self, position: Vector3D = None, length: float = 1.0, width: float = 1.0, height: float = 1.0):
         """
         初始化X方向椭圆棱柱
@@ -669,7 +1134,11 @@ class OblongXPrism(Shape):
         self.radius_x = length / 2
         self.radius_y = width / 2
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.radius_x, self.radius_y, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
         half_height = self.height / 2
         
@@ -682,7 +1151,7 @@ class OblongXPrism(Shape):
         """检查点是否在X方向椭圆棱柱内"""
         # 检查高度
         half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
+        if fabs(point.z - self.position.z) > half_height:
             return False
         
         # 检查2D投影是否在椭圆内
@@ -695,6 +1164,14 @@ class OblongXPrism(Shape):
         
         return (normalized_x * normalized_x + normalized_y * normalized_y) <= 1.0
     
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在X方向椭圆棱柱内（向量化）"""
+        dx, dy, dz = self._point_offsets(points)
+        normalized_x = dx / self.radius_x
+        normalized_y = dy / self.radius_y
+        return ((np.abs(dz) <= self.height / 2) &
+                ((normalized_x * normalized_x + normalized_y * normalized_y) <= 1.0))
+    
     def volume(self) -> float:
         """计算体积"""
         # 椭圆面积 × 高度
@@ -706,12 +1183,16 @@ class OblongXPrism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"oblong_x_prism([{self.position.x},{self.position.y},{self.position.z}], {self.length}, {self.width}, {self.height})"
+        return self._FMT % (self.position.x, self.position.y, self.position.z, self.length, self.width, self.height)
 
 
 class OblongYPrism(Shape):
     """Y方向椭圆棱柱"""
     
+    __slots__ = ('length', 'width', 'height', 'radius_x', 'radius_y')
+    
+    _FMT = "OblongYPrism(%s, %s, %s)"
+    
     def __init__(self, length: float, width: float, height: float, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化Y方向椭圆棱柱
@@ -742,7 +1223,7 @@ class OblongYPrism(Shape):
             raise ValueError("Length must be positive")
         self.length = float(length)
         self.radius_y = length / 2
-        self.is_modified = True
+        self.mark_modified()
     
     def get_width(self) -> float:
         """获取宽度"""
@@ -754,7 +1235,7 @@ class OblongYPrism(Shape):
             raise ValueError("Width must be positive")
         self.width = float(width)
         self.radius_x = width / 2
-        self.is_modified = True
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -765,9 +1246,13 @@ class OblongYPrism(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.radius_x, self.radius_y, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
         half_height = self.height / 2
         
@@ -780,7 +1265,7 @@ class OblongYPrism(Shape):
         """检查点是否在Y方向椭圆棱柱内"""
         # 检查高度
         half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
+        if fabs(point.z - self.position.z) > half_height:
             return False
         
         # 检查2D投影是否在椭圆内
@@ -793,6 +1278,14 @@ class OblongYPrism(Shape):
         
         return (normalized_x * normalized_x + normalized_y * normalized_y) <= 1.0
     
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在Y方向椭圆棱柱内（向量化）"""
+        dx, dy, dz = self._point_offsets(points)
+        normalized_x = dx / self.radius_x
+        normalized_y = dy / self.radius_y
+        return ((np.abs(dz) <= self.height / 2) &
+                ((normalized_x * normalized_x + normalized_y * normalized_y) <= 1.0))
+    
     def volume(self) -> float:
         """计算体积"""
         # 椭圆面积 × 高度
@@ -804,12 +1297,17 @@ class OblongYPrism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"OblongYPrism({self.length}, {self.width}, {self.height})"
+        return self._FMT % (self.length, self.width, self.height)
 
 
 class RoundedRectPrism(Shape):
     """圆角矩形棱柱"""
     
+    __slots__ = ('width', 'depth', 'height', 'radius', 'radius_sq',
+                 'half_width', 'half_depth', 'inner_half_w', 'inner_half_d')
+    
+    _FMT = "RoundedRectPrism(%s, %s, %s, %s)"
+    
     def __init__(self, width: float, height: float, depth: float, radius: float, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化圆角矩形棱柱
@@ -831,6 +1329,15 @@ class RoundedRectPrism(Shape):
         self.height = float(height)
         self.depth = float(depth)
         self.radius = float(radius)
+        self._update_corner_params()
+    
+    def _update_corner_params(self) -> None:
+        """刷新包含判定用的半尺寸、圆角圆心偏移和半径平方"""
+        self.half_width = self.width / 2
+        self.half_depth = self.depth / 2
+        self.inner_half_w = self.half_width - self.radius
+        self.inner_half_d = self.half_depth - self.radius
+        self.radius_sq = self.radius * self.radius
     
     def get_width(self) -> float:
         """获取宽度"""
@@ -843,7 +1350,8 @@ class RoundedRectPrism(Shape):
         if self.radius > min(width, self.depth) / 2:
             raise ValueError("Radius cannot be larger than half of the smaller dimension")
         self.width = float(width)
-        self.is_modified = True
+        self._update_corner_params()
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -854,7 +1362,7 @@ class RoundedRectPrism(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_depth(self) -> float:
         """获取深度"""
@@ -867,7 +1375,8 @@ class RoundedRectPrism(Shape):
         if self.radius > min(self.width, depth) / 2:
             raise ValueError("Radius cannot be larger than half of the smaller dimension")
         self.depth = float(depth)
-        self.is_modified = True
+        self._update_corner_params()
+        self.mark_modified()
     
     def get_radius(self) -> float:
         """获取圆角半径"""
@@ -880,13 +1389,18 @@ class RoundedRectPrism(Shape):
         if radius > min(self.width, self.depth) / 2:
             raise ValueError("Radius cannot be larger than half of the smaller dimension")
         self.radius = float(radius)
-        self.is_modified = True
+        self._update_corner_params()
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.half_width, self.half_depth, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
-        half_width = self.width / 2
+        half_width = self.half_width
         half_height = self.height / 2
-        half_depth = self.depth / 2
+        half_depth = self.half_depth
         
         return BoundingBox3D(
             self.position.x - half_width, self.position.y - half_depth, self.position.z - half_height,
@@ -895,46 +1409,30 @@ class RoundedRectPrism(Shape):
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在圆角矩形棱柱内"""
-        # 检查高度
-        half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
-            return False
-        
-        # 检查2D投影是否在圆角矩形内
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
-        
-        half_width = self.width / 2
-        half_depth = self.depth / 2
-        
-        # 检查是否在矩形边界内
-        if abs(dx) > half_width or abs(dy) > half_depth:
-            return False
-        
-        # 检查是否在圆角区域内
-        if (abs(dx) > half_width - self.radius and 
-            abs(dy) > half_depth - self.radius):
-            # 计算到最近圆角中心的距离
-            corner_x = half_width - self.radius
-            corner_y = half_depth - self.radius
-            
-            if dx > 0:
-                corner_x = -corner_x
-            if dy > 0:
-                corner_y = -corner_y
-            
-            distance_squared = ((dx - corner_x) ** 2 + (dy - corner_y) ** 2)
-            return distance_squared <= self.radius * self.radius
-        
-        return True
+        position = self.position
+        return rrect_contains(point.x, point.y, point.z, position.x, position.y, position.z,
+                              self.half_width, self.half_depth, self.height / 2,
+                              self.inner_half_w, self.inner_half_d, self.radius_sq)
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在圆角矩形棱柱内（向量化，判定规则与contains_point一致）"""
+        if HAS_NUMBA:
+            position = self.position
+            return rrect_contains_many(_as_point_array(points), position.x, position.y, position.z,
+                                       self.half_width, self.half_depth, self.height / 2,
+                                       self.inner_half_w, self.inner_half_d, self.radius_sq)
+        dx, dy, dz = self._point_offsets(points)
+        adx = np.abs(dx)
+        ady = np.abs(dy)
+        in_rect = (np.abs(dz) <= self.height / 2) & (adx <= self.half_width) & (ady <= self.half_depth)
+        ox = np.maximum(adx - self.inner_half_w, 0.0)
+        oy = np.maximum(ady - self.inner_half_d, 0.0)
+        return in_rect & (ox * ox + oy * oy <= self.radius_sq)
     
     def volume(self) -> float:
         """计算体积"""
-        # 圆角矩形面积 × 高度
-        rect_area = self.width * self.depth
-        corner_area = 4 * (self.radius * self.radius - math.pi * self.radius * self.radius / 4)
-        base_area = rect_area - corner_area + math.pi * self.radius * self.radius
-        return base_area * self.height
+        # 圆角矩形面积 × 高度：矩形减去四个角上正方形与四分之一圆之差
+        return (self.width * self.depth - _FOUR_MINUS_PI * self.radius_sq) * self.height
     
     def get_2d_type(self) -> str:
         """获取对应的2D形状类型"""
@@ -942,12 +1440,16 @@ class RoundedRectPrism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"RoundedRectPrism({self.width}, {self.height}, {self.depth}, {self.radius})"
+        return self._FMT % (self.width, self.height, self.depth, self.radius)
 
 
 class ChamferedRectPrism(Shape):
     """倒角矩形棱柱"""
     
+    __slots__ = ('width', 'depth', 'height', 'chamfer')
+    
+    _FMT = "ChamferedRectPrism(%s, %s, %s, %s)"
+    
     def __init__(self, width: float, height: float, depth: float, chamfer: float, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化倒角矩形棱柱
@@ -981,7 +1483,7 @@ class ChamferedRectPrism(Shape):
         if self.chamfer > min(width, self.depth) / 2:
             raise ValueError("Chamfer cannot be larger than half of the smaller dimension")
         self.width = float(width)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -992,7 +1494,7 @@ class ChamferedRectPrism(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_depth(self) -> float:
         """获取深度"""
@@ -1005,7 +1507,7 @@ class ChamferedRectPrism(Shape):
         if self.chamfer > min(self.width, depth) / 2:
             raise ValueError("Chamfer cannot be larger than half of the smaller dimension")
         self.depth = float(depth)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_chamfer(self) -> float:
         """获取倒角长度"""
@@ -1018,9 +1520,13 @@ class ChamferedRectPrism(Shape):
         if chamfer > min(self.width, self.depth) / 2:
             raise ValueError("Chamfer cannot be larger than half of the smaller dimension")
         self.chamfer = float(chamfer)
-        self.is_modified = True
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.width / 2, self.depth / 2, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
         half_width = self.width / 2
         half_height = self.height / 2
@@ -1033,48 +1539,30 @@ class ChamferedRectPrism(Shape):
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在倒角矩形棱柱内"""
-        # 检查高度
-        half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
-            return False
-        
-        # 检查2D投影是否在倒角矩形内
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
-        
+        position = self.position
+        return chamfer_contains(point.x, point.y, point.z, position.x, position.y, position.z,
+                                self.width / 2, self.depth / 2, self.height / 2, self.chamfer)
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在倒角矩形棱柱内（向量化，判定规则与contains_point一致）"""
+        if HAS_NUMBA:
+            position = self.position
+            return chamfer_contains_many(_as_point_array(points), position.x, position.y, position.z,
+                                         self.width / 2, self.depth / 2, self.height / 2, self.chamfer)
+        dx, dy, dz = self._point_offsets(points)
+        adx = np.abs(dx)
+        ady = np.abs(dy)
         half_width = self.width / 2
         half_depth = self.depth / 2
-        
-        # 检查是否在矩形边界内
-        if abs(dx) > half_width or abs(dy) > half_depth:
-            return False
-        
-        # 检查是否在倒角区域内
-        if (abs(dx) > half_width - self.chamfer and 
-            abs(dy) > half_depth - self.chamfer):
-            # 计算到最近倒角顶点的距离
-            corner_x = half_width - self.chamfer
-            corner_y = half_depth - self.chamfer
-            
-            if dx > 0:
-                corner_x = -corner_x
-            if dy > 0:
-                corner_y = -corner_y
-            
-            # 检查点是否在倒角三角形内
-            dx_corner = abs(dx - corner_x)
-            dy_corner = abs(dy - corner_y)
-            return dx_corner + dy_corner <= self.chamfer
-        
-        return True
+        in_rect = (np.abs(dz) <= self.height / 2) & (adx <= half_width) & (ady <= half_depth)
+        ox = np.maximum(adx - (half_width - self.chamfer), 0.0)
+        oy = np.maximum(ady - (half_depth - self.chamfer), 0.0)
+        return in_rect & (ox + oy <= self.chamfer)
     
     def volume(self) -> float:
         """计算体积"""
-        # 倒角矩形面积 × 高度
-        rect_area = self.width * self.depth
-        chamfer_area = 4 * (self.chamfer * self.chamfer / 2)
-        base_area = rect_area - chamfer_area
-        return base_area * self.height
+        # 倒角矩形面积 × 高度：矩形减去四个等腰直角三角形
+        return (self.width * self.depth - 2.0 * self.chamfer * self.chamfer) * self.height
     
     def get_2d_type(self) -> str:
         """获取对应的2D形状类型"""
@@ -1082,12 +1570,18 @@ class ChamferedRectPrism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"ChamferedRectPrism({self.width}, {self.height}, {self.depth}, {self.chamfer})"
+        return self._FMT % (self.width, self.height, self.depth, self.chamfer)
 
 
 class NSidedPolygonPrism(Shape):
     """正多边形棱柱"""
     
+    __slots__ = ('sides', 'diameter', 'radius', 'height',
+                 '_radius_sq', '_apothem', '_apothem_sq', '_side_length', '_inv_angle_per_side',
+                 '_edge_normals', '_normals', '_edge_nx', '_edge_ny', '_vertex_rays')
+    
+    _FMT = "NSidedPolygonPrism(%s, %s, %s)"
+    
     def __init__(self, diameter: float, height: float, sides: int, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化正多边形棱柱
@@ -1108,6 +1602,28 @@ class NSidedPolygonPrism(Shape):
         self.height = float(height)
         self.sides = int(sides)
         self.radius = diameter / 2
+        self._update_edges()
+    
+    def _update_edges(self) -> None:
+        """刷新内切圆半径和各边外法向量（第k条边的法向角为 (k + 0.5) × 2π / 边数）"""
+        self._radius_sq = self.radius * self.radius
+        self._apothem = self.radius * math.cos(math.pi / self.sides)
+        self._apothem_sq = self._apothem * self._apothem
+        self._side_length = 2 * self.radius * math.sin(math.pi / self.sides)
+        angle_per_side = 2 * math.pi / self.sides
+        self._inv_angle_per_side = 1.0 / angle_per_side
+        normals = []
+        for k in range(self.sides):
+            edge_angle = (k * angle_per_side + (k + 1) * angle_per_side) / 2
+            normals.append((math.cos(edge_angle), math.sin(edge_angle)))
+        self._edge_normals = normals
+        self._normals = np.array(normals, dtype=np.float64)
+        # 法向量分量的连续副本，供NumPy批量投影使用
+        self._edge_nx = np.ascontiguousarray(self._normals[:, 0])
+        self._edge_ny = np.ascontiguousarray(self._normals[:, 1])
+        # 各顶点方向的单位向量，编译内核据此二分查找点所在的角度区间
+        rays = [(math.cos(k * angle_per_side), math.sin(k * angle_per_side)) for k in range(self.sides)]
+        self._vertex_rays = np.array(rays, dtype=np.float64)
     
     def get_diameter(self) -> float:
         """获取外接圆直径"""
@@ -1119,7 +1635,8 @@ class NSidedPolygonPrism(Shape):
             raise ValueError("Diameter must be positive")
         self.diameter = float(diameter)
         self.radius = diameter / 2
-        self.is_modified = True
+        self._update_edges()
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -1130,7 +1647,7 @@ class NSidedPolygonPrism(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_sides(self) -> int:
         """获取边数"""
@@ -1141,7 +1658,8 @@ class NSidedPolygonPrism(Shape):
         if sides < 3:
             raise ValueError("Number of sides must be at least 3")
         self.sides = int(sides)
-        self.is_modified = True
+        self._update_edges()
+        self.mark_modified()
     
     def get_radius(self) -> float:
         """获取外接圆半径"""
@@ -1149,13 +1667,17 @@ class NSidedPolygonPrism(Shape):
     
     def get_apothem(self) -> float:
         """获取内切圆半径"""
-        return self.radius * math.cos(math.pi / self.sides)
+        return self._apothem
     
     def get_side_length(self) -> float:
         """获取边长"""
-        return 2 * self.radius * math.sin(math.pi / self.sides)
+        return self._side_length
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.radius, self.radius, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
         half_height = self.height / 2
         
@@ -1166,48 +1688,61 @@ class NSidedPolygonPrism(Shape):
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在正多边形棱柱内"""
+        if HAS_NUMBA:
+            position = self.position
+            return nsided_contains(point.x, point.y, point.z, position.x, position.y, position.z,
+                                   self.height / 2, self._radius_sq, self._apothem, self._apothem_sq,
+                                   self._vertex_rays, self._normals)
+        
         # 检查高度
         half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
+        if fabs(point.z - self.position.z) > half_height:
             return False
         
         # 检查2D投影是否在正多边形内
         dx = point.x - self.position.x
         dy = point.y - self.position.y
         
-        # 使用内切圆半径进行快速检查
-        if dx * dx + dy * dy <= self.get_apothem() * self.get_apothem():
+        # 外接圆之外直接排除，内切圆之内直接接受
+        r2 = dx * dx + dy * dy
+        if r2 > self._radius_sq:
+            return False
+        if r2 <= self._apothem_sq:
             return True
         
-        # 精确检查：计算点与各边的位置关系
-        angle = math.atan2(dy, dx)
-        if angle < 0:
-            angle += 2 * math.pi
+        # 精确检查：找到点所在的角度区间，与该边的法向投影比较
+        angle = math.atan2(dy, dx) % _TWO_PI
+        side_index = int(angle * self._inv_angle_per_side) % self.sides
+        nx, ny = self._edge_normals[side_index]
         
-        # 找到点所在的角度区间
-        angle_per_side = 2 * math.pi / self.sides
-        side_index = int(angle / angle_per_side)
-        
-        # 计算该边的两个顶点
-        angle1 = side_index * angle_per_side
-        angle2 = (side_index + 1) * angle_per_side
-        
-        # 计算边的法向量
-        edge_angle = (angle1 + angle2) / 2
-        nx = math.cos(edge_angle)
-        ny = math.sin(edge_angle)
-        
-        # 计算点到边的距离
-        edge_distance = dx * nx + dy * ny
-        
-        return edge_distance <= self.get_apothem()
+        return dx * nx + dy * ny <= self._apothem
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在正多边形棱柱内（向量化）
+
+        凸多边形内的点在所有边外法向上的投影都不超过内切圆半径，
+        先按外接圆、内切圆筛选，只对剩余点用外积求逐边投影。安装numba时改用与contains_point相同的编译内核。
+        """
+        if HAS_NUMBA:
+            position = self.position
+            return nsided_contains_many(_as_point_array(points), position.x, position.y, position.z,
+                                        self.height / 2, self._radius_sq, self._apothem, self._apothem_sq,
+                                        self._vertex_rays, self._normals)
+        dx, dy, dz = self._point_offsets(points)
+        r2 = dx * dx + dy * dy
+        result = (np.abs(dz) <= self.height / 2) & (r2 <= self._radius_sq)
+        # 只对外接圆内、内切圆外的点做逐边投影
+        edge = result & (r2 > self._apothem_sq)
+        if edge.any():
+            projections = np.outer(dx[edge], self._edge_nx)
+            projections += np.outer(dy[edge], self._edge_ny)
+            result[edge] = projections.max(axis=1) <= self._apothem
+        return result
     
     def volume(self) -> float:
         """计算体积"""
         # 正多边形面积 × 高度
-        perimeter = self.sides * self.get_side_length()
-        apothem = self.get_apothem()
-        base_area = (perimeter * apothem) / 2
+        base_area = (self.sides * self._side_length * self._apothem) / 2
         return base_area * self.height
     
     def get_2d_type(self) -> str:
@@ -1215,13 +1750,20 @@ class NSidedPolygonPrism(Shape):
         return Shape2DType.N_SIDED_POLYGON
     
     def to_string(self) -> str:
-        """转换为字符串表示"""
-        return f"NSidedPolygonPrism({self.diameter}, {self.height}, {self.sides})"
+        """转换为字符串表示（缓存结果，尺寸变化后重新生成）"""
+        if self._str_cache is None:
+            self._str_cache = self._FMT % (self.diameter, self.height, self.sides)
+        return self._str_cache
 
 
 class Prism(Shape):
     """棱柱"""
     
+    __slots__ = ('base_shape', 'height')
+    
+    _FMT = "Prism(%s, %s)"
+    _CENTERED_BBOX = False
+    
     def __init__(self, base_shape: Shape2D, height: float, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化棱柱
@@ -1249,7 +1791,7 @@ class Prism(Shape):
         if base_shape is None:
             raise ValueError("Base shape cannot be None")
         self.base_shape = base_shape
-        self.is_modified = True
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -1260,31 +1802,48 @@ class Prism(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_bounding_box(self) -> BoundingBox3D:
+        """获取3D边界框（底面形状可被单独修改，不做缓存）"""
+        return self._compute_bounding_box()
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
-        min_x, min_y, max_x, max_y = self.base_shape.get_bounding_box_2d()
+        base_bbox = self.base_shape.get_bounding_box_2d()
         half_height = self.height / 2
         
         return BoundingBox3D(
-            self.position.x + min_x, self.position.y + min_y, self.position.z - half_height,
-            self.position.x + max_x, self.position.y + max_y, self.position.z + half_height
+            self.position.x + base_bbox.min_x, self.position.y + base_bbox.min_y, self.position.z - half_height,
+            self.position.x + base_bbox.max_x, self.position.y + base_bbox.max_y, self.position.z + half_height
         )
     
     def contains_point(self, point: Vector3D) -> bool:
         """检查点是否在棱柱内"""
         # 检查高度
         half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
+        if fabs(point.z - self.position.z) > half_height:
             return False
         
         # 检查2D投影是否在底面内
         dx = point.x - self.position.x
         dy = point.y - self.position.y
-        test_point = Vector3D(dx, dy, 0)
         
-        return self.base_shape.contains_point(test_point)
+        return self.base_shape._contains_xy(dx, dy)
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在棱柱内（高度判断向量化，仅对高度范围内的点逐个检查底面）"""
+        dx, dy, dz = self._point_offsets(points)
+        mask = np.abs(dz) <= self.height / 2
+        candidates = np.flatnonzero(mask)
+        if candidates.size:
+            base_contains = self.base_shape._contains_xy
+            mask[candidates] = np.fromiter(
+                (base_contains(x, y)
+                 for x, y in zip(dx[candidates].tolist(), dy[candidates].tolist())),
+                dtype=bool, count=candidates.size,
+            )
+        return mask
     
     def volume(self) -> float:
         """计算体积"""
@@ -1297,12 +1856,16 @@ class Prism(Shape):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"Prism({self.base_shape.to_string()}, {self.height})"
+        return self._FMT % (self.base_shape.to_string(), self.height)
 
 
 class Cylinder(Shape):
     """圆柱体"""
     
+    __slots__ = ('radius', 'height', 'radius_sq', '_half_height')
+    
+    _FMT = "Cylinder(%s, %s)"
+    
     def __init__(self, radius: float, height: float, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化圆柱体
@@ -1317,7 +1880,9 @@ class Cylinder(Shape):
         if radius <= 0 or height <= 0:
             raise ValueError("Radius and height must be positive")
         self.radius = float(radius)
+        self.radius_sq = self.radius * self.radius
         self.height = float(height)
+        self._half_height = self.height / 2
     
     def get_radius(self) -> float:
         """获取半径"""
@@ -1328,7 +1893,8 @@ class Cylinder(Shape):
         if radius <= 0:
             raise ValueError("Radius must be positive")
         self.radius = float(radius)
-        self.is_modified = True
+        self.radius_sq = self.radius * self.radius
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -1339,11 +1905,16 @@ class Cylinder(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self._half_height = self.height / 2
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.radius, self.radius, self._half_height
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
-        half_height = self.height / 2
+        half_height = self._half_height
         
         return BoundingBox3D(
             self.position.x - self.radius, self.position.y - self.radius, self.position.z - half_height,
@@ -1351,18 +1922,66 @@ class Cylinder(Shape):
         )
     
     def contains_point(self, point: Vector3D) -> bool:
-        """检查点是否在圆柱体内"""
+        """检查点是否在圆柱体内（单点直接用缓存的半高和半径平方计算，编译内核只用于批量路径）"""
+        position = self.position
         # 检查高度
-        half_height = self.height / 2
-        if abs(point.z - self.position.z) > half_height:
+        if fabs(point.z - position.z) > self._half_height:
             return False
         
         # 检查2D投影是否在圆形内
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
-        distance_squared = dx * dx + dy * dy
+        dx = point.x - position.x
+        dy = point.y - position.y
+        return dx * dx + dy * dy <= self.radius_sq
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在圆柱体内（向量化）"""
+        if HAS_NUMBA:
+            position = self.position
+            return cylinder_contains_many(_as_point_array(points), position.x, position.y, position.z,
+                                          self._half_height, self.radius_sq)
+        dx, dy, dz = self._point_offsets(points)
+        return ((np.abs(dz) <= self._half_height) &
+                ((dx * dx + dy * dy) <= self.radius_sq))
+    
+    def contains_points_xyz(self, xs: np.ndarray, ys: np.ndarray, zs: np.ndarray) -> np.ndarray:
+        """
+        按分量数组批量检查点是否在圆柱体内
         
-        return distance_squared <= self.radius * self.radius
+        计算沿用输入数组的精度（float32输入按float32计算），中间结果复用同一缓冲区。
+        
+        Args:
+            xs: (N,) X坐标
+            ys: (N,) Y坐标
+            zs: (N,) Z坐标
+            
+        Returns:
+            np.ndarray: 形状为(N,)的布尔掩码
+        """
+        position = self.position
+        d2 = np.subtract(xs, position.x)
+        np.multiply(d2, d2, out=d2)
+        dy = np.subtract(ys, position.y)
+        np.multiply(dy, dy, out=dy)
+        d2 += dy
+        mask = np.less_equal(d2, self.radius_sq)
+        np.subtract(zs, position.z, out=dy)
+        np.abs(dy, out=dy)
+        mask &= np.less_equal(dy, self._half_height)
+        return mask
+    
+    @classmethod
+    def contains_point_batch(cls, shapes: List[Shape], point: Vector3D) -> np.ndarray:
+        """检查一个点落在一组圆柱体中的哪些内（向量化）"""
+        n = len(shapes)
+        params = np.fromiter(
+            (c for s in shapes for c in (s.position.x, s.position.y, s.position.z,
+                                         s._half_height, s.radius_sq)),
+            dtype=np.float64, count=5 * n,
+        ).reshape(n, 5)
+        dx = point.x - params[:, 0]
+        dy = point.y - params[:, 1]
+        return ((np.abs(point.z - params[:, 2]) <= params[:, 3]) &
+                ((dx * dx + dy * dy) <= params[:, 4]))
     
     def volume(self) -> float:
         """计算体积"""
@@ -1374,13 +1993,19 @@ class Cylinder(Shape):
         return Shape2DType.CIRCLE
     
     def to_string(self) -> str:
-        """转换为字符串表示"""
-        return f"Cylinder({self.radius}, {self.height})"
+        """转换为字符串表示（缓存结果，尺寸变化后重新生成）"""
+        if self._str_cache is None:
+            self._str_cache = self._FMT % (self.radius, self.height)
+        return self._str_cache
 
 
 class Trace(Shape):
     """轨迹（细长矩形棱柱）"""
     
+    __slots__ = ('width', 'height', 'length')
+    
+    _FMT = "Trace(%s, %s, %s)"
+    
     def __init__(self, width: float, height: float, length: float, position: Vector3D = None, rotation: float = 0.0):
         """
         初始化轨迹
@@ -1408,7 +2033,7 @@ class Trace(Shape):
         if width <= 0:
             raise ValueError("Width must be positive")
         self.width = float(width)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_height(self) -> float:
         """获取高度"""
@@ -1419,7 +2044,7 @@ class Trace(Shape):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
-        self.is_modified = True
+        self.mark_modified()
     
     def get_length(self) -> float:
         """获取长度"""
@@ -1430,13 +2055,15 @@ class Trace(Shape):
         if length <= 0:
             raise ValueError("Length must be positive")
         self.length = float(length)
-        self.is_modified = True
+        self.mark_modified()
     
-    def get_bounding_box(self) -> BoundingBox3D:
+    def _compute_halves(self) -> Tuple[float, float, float]:
+        """计算X、Y、Z方向的半尺寸"""
+        return self.width / 2, self.length / 2, self.height / 2
+    
+    def _compute_bounding_box(self) -> BoundingBox3D:
         """获取3D边界框"""
-        half_width = self.width / 2
-        half_height = self.height / 2
-        half_length = self.length / 2
+        half_width, half_length, half_height = self._halves()
         
         return BoundingBox3D(
             self.position.x - half_width, self.position.y - half_length, self.position.z - half_height,
@@ -1444,14 +2071,29 @@ class Trace(Shape):
         )
     
     def contains_point(self, point: Vector3D) -> bool:
-        """检查点是否在轨迹内"""
-        half_width = self.width / 2
-        half_height = self.height / 2
-        half_length = self.length / 2
-        
-        return (abs(point.x - self.position.x) <= half_width and
-                abs(point.y - self.position.y) <= half_length and
-                abs(point.z - self.position.z) <= half_height)
+        """检查点是否在轨迹内（单点逐轴短路比较，编译内核只用于批量路径）"""
+        half_width, half_length, half_height = self._halves()
+        position = self.position
+        return (fabs(point.x - position.x) <= half_width and
+                fabs(point.y - position.y) <= half_length and
+                fabs(point.z - position.z) <= half_height)
+    
+    def contains_points(self, points) -> np.ndarray:
+        """批量检查点是否在轨迹内（向量化）"""
+        half_width, half_length, half_height = self._halves()
+        if HAS_NUMBA:
+            position = self.position
+            return box_contains_many(_as_point_array(points), position.x, position.y, position.z,
+                                     half_width, half_length, half_height)
+        dx, dy, dz = self._point_offsets(points)
+        return ((np.abs(dx) <= half_width) &
+                (np.abs(dy) <= half_length) &
+                (np.abs(dz) <= half_height))
+    
+    @classmethod
+    def contains_point_batch(cls, shapes: List[Shape], point: Vector3D) -> np.ndarray:
+        """检查一个点落在一组轨迹中的哪些内（向量化）"""
+        return _boxes_contain_point(shapes, point)
     
     def volume(self) -> float:
         """计算体积"""
@@ -1462,8 +2104,10 @@ class Trace(Shape):
         return Shape2DType.RECTANGLE
     
     def to_string(self) -> str:
-        """转换为字符串表示"""
-        return f"Trace({self.width}, {self.height}, {self.length})"
+        """转换为字符串表示（缓存结果，尺寸变化后重新生成）"""
+        if self._str_cache is None:
+            self._str_cache = self._FMT % (self.width, self.height, self.length)
+        return self._str_cache
 
 
 # ============================================================================
@@ -1473,6 +2117,10 @@ class Trace(Shape):
 class Circle(Shape2D):
     """圆形"""
     
+    __slots__ = ('radius', 'radius_sq')
+    
+    _FMT = "circle([%s,%s], %s)"
+    
     def __init__(self, position: Vector2D = None, radius: float = 1.0):
         """
         初始化圆形
@@ -1485,6 +2133,7 @@ class Circle(Shape2D):
         if radius <= 0:
             raise ValueError("Radius must be positive")
         self.radius = float(radius)
+        self.radius_sq = self.radius * self.radius
     
     def get_radius(self) -> float:
         """获取半径"""
@@ -1495,8 +2144,14 @@ class Circle(Shape2D):
         if radius <= 0:
             raise ValueError("Radius must be positive")
         self.radius = float(radius)
+        self.radius_sq = self.radius * self.radius
         self.is_modified = True
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方"""
+        return self.radius_sq
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
         return BoundingBox2D(
@@ -1506,10 +2161,19 @@ class Circle(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在圆形内"""
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在圆形内"""
+        dx = x - self.position.x
+        dy = y - self.position.y
         distance_squared = dx * dx + dy * dy
-        return distance_squared <= self.radius * self.radius
+        return distance_squared <= self.radius_sq
+    
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在圆形内（向量化）"""
+        dx, dy = self._point_offsets_xy(xs, ys)
+        return dx * dx + dy * dy <= self.radius_sq
     
     def get_area(self) -> float:
         """计算面积"""
@@ -1517,12 +2181,16 @@ class Circle(Shape2D):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"circle([{self.position.x},{self.position.y}], {self.radius})"
+        return self._FMT % (self.position.x, self.position.y, self.radius)
 
 
 class Rectangle(Shape2D):
     """矩形"""
     
+    __slots__ = ('width', 'height', 'half_width', 'half_height')
+    
+    _FMT = "rectangle([%s,%s], %s, %s)"
+    
     def __init__(self, position: Vector2D = None, width: float = 1.0, height: float = 1.0):
         """
         初始化矩形
@@ -1537,6 +2205,8 @@ class Rectangle(Shape2D):
             raise ValueError("Width and height must be positive")
         self.width = float(width)
         self.height = float(height)
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
     
     def get_width(self) -> float:
         """获取宽度"""
@@ -1547,6 +2217,7 @@ class Rectangle(Shape2D):
         if width <= 0:
             raise ValueError("Width must be positive")
         self.width = float(width)
+        self.half_width = self.width / 2
         self.is_modified = True
     
     def get_height(self) -> float:
@@ -1558,12 +2229,18 @@ class Rectangle(Shape2D):
         if height <= 0:
             raise ValueError("Height must be positive")
         self.height = float(height)
+        self.half_height = self.height / 2
         self.is_modified = True
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方（半对角线）"""
+        return self.half_width * self.half_width + self.half_height * self.half_height
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_width = self.half_width
+        half_height = self.half_height
         
         return BoundingBox2D(
             self.position.x - half_width, self.position.y - half_height,
@@ -1572,11 +2249,17 @@ class Rectangle(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在矩形内"""
-        half_width = self.width / 2
-        half_height = self.height / 2
-        
-        return (abs(point.x - self.position.x) <= half_width and
-                abs(point.y - self.position.y) <= half_height)
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在矩形内"""
+        return (fabs(x - self.position.x) <= self.half_width and
+                fabs(y - self.position.y) <= self.half_height)
+    
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在矩形内（向量化）"""
+        dx, dy = self._point_offsets_xy(xs, ys)
+        return (np.abs(dx) <= self.half_width) & (np.abs(dy) <= self.half_height)
     
     def get_area(self) -> float:
         """计算面积"""
@@ -1584,12 +2267,16 @@ class Rectangle(Shape2D):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"rectangle([{self.position.x},{self.position.y}], {self.width}, {self.height})"
+        return self._FMT % (self.position.x, self.position.y, self.width, self.height)
 
 
 class Square(Shape2D):
     """正方形"""
     
+    __slots__ = ('side', 'half_side')
+    
+    _FMT = "square([%s,%s], %s)"
+    
     def __init__(self, position: Vector2D = None, side: float = 1.0):
         """
         初始化正方形
@@ -1602,6 +2289,7 @@ class Square(Shape2D):
         if side <= 0:
             raise ValueError("Side must be positive")
         self.side = float(side)
+        self.half_side = self.side / 2
     
     def get_side(self) -> float:
         """获取边长"""
@@ -1612,11 +2300,17 @@ class Square(Shape2D):
         if side <= 0:
             raise ValueError("Side must be positive")
         self.side = float(side)
+        self.half_side = self.side / 2
         self.is_modified = True
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方（半对角线）"""
+        return 2.0 * self.half_side * self.half_side
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
-        half_side = self.side / 2
+        half_side = self.half_side
         
         return BoundingBox2D(
             self.position.x - half_side, self.position.y - half_side,
@@ -1625,10 +2319,19 @@ class Square(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在正方形内"""
-        half_side = self.side / 2
-        
-        return (abs(point.x - self.position.x) <= half_side and
-                abs(point.y - self.position.y) <= half_side)
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在正方形内"""
+        half_side = self.half_side
+        return (fabs(x - self.position.x) <= half_side and
+                fabs(y - self.position.y) <= half_side)
+    
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在正方形内（向量化）"""
+        dx, dy = self._point_offsets_xy(xs, ys)
+        half_side = self.half_side
+        return (np.abs(dx) <= half_side) & (np.abs(dy) <= half_side)
     
     def get_area(self) -> float:
         """计算面积"""
@@ -1636,12 +2339,16 @@ class Square(Shape2D):
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"square([{self.position.x},{self.position.y}], {self.side})"
+        return self._FMT % (self.position.x, self.position.y, self.side)
 
 
 class OblongX(Shape2D):
     """X方向椭圆形"""
     
+    __slots__ = ('length', 'width', 'radius_x', 'radius_y')
+    
+    _FMT = "oblong_x([%s,%s], %s, %s)"
+    
     def __init__(self, position: Vector2D = None, length: float = 1.0, width: float = 1.0):
         """
         初始化X方向椭圆形
@@ -1683,6 +2390,12 @@ class OblongX(Shape2D):
         self.radius_y = width / 2
         self.is_modified = True
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方（长半轴）"""
+        r = max(self.radius_x, self.radius_y)
+        return r * r
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
         return BoundingBox2D(
@@ -1692,8 +2405,12 @@ class OblongX(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在X方向椭圆内"""
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在X方向椭圆内"""
+        dx = x - self.position.x
+        dy = y - self.position.y
         
         # 椭圆方程：(x/a)² + (y/b)² ≤ 1
         normalized_x = dx / self.radius_x
@@ -1701,18 +2418,29 @@ class OblongX(Shape2D):
         
         return (normalized_x * normalized_x + normalized_y * normalized_y) <= 1.0
     
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在X方向椭圆内（向量化）"""
+        dx, dy = self._point_offsets_xy(xs, ys)
+        normalized_x = dx / self.radius_x
+        normalized_y = dy / self.radius_y
+        return normalized_x * normalized_x + normalized_y * normalized_y <= 1.0
+    
     def get_area(self) -> float:
         """计算面积"""
         return math.pi * self.radius_x * self.radius_y
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"oblong_x([{self.position.x},{self.position.y}], {self.length}, {self.width})"
+        return self._FMT % (self.position.x, self.position.y, self.length, self.width)
 
 
 class OblongY(Shape2D):
     """Y方向椭圆形"""
     
+    __slots__ = ('length', 'width', 'radius_x', 'radius_y')
+    
+    _FMT = "oblong_y([%s,%s], %s, %s)"
+    
     def __init__(self, position: Vector2D = None, length: float = 1.0, width: float = 1.0):
         """
         初始化Y方向椭圆形
@@ -1754,6 +2482,12 @@ class OblongY(Shape2D):
         self.radius_x = width / 2
         self.is_modified = True
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方（长半轴）"""
+        r = max(self.radius_x, self.radius_y)
+        return r * r
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
         return BoundingBox2D(
@@ -1763,8 +2497,12 @@ class OblongY(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在Y方向椭圆内"""
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在Y方向椭圆内"""
+        dx = x - self.position.x
+        dy = y - self.position.y
         
         # 椭圆方程：(x/b)² + (y/a)² ≤ 1
         normalized_x = dx / self.radius_x
@@ -1772,18 +2510,30 @@ class OblongY(Shape2D):
         
         return (normalized_x * normalized_x + normalized_y * normalized_y) <= 1.0
     
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在Y方向椭圆内（向量化）"""
+        dx, dy = self._point_offsets_xy(xs, ys)
+        normalized_x = dx / self.radius_x
+        normalized_y = dy / self.radius_y
+        return normalized_x * normalized_x + normalized_y * normalized_y <= 1.0
+    
     def get_area(self) -> float:
         """计算面积"""
         return math.pi * self.radius_x * self.radius_y
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"oblong_y([{self.position.x},{self.position.y}], {self.length}, {self.width})"
+        return self._FMT % (self.position.x, self.position.y, self.length, self.width)
 
 
 class RoundedRectangle(Shape2D):
     """圆角矩形"""
     
+    __slots__ = ('width', 'height', 'radius', 'half_width', 'half_height',
+                 'inner_half_w', 'inner_half_h', 'radius_sq')
+    
+    _FMT = "rounded_rectangle([%s,%s], %s, %s, %s)"
+    
     def __init__(self, position: Vector2D = None, width: float = 1.0, height: float = 1.0, radius: float = 0.1):
         """
         初始化圆角矩形
@@ -1802,6 +2552,15 @@ class RoundedRectangle(Shape2D):
         self.width = float(width)
         self.height = float(height)
         self.radius = float(radius)
+        self._update_corner_params()
+    
+    def _update_corner_params(self) -> None:
+        """刷新包含判定用的半尺寸和圆角起点偏移及半径平方"""
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
+        self.inner_half_w = self.half_width - self.radius
+        self.inner_half_h = self.half_height - self.radius
+        self.radius_sq = self.radius * self.radius
     
     def get_width(self) -> float:
         """获取宽度"""
@@ -1814,6 +2573,7 @@ class RoundedRectangle(Shape2D):
         if self.radius > min(width, self.height) / 2:
             raise ValueError("Radius cannot be larger than half of the smaller dimension")
         self.width = float(width)
+        self._update_corner_params()
         self.is_modified = True
     
     def get_height(self) -> float:
@@ -1827,6 +2587,7 @@ class RoundedRectangle(Shape2D):
         if self.radius > min(self.width, height) / 2:
             raise ValueError("Radius cannot be larger than half of the smaller dimension")
         self.height = float(height)
+        self._update_corner_params()
         self.is_modified = True
     
     def get_radius(self) -> float:
@@ -1840,12 +2601,18 @@ class RoundedRectangle(Shape2D):
         if radius > min(self.width, self.height) / 2:
             raise ValueError("Radius cannot be larger than half of the smaller dimension")
         self.radius = float(radius)
+        self._update_corner_params()
         self.is_modified = True
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方（取外框半对角线）"""
+        return self.half_width * self.half_width + self.half_height * self.half_height
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_width = self.half_width
+        half_height = self.half_height
         
         return BoundingBox2D(
             self.position.x - half_width, self.position.y - half_height,
@@ -1854,48 +2621,63 @@ class RoundedRectangle(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在圆角矩形内"""
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在圆角矩形内"""
+        dx = x - self.position.x
+        dy = y - self.position.y
         
-        half_width = self.width / 2
-        half_height = self.height / 2
+        adx = fabs(dx)
+        ady = fabs(dy)
         
         # 检查是否在矩形边界内
-        if abs(dx) > half_width or abs(dy) > half_height:
+        if adx > self.half_width or ady > self.half_height:
             return False
         
-        # 检查是否在圆角区域内
-        if (abs(dx) > half_width - self.radius and 
-            abs(dy) > half_height - self.radius):
-            # 计算到最近圆角中心的距离
-            corner_x = half_width - self.radius
-            corner_y = half_height - self.radius
-            
-            if dx > 0:
-                corner_x = -corner_x
-            if dy > 0:
-                corner_y = -corner_y
-            
-            distance_squared = ((dx - corner_x) ** 2 + (dy - corner_y) ** 2)
-            return distance_squared <= self.radius * self.radius
-        
-        return True
+        # 各轴超出圆角圆心偏移的部分（不足时取0）即到最近圆角圆心的距离分量
+        ox = adx - self.inner_half_w
+        oy = ady - self.inner_half_h
+        if ox < 0.0:
+            ox = 0.0
+        if oy < 0.0:
+            oy = 0.0
+        return ox * ox + oy * oy <= self.radius_sq
+    
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在圆角矩形内（向量化，判定规则与contains_point一致）"""
+        if HAS_NUMBA:
+            position = self.position
+            return rounded_rect_contains_many(np.ascontiguousarray(xs, dtype=np.float64).ravel(),
+                                              np.ascontiguousarray(ys, dtype=np.float64).ravel(),
+                                              position.x, position.y, self.half_width, self.half_height,
+                                              self.inner_half_w, self.inner_half_h, self.radius_sq)
+        dx, dy = self._point_offsets_xy(xs, ys)
+        adx = np.abs(dx)
+        ady = np.abs(dy)
+        ox = np.maximum(adx - self.inner_half_w, 0.0)
+        oy = np.maximum(ady - self.inner_half_h, 0.0)
+        return ((adx <= self.half_width) & (ady <= self.half_height) &
+                (ox * ox + oy * oy <= self.radius_sq))
     
     def get_area(self) -> float:
         """计算面积"""
-        # 圆角矩形面积
-        rect_area = self.width * self.height
-        corner_area = 4 * (self.radius * self.radius - math.pi * self.radius * self.radius / 4)
-        return rect_area - corner_area + math.pi * self.radius * self.radius
+        # 圆角矩形面积：矩形减去四个角上正方形与四分之一圆之差
+        return self.width * self.height - _FOUR_MINUS_PI * self.radius * self.radius
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"rounded_rectangle([{self.position.x},{self.position.y}], {self.width}, {self.height}, {self.radius})"
+        return self._FMT % (self.position.x, self.position.y, self.width, self.height, self.radius)
 
 
 class ChamferedRectangle(Shape2D):
     """倒角矩形"""
     
+    __slots__ = ('width', 'height', 'chamfer', 'half_width', 'half_height',
+                 'inner_half_w', 'inner_half_h')
+    
+    _FMT = "chamfered_rectangle([%s,%s], %s, %s, %s)"
+    
     def __init__(self, position: Vector2D = None, width: float = 1.0, height: float = 1.0, chamfer: float = 0.1):
         """
         初始化倒角矩形
@@ -1914,6 +2696,14 @@ class ChamferedRectangle(Shape2D):
         self.width = float(width)
         self.height = float(height)
         self.chamfer = float(chamfer)
+        self._update_corner_params()
+    
+    def _update_corner_params(self) -> None:
+        """刷新包含判定用的半尺寸和倒角起点偏移"""
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
+        self.inner_half_w = self.half_width - self.chamfer
+        self.inner_half_h = self.half_height - self.chamfer
     
     def get_width(self) -> float:
         """获取宽度"""
@@ -1926,6 +2716,7 @@ class ChamferedRectangle(Shape2D):
         if self.chamfer > min(width, self.height) / 2:
             raise ValueError("Chamfer cannot be larger than half of the smaller dimension")
         self.width = float(width)
+        self._update_corner_params()
         self.is_modified = True
     
     def get_height(self) -> float:
@@ -1939,6 +2730,7 @@ class ChamferedRectangle(Shape2D):
         if self.chamfer > min(self.width, height) / 2:
             raise ValueError("Chamfer cannot be larger than half of the smaller dimension")
         self.height = float(height)
+        self._update_corner_params()
         self.is_modified = True
     
     def get_chamfer(self) -> float:
@@ -1952,12 +2744,18 @@ class ChamferedRectangle(Shape2D):
         if chamfer > min(self.width, self.height) / 2:
             raise ValueError("Chamfer cannot be larger than half of the smaller dimension")
         self.chamfer = float(chamfer)
+        self._update_corner_params()
         self.is_modified = True
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方（取外框半对角线）"""
+        return self.half_width * self.half_width + self.half_height * self.half_height
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_width = self.half_width
+        half_height = self.half_height
         
         return BoundingBox2D(
             self.position.x - half_width, self.position.y - half_height,
@@ -1966,50 +2764,62 @@ class ChamferedRectangle(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在倒角矩形内"""
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在倒角矩形内"""
+        dx = x - self.position.x
+        dy = y - self.position.y
         
-        half_width = self.width / 2
-        half_height = self.height / 2
+        adx = fabs(dx)
+        ady = fabs(dy)
         
         # 检查是否在矩形边界内
-        if abs(dx) > half_width or abs(dy) > half_height:
+        if adx > self.half_width or ady > self.half_height:
             return False
         
-        # 检查是否在倒角区域内
-        if (abs(dx) > half_width - self.chamfer and 
-            abs(dy) > half_height - self.chamfer):
-            # 计算到最近倒角顶点的距离
-            corner_x = half_width - self.chamfer
-            corner_y = half_height - self.chamfer
-            
-            if dx > 0:
-                corner_x = -corner_x
-            if dy > 0:
-                corner_y = -corner_y
-            
-            # 检查点是否在倒角三角形内
-            dx_corner = abs(dx - corner_x)
-            dy_corner = abs(dy - corner_y)
-            return dx_corner + dy_corner <= self.chamfer
-        
-        return True
+        # 各轴超出倒角起点的部分（不足时取0）之和不超过倒角长度
+        ox = adx - self.inner_half_w
+        oy = ady - self.inner_half_h
+        if ox < 0.0:
+            ox = 0.0
+        if oy < 0.0:
+            oy = 0.0
+        return ox + oy <= self.chamfer
+    
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在倒角矩形内（向量化，判定规则与contains_point一致）"""
+        if HAS_NUMBA:
+            position = self.position
+            return chamfered_rect_contains_many(np.ascontiguousarray(xs, dtype=np.float64).ravel(),
+                                                np.ascontiguousarray(ys, dtype=np.float64).ravel(),
+                                                position.x, position.y, self.half_width, self.half_height,
+                                                self.inner_half_w, self.inner_half_h, self.chamfer)
+        dx, dy = self._point_offsets_xy(xs, ys)
+        adx = np.abs(dx)
+        ady = np.abs(dy)
+        ox = np.maximum(adx - self.inner_half_w, 0.0)
+        oy = np.maximum(ady - self.inner_half_h, 0.0)
+        return (adx <= self.half_width) & (ady <= self.half_height) & (ox + oy <= self.chamfer)
     
     def get_area(self) -> float:
         """计算面积"""
-        # 倒角矩形面积
-        rect_area = self.width * self.height
-        chamfer_area = 4 * (self.chamfer * self.chamfer / 2)
-        return rect_area - chamfer_area
+        # 倒角矩形面积：矩形减去四个等腰直角三角形
+        return self.width * self.height - 2.0 * self.chamfer * self.chamfer
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"chamfered_rectangle([{self.position.x},{self.position.y}], {self.width}, {self.height}, {self.chamfer})"
+        return self._FMT % (self.position.x, self.position.y, self.width, self.height, self.chamfer)
 
 
 class NSidedPolygon(Shape2D):
     """正多边形"""
     
+    __slots__ = ('diameter', 'sides', 'radius', '_radius_sq', '_apothem', '_apothem_sq',
+                 '_angle_per_side', '_vertex_rays', '_normals')
+    
+    _FMT = "n_sided_polygon([%s,%s], %s, %s)"
+    
     def __init__(self, position: Vector2D = None, diameter: float = 1.0, sides: int = 6):
         """
         初始化正多边形
@@ -2027,6 +2837,23 @@ class NSidedPolygon(Shape2D):
         self.diameter = float(diameter)
         self.sides = int(sides)
         self.radius = diameter / 2
+        self._update_edges()
+    
+    def _update_edges(self) -> None:
+        """刷新内切圆半径、每条边对应的圆心角，以及编译内核使用的顶点方向和边法向量"""
+        self._radius_sq = self.radius * self.radius
+        self._apothem = self.radius * math.cos(math.pi / self.sides)
+        self._apothem_sq = self._apothem * self._apothem
+        angle_per_side = 2 * math.pi / self.sides
+        self._angle_per_side = angle_per_side
+        rays = []
+        normals = []
+        for k in range(self.sides):
+            rays.append((math.cos(k * angle_per_side), math.sin(k * angle_per_side)))
+            edge_angle = (k * angle_per_side + (k + 1) * angle_per_side) / 2
+            normals.append((math.cos(edge_angle), math.sin(edge_angle)))
+        self._vertex_rays = np.array(rays, dtype=np.float64)
+        self._normals = np.array(normals, dtype=np.float64)
     
     def get_diameter(self) -> float:
         """获取外接圆直径"""
@@ -2038,6 +2865,7 @@ class NSidedPolygon(Shape2D):
             raise ValueError("Diameter must be positive")
         self.diameter = float(diameter)
         self.radius = diameter / 2
+        self._update_edges()
         self.is_modified = True
     
     def get_sides(self) -> int:
@@ -2049,6 +2877,7 @@ class NSidedPolygon(Shape2D):
         if sides < 3:
             raise ValueError("Number of sides must be at least 3")
         self.sides = int(sides)
+        self._update_edges()
         self.is_modified = True
     
     def get_radius(self) -> float:
@@ -2057,12 +2886,17 @@ class NSidedPolygon(Shape2D):
     
     def get_apothem(self) -> float:
         """获取内切圆半径"""
-        return self.radius * math.cos(math.pi / self.sides)
+        return self._apothem
     
     def get_side_length(self) -> float:
         """获取边长"""
         return 2 * self.radius * math.sin(math.pi / self.sides)
     
+    @property
+    def enclosing_radius_sq(self) -> float:
+        """外接圆半径的平方"""
+        return self._radius_sq
+    
     def get_bounding_box_2d(self) -> BoundingBox2D:
         """获取2D边界框"""
         return BoundingBox2D(
@@ -2072,20 +2906,26 @@ class NSidedPolygon(Shape2D):
     
     def contains_point(self, point: Vector2D) -> bool:
         """检查点是否在正多边形内"""
-        dx = point.x - self.position.x
-        dy = point.y - self.position.y
+        return self._contains_xy(point.x, point.y)
+    
+    def _contains_xy(self, x: float, y: float) -> bool:
+        """按坐标分量检查点是否在正多边形内"""
+        dx = x - self.position.x
+        dy = y - self.position.y
+        if HAS_NUMBA:
+            return polygon_contains(dx, dy, self._radius_sq, self._apothem, self._apothem_sq,
+                                    self._vertex_rays, self._normals)
+        apothem = self._apothem
         
         # 使用内切圆半径进行快速检查
-        if dx * dx + dy * dy <= self.get_apothem() * self.get_apothem():
+        if dx * dx + dy * dy <= self._apothem_sq:
             return True
         
         # 精确检查：计算点与各边的位置关系
-        angle = math.atan2(dy, dx)
-        if angle < 0:
-            angle += 2 * math.pi
+        angle = math.atan2(dy, dx) % _TWO_PI
         
         # 找到点所在的角度区间
-        angle_per_side = 2 * math.pi / self.sides
+        angle_per_side = self._angle_per_side
         side_index = int(angle / angle_per_side)
         
         # 计算该边的两个顶点
@@ -2100,24 +2940,432 @@ class NSidedPolygon(Shape2D):
         # 计算点到边的距离
         edge_distance = dx * nx + dy * ny
         
-        return edge_distance <= self.get_apothem()
+        return edge_distance <= apothem
+    
+    def contains_points(self, xs, ys) -> np.ndarray:
+        """批量检查点是否在正多边形内（向量化，按角度区间取边的方式与contains_point一致）"""
+        if HAS_NUMBA:
+            position = self.position
+            return polygon_contains_many(np.ascontiguousarray(xs, dtype=np.float64).ravel(),
+                                         np.ascontiguousarray(ys, dtype=np.float64).ravel(),
+                                         position.x, position.y, self._radius_sq, self._apothem,
+                                         self._apothem_sq, self._vertex_rays, self._normals)
+        dx, dy = self._point_offsets_xy(xs, ys)
+        apothem = self._apothem
+        inside = dx * dx + dy * dy <= self._apothem_sq
+        outer = ~inside
+        if outer.any():
+            odx = dx[outer]
+            ody = dy[outer]
+            angle_per_side = self._angle_per_side
+            # 角度用math.atan2逐点求出（np.arctan2在区间边界上可能差一个ulp），其余运算按数组进行
+            angle = np.fromiter(map(math.atan2, ody.tolist(), odx.tolist()), dtype=np.float64, count=odx.size)
+            side_index = (np.mod(angle, _TWO_PI) / angle_per_side).astype(np.intp)
+            # 各区间的边法向量（含角度恰为2π时的越界区间），与逐点计算相同
+            edge_angles = [(k * angle_per_side + (k + 1) * angle_per_side) / 2 for k in range(self.sides + 1)]
+            nx = np.array([math.cos(a) for a in edge_angles])
+            ny = np.array([math.sin(a) for a in edge_angles])
+            inside[outer] = odx * nx[side_index] + ody * ny[side_index] <= apothem
+        return inside
     
     def get_area(self) -> float:
         """计算面积"""
         # 正多边形面积
         perimeter = self.sides * self.get_side_length()
-        apothem = self.get_apothem()
-        return (perimeter * apothem) / 2
+        return (perimeter * self._apothem) / 2
     
     def to_string(self) -> str:
         """转换为字符串表示"""
-        return f"n_sided_polygon([{self.position.x},{self.position.y}], {self.diameter}, {self.sides})"
+        return self._FMT % (self.position.x, self.position.y, self.diameter, self.sides)
+
+
+# ============================================================================
+# 形状集合的批量运算
+# ============================================================================
+
+def _boxes_contain_point(shapes: List[Shape], point: Vector3D) -> np.ndarray:
+    """检查一个点落在一组轴对齐长方体形状中的哪些内（形状需提供_halves）"""
+    n = len(shapes)
+    params = np.fromiter(
+        (c for s in shapes for c in (s.position.x, s.position.y, s.position.z, *s._halves())),
+        dtype=np.float64, count=6 * n,
+    ).reshape(n, 6)
+    excess = np.abs(np.array((point.x, point.y, point.z)) - params[:, :3]) - params[:, 3:]
+    return excess.max(axis=1) <= 0.0
+
+
+class CubeArray:
+    """立方体数组类
+
+    以 (N, 3) 的中心坐标和半尺寸数组存储一组轴对齐立方体，
+    点包含判断和边界框计算对全部立方体一次完成。
+    dtype可取np.float32，数据量减半，批量运算按单精度进行（边界附近的判断可能与双精度不同）。
+    """
+    __slots__ = ('positions', 'halves')
+    
+    def __init__(self, positions, length, width, height, dtype=np.float64):
+        self.positions = np.asarray(positions, dtype=dtype).reshape(-1, 3)
+        n = self.positions.shape[0]
+        self.halves = np.empty((n, 3), dtype=dtype)
+        self.halves[:, 0] = length
+        self.halves[:, 1] = width
+        self.halves[:, 2] = height
+        self.halves *= 0.5
+    
+    def __len__(self) -> int:
+        return self.positions.shape[0]
+    
+    def __getitem__(self, index: int) -> Cube:
+        x, y, z = self.positions[index].tolist()
+        hx, hy, hz = self.halves[index].tolist()
+        return Cube(Vector3D(x, y, z), hx * 2, hy * 2, hz * 2)
+    
+    def contains_point(self, point: Vector3D) -> np.ndarray:
+        """
+        检查点落在哪些立方体内（含边界）
+        
+        Returns:
+            np.ndarray: 形状为(N,)的布尔掩码
+        """
+        point_arr = np.array((point.x, point.y, point.z), dtype=self.positions.dtype)
+        excess = np.abs(point_arr - self.positions) - self.halves
+        return excess.max(axis=1) <= 0.0
+    
+    def get_bounding_boxes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """获取全部立方体的边界框，返回 (N, 3) 的最小角和最大角数组"""
+        return self.positions - self.halves, self.positions + self.halves
+
+
+class ShapeSet:
+    """按具体类型分桶的3D形状集合
+
+    构造时按类型分组一次，点查询对每个桶调用该类型的contains_point_batch，
+    避免对异构形状列表逐个做方法分派。
+    """
+    __slots__ = ('shapes', '_by_type')
+    
+    def __init__(self, shapes: List[Shape]):
+        self.shapes = list(shapes)
+        by_type = {}
+        for i, shape in enumerate(self.shapes):
+            by_type.setdefault(type(shape), []).append(i)
+        self._by_type = [
+            (shape_cls, np.array(indices, dtype=np.intp), [self.shapes[i] for i in indices])
+            for shape_cls, indices in by_type.items()
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.shapes)
+    
+    def contains_point(self, point: Vector3D) -> np.ndarray:
+        """
+        检查点落在集合中的哪些形状内
+        
+        Returns:
+            np.ndarray: 形状为(N,)的布尔掩码，顺序与构造时的形状列表一致
+        """
+        mask = np.zeros(len(self.shapes), dtype=bool)
+        for shape_cls, indices, members in self._by_type:
+            mask[indices] = shape_cls.contains_point_batch(members, point)
+        return mask
+    
+    def volumes(self) -> np.ndarray:
+        """获取集合中全部形状的体积，顺序与构造时的形状列表一致"""
+        return compute_volumes(self.shapes)
+
+
+class Shape2DSet:
+    """以列数组存储参数的2D形状集合
+
+    圆形、矩形/正方形、X/Y方向椭圆按类别把中心和判定参数打包为 (4, n) 数组，
+    点查询对每个类别一次数组运算完成；其余形状先按外接圆整体排除远处的形状，
+    只对剩余形状调用_contains_xy。
+    形状尺寸或位置修改后需调用refresh重新打包。
+    """
+    __slots__ = ('shapes', '_packed')
+    
+    def __init__(self, shapes: Optional[List[Shape2D]] = None):
+        self.shapes = list(shapes) if shapes else []
+        self._packed = None
+    
+    def __len__(self) -> int:
+        return len(self.shapes)
+    
+    def add(self, shape: Shape2D) -> None:
+        """添加形状（打包数组在下次查询时重建）"""
+        self.shapes.append(shape)
+        self._packed = None
+    
+    def refresh(self) -> None:
+        """按形状的当前参数重新打包"""
+        self._packed = None
+    
+    def _pack(self):
+        """按类别收集下标和 (cx, cy, 参数1, 参数2) 列数组"""
+        groups = {'circle': [], 'box': [], 'ellipse': []}
+        params = {'circle': [], 'box': [], 'ellipse': []}
+        others = []
+        for i, shape in enumerate(self.shapes):
+            shape_cls = type(shape)
+            position = shape.position
+            if shape_cls is Circle:
+                kind, p1, p2 = 'circle', shape.radius_sq, 0.0
+            elif shape_cls is Rectangle:
+                kind, p1, p2 = 'box', shape.half_width, shape.half_height
+            elif shape_cls is Square:
+                kind, p1, p2 = 'box', shape.half_side, shape.half_side
+            elif shape_cls is OblongX or shape_cls is OblongY:
+                kind, p1, p2 = 'ellipse', shape.radius_x, shape.radius_y
+            else:
+                others.append(i)
+                continue
+            groups[kind].append(i)
+            params[kind].append((position.x, position.y, p1, p2))
+        packed = [
+            (kind, np.array(groups[kind], dtype=np.intp), np.array(params[kind], dtype=np.float64).T.copy())
+            for kind in ('circle', 'box', 'ellipse') if groups[kind]
+        ]
+        # 其余形状的 (cx, cy, 外接圆半径平方) 列数组，用于查询前的整体排除
+        shapes = self.shapes
+        enclosing = np.array(
+            [(shapes[i].position.x, shapes[i].position.y, shapes[i].enclosing_radius_sq) for i in others],
+            dtype=np.float64,
+        ).reshape(-1, 3).T.copy()
+        return packed, np.array(others, dtype=np.intp), enclosing
+    
+    def contains_point(self, point: Vector2D) -> np.ndarray:
+        """
+        检查点落在集合中的哪些形状内
+        
+        Returns:
+            np.ndarray: 形状为(N,)的布尔掩码，顺序与形状列表一致
+        """
+        if self._packed is None:
+            self._packed = self._pack()
+        packed, others, enclosing = self._packed
+        x = point.x
+        y = point.y
+        mask = np.zeros(len(self.shapes), dtype=bool)
+        for kind, indices, params in packed:
+            dx = x - params[0]
+            dy = y - params[1]
+            if kind == 'circle':
+                mask[indices] = dx * dx + dy * dy <= params[2]
+            elif kind == 'box':
+                mask[indices] = (np.abs(dx) <= params[2]) & (np.abs(dy) <= params[3])
+            else:
+                normalized_x = dx / params[2]
+                normalized_y = dy / params[3]
+                mask[indices] = normalized_x * normalized_x + normalized_y * normalized_y <= 1.0
+        if others.size:
+            dx = x - enclosing[0]
+            dy = y - enclosing[1]
+            near = others[dx * dx + dy * dy <= enclosing[2]]
+            shapes = self.shapes
+            for i in near.tolist():
+                mask[i] = shapes[i]._contains_xy(x, y)
+        return mask
+
+
+def pack_bboxes(shapes: List[Shape]) -> np.ndarray:
+    """将一组形状的3D边界框打包为结构数组
+
+    Args:
+        shapes: 3D形状列表
+
+    Returns:
+        np.ndarray: 形状为 (6, N) 的float64数组，各行依次为
+            min_x, min_y, min_z, max_x, max_y, max_z，可直接解包为六个数组
+    """
+    packed = np.empty((6, len(shapes)), dtype=np.float64)
+    for i, shape in enumerate(shapes):
+        packed[:, i] = shape.get_bbox_array()
+    return packed
+
+
+def compute_bboxes(shapes: List[Shape]) -> Tuple[np.ndarray, np.ndarray]:
+    """批量计算一组形状的3D边界框
+
+    以中心对称边界框的形状一次读出中心和半尺寸，按数组运算得到边界；
+    斜立方体和棱柱等其余形状逐个读取get_bbox_array。
+
+    Args:
+        shapes: 3D形状列表
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, 3) 的最小角数组和最大角数组
+    """
+    n = len(shapes)
+    centres = np.fromiter(
+        (c for s in shapes for c in (s.position.x, s.position.y, s.position.z)),
+        dtype=np.float64, count=3 * n,
+    ).reshape(n, 3)
+    halves = np.fromiter(
+        (c for s in shapes for c in (s._halves() if s._CENTERED_BBOX else (0.0, 0.0, 0.0))),
+        dtype=np.float64, count=3 * n,
+    ).reshape(n, 3)
+    mins = centres - halves
+    maxs = centres + halves
+    for i, shape in enumerate(shapes):
+        if not shape._CENTERED_BBOX:
+            arr = shape.get_bbox_array()
+            mins[i] = arr[:3]
+            maxs[i] = arr[3:]
+    return mins, maxs
+
+
+def compute_volumes(shapes: List[Shape]) -> np.ndarray:
+    """批量计算一组形状的体积
+
+    各形状的volume只用缓存的几何参数做乘法（正多边形棱柱不再调用三角函数），
+    逐个读取后直接写入预分配数组，不经过中间列表。
+
+    Args:
+        shapes: 3D形状列表
+
+    Returns:
+        np.ndarray: 形状为 (N,) 的float64体积数组
+    """
+    return np.fromiter((s.volume() for s in shapes), dtype=np.float64, count=len(shapes))
+
+
+def points_in_bboxes(points, packed: np.ndarray) -> np.ndarray:
+    """批量判断点落在哪些边界框内（含边界）
+
+    Args:
+        points: Vector3DArray或可转换为 (M, 3) 数组的点集
+        packed: pack_bboxes 返回的 (6, N) 数组
+
+    Returns:
+        np.ndarray: 形状为 (M, N) 的布尔数组，[i, j] 表示第i个点在第j个边界框内
+    """
+    pts = _as_point_array(points)
+    x = pts[:, 0:1]
+    y = pts[:, 1:2]
+    z = pts[:, 2:3]
+    mask = np.less_equal(packed[0], x)
+    mask &= np.less_equal(packed[1], y)
+    mask &= np.less_equal(packed[2], z)
+    mask &= np.less_equal(x, packed[3])
+    mask &= np.less_equal(y, packed[4])
+    mask &= np.less_equal(z, packed[5])
+    return mask
+
+
+class ShapeIndex:
+    """3D形状的边界框空间索引
+
+    以各形状边界框在XY平面的投影建立shapely的STRtree，查询时先由树筛出
+    XY方向相交的候选，再用边界框数组过滤Z方向，调用方只需对少量候选做精确判断。
+    STRtree构造后不可修改，形状移动或改变尺寸后需调用update重建。
+    """
+    __slots__ = ('shapes', 'mins', 'maxs', '_tree')
+    
+    def __init__(self, shapes: List[Shape]):
+        self.shapes = list(shapes)
+        self.mins = np.empty((0, 3), dtype=np.float64)
+        self.maxs = np.empty((0, 3), dtype=np.float64)
+        self._tree = None
+        self.update()
+    
+    def __len__(self) -> int:
+        return len(self.shapes)
+    
+    def update(self) -> None:
+        """重新读取全部形状的边界框并重建索引"""
+        import shapely
+        
+        if self.shapes:
+            self.mins, self.maxs = compute_bboxes(self.shapes)
+        else:
+            self.mins = np.empty((0, 3), dtype=np.float64)
+            self.maxs = np.empty((0, 3), dtype=np.float64)
+        boxes = shapely.box(self.mins[:, 0], self.mins[:, 1], self.maxs[:, 0], self.maxs[:, 1])
+        self._tree = shapely.STRtree(boxes)
+    
+    def _filter_z(self, candidates: np.ndarray, min_z: float, max_z: float) -> np.ndarray:
+        """保留Z方向区间与 [min_z, max_z] 相交的候选"""
+        keep = (self.mins[candidates, 2] <= max_z) & (min_z <= self.maxs[candidates, 2])
+        return np.sort(candidates[keep])
+    
+    def query_point(self, point: Vector3D) -> np.ndarray:
+        """
+        查询边界框包含该点（含边界）的形状
+        
+        Args:
+            point: 查询点
+            
+        Returns:
+            np.ndarray: 候选形状在构造列表中的下标，升序
+        """
+        import shapely
+        
+        candidates = self._tree.query(shapely.Point(point.x, point.y), predicate='intersects')
+        return self._filter_z(candidates, point.z, point.z)
+    
+    def query_box(self, bbox: BoundingBox3D) -> np.ndarray:
+        """
+        查询边界框与给定边界框相交（含接触）的形状
+        
+        Args:
+            bbox: 查询边界框
+            
+        Returns:
+            np.ndarray: 候选形状在构造列表中的下标，升序
+        """
+        import shapely
+        
+        query = shapely.box(bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y)
+        candidates = self._tree.query(query, predicate='intersects')
+        return self._filter_z(candidates, bbox.min_z, bbox.max_z)
+    
+    def shapes_containing(self, point: Vector3D) -> List[Shape]:
+        """
+        查找包含该点的全部形状（边界框粗筛后逐个精确判断）
+        
+        Args:
+            point: 查询点
+            
+        Returns:
+            List[Shape]: 包含该点的形状，顺序与构造列表一致
+        """
+        shapes = self.shapes
+        return [shapes[i] for i in self.query_point(point).tolist() if shapes[i].contains_point(point)]
 
 
 # ============================================================================
 # 形状工厂类
 # ============================================================================
 
+# 形状类型字符串到形状类的映射，供工厂按名称查找
+_SHAPE_3D_CLASSES = {
+    "cube": Cube,
+    "cylinder": Cylinder,
+    "hexagonal_prism": HexagonalPrism,
+    "oblique_cube": ObliqueCube,
+    "prism": Prism,
+    "rect_prism": RectPrism,
+    "square_prism": SquarePrism,
+    "oblong_x_prism": OblongXPrism,
+    "oblong_y_prism": OblongYPrism,
+    "rounded_rect_prism": RoundedRectPrism,
+    "chamfered_rect_prism": ChamferedRectPrism,
+    "n_sided_polygon_prism": NSidedPolygonPrism,
+    "trace": Trace,
+}
+
+_SHAPE_2D_CLASSES = {
+    "circle": Circle,
+    "rectangle": Rectangle,
+    "square": Square,
+    "oblong_x": OblongX,
+    "oblong_y": OblongY,
+    "rounded_rectangle": RoundedRectangle,
+    "chamfered_rectangle": ChamferedRectangle,
+    "n_sided_polygon": NSidedPolygon,
+}
+
+
 class ShapeFactory:
     """形状工厂类，用于创建各种形状对象"""
     
@@ -2133,36 +3381,10 @@ class ShapeFactory:
         Returns:
             Shape: 形状对象
         """
-        shape_type = shape_type.lower()
-        
-        if shape_type == "cube":
-            return Cube(**kwargs)
-        elif shape_type == "cylinder":
-            return Cylinder(**kwargs)
-        elif shape_type == "hexagonal_prism":
-            return HexagonalPrism(**kwargs)
-        elif shape_type == "oblique_cube":
-            return ObliqueCube(**kwargs)
-        elif shape_type == "prism":
-            return Prism(**kwargs)
-        elif shape_type == "rect_prism":
-            return RectPrism(**kwargs)
-        elif shape_type == "square_prism":
-            return SquarePrism(**kwargs)
-        elif shape_type == "oblong_x_prism":
-            return OblongXPrism(**kwargs)
-        elif shape_type == "oblong_y_prism":
-            return OblongYPrism(**kwargs)
-        elif shape_type == "rounded_rect_prism":
-            return RoundedRectPrism(**kwargs)
-        elif shape_type == "chamfered_rect_prism":
-            return ChamferedRectPrism(**kwargs)
-        elif shape_type == "n_sided_polygon_prism":
-            return NSidedPolygonPrism(**kwargs)
-        elif shape_type == "trace":
-            return Trace(**kwargs)
-        else:
-            raise ValueError(f"Unknown 3D shape type: {shape_type}")
+        shape_cls = _SHAPE_3D_CLASSES.get(shape_type.lower())
+        if shape_cls is None:
+            raise ValueError(f"Unknown 3D shape type: {shape_type.lower()}")
+        return shape_cls(**kwargs)
     
     @staticmethod
     def create_2d_shape(shape_type: str, **kwargs) -> Shape2D:
@@ -2176,23 +3398,7 @@ class ShapeFactory:
         Returns:
             Shape2D: 2D形状对象
         """
-        shape_type = shape_type.lower()
-        
-        if shape_type == "circle":
-            return Circle(**kwargs)
-        elif shape_type == "rectangle":
-            return Rectangle(**kwargs)
-        elif shape_type == "square":
-            return Square(**kwargs)
-        elif shape_type == "oblong_x":
-            return OblongX(**kwargs)
-        elif shape_type == "oblong_y":
-            return OblongY(**kwargs)
-        elif shape_type == "rounded_rectangle":
-            return RoundedRectangle(**kwargs)
-        elif shape_type == "chamfered_rectangle":
-            return ChamferedRectangle(**kwargs)
-        elif shape_type == "n_sided_polygon":
-            return NSidedPolygon(**kwargs)
-        else:
-            raise ValueError(f"Unknown 2D shape type: {shape_type}")
+        shape_cls = _SHAPE_2D_CLASSES.get(shape_type.lower())
+        if shape_cls is None:
+            raise ValueError(f"Unknown 2D shape type: {shape_type.lower()}")
+        return shape_cls(**kwargs)
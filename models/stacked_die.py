@@ -324,8 +324,6 @@ class StackedDieSection(Section):
             if "powermap" in json_data:
                 self.powermap.from_json(json_data["powermap"])
 
-            logger.debug(f"Loaded StackedDieSection: {self.name}")
-
         except Exception as e:
             logger.error(f"Failed to load StackedDieSection from JSON: {e}")
             raise
@@ -333,33 +331,33 @@ class StackedDieSection(Section):
     def to_json(self) -> Dict[str, Any]:
         """转换为JSON数据"""
         try:
-            data = super().to_json()
-
-            # 添加堆叠芯片特有属性
-            data.update({
-                "powerType": self.power_type.value,
-                "powermapFile": self.powermap_file,
-                "useGDS": self.use_gds,
-                "gdsFile": self.gds_file,
-                "stackTier": self.stack_tier,
-                "tempFile": self.temp_file,
-                "isFlip": self.is_flip,
-                "materialString": self.material_string,
-                "timMaterial": self.tim_material,
-                "tags": self.tags,
-                "totalPower": self.total_power,
-                "maxDieTemp": self.max_die_temp,
-                "scaleFactor": self.scale_factor,
-                "timSizeX": self.tim_size_x,
-                "timSizeY": self.tim_size_y,
-                "faceUp": self.face_up,
-                "powerScale": self.power_scale,
-                "bump": self.bump.to_json() if self.bump else None,
-                "powermap": self.powermap.to_json()
-            })
-
+            # Section基础字段 + 各子类通过_to_json_fields写入的字段，只构建一个字典
+            data = self.to_dict()
+            self._to_json_fields(data)
             return data
 
         except Exception as e:
-            logger.error(f"Failed to convert StackedDieSection to JSON: {e}")
+            logger.error(f"Failed to convert {type(self).__name__} to JSON: {e}")
             raise
+
+    def _to_json_fields(self, data: Dict[str, Any]) -> None:
+        """将堆叠芯片特有属性写入data，子类覆盖时先调用父类实现"""
+        data["powerType"] = self.power_type.value
+        data["powermapFile"] = self.powermap_file
+        data["useGDS"] = self.use_gds
+        data["gdsFile"] = self.gds_file
+        data["stackTier"] = self.stack_tier
+        data["tempFile"] = self.temp_file
+        data["isFlip"] = self.is_flip
+        data["materialString"] = self.material_string
+        data["timMaterial"] = self.tim_material
+        data["tags"] = self.tags
+        data["totalPower"] = self.total_power
+        data["maxDieTemp"] = self.max_die_temp
+        data["scaleFactor"] = self.scale_factor
+        data["timSizeX"] = self.tim_size_x
+        data["timSizeY"] = self.tim_size_y
+        data["faceUp"] = self.face_up
+        data["powerScale"] = self.power_scale
+        data["bump"] = self.bump.to_json() if self.bump else None
+        data["powermap"] = self.powermap.to_json()
@@ -50,8 +50,6 @@ class NetlistNode:
             self.temperature = json_data.get("temperature", 0.0)
             self.power = json_data.get("power", 0.0)
             
-            logger.debug(f"Loaded NetlistNode: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load NetlistNode from JSON: {e}")
             raise
@@ -115,8 +113,6 @@ class NetlistConnection:
             self.thermal_resistance = json_data.get("thermalResistance", 0.0)
             self.connection_type = json_data.get("connectionType", "")
             
-            logger.debug(f"Loaded NetlistConnection: {self.from_node} -> {self.to_node}")
-            
         except Exception as e:
             logger.error(f"Failed to load NetlistConnection from JSON: {e}")
             raise
@@ -149,12 +145,10 @@ class ThermalNetList:
     def add_node(self, node: NetlistNode) -> None:
         """添加节点"""
         self.nodes.append(node)
-        logger.debug(f"Added netlist node: {node.get_name()}")
     
     def add_connection(self, connection: NetlistConnection) -> None:
         """添加连接"""
         self.connections.append(connection)
-        logger.debug(f"Added netlist connection: {connection.get_from_node()} -> {connection.get_to_node()}")
     
     def get_nodes(self) -> List[NetlistNode]:
         """获取所有节点"""
@@ -37,8 +37,6 @@ class VerticalInterconnectShape:
             self.name = json_data.get("name", "")
             self.shape_type = json_data.get("shape_type", json_data.get("shapeType", ""))
             
-            logger.debug(f"Loaded VerticalInterconnectShape: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load VerticalInterconnectShape from JSON: {e}")
             raise
@@ -92,8 +90,6 @@ class BallBumpShape(VerticalInterconnectShape):
             self.diameter = json_data.get("diameter", 0.0)
             self.height = json_data.get("height", 0.0)
             
-            logger.debug(f"Loaded BallBumpShape: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load BallBumpShape from JSON: {e}")
             raise
@@ -234,8 +230,6 @@ class BallBumpInfo(VerticalInterconnectInfo):
             self.material = json_data.get("material", "")
             self.thermal_conductivity = json_data.get("thermal_conductivity", json_data.get("thermalConductivity", 0.0))
             
-            logger.debug(f"Loaded BallBumpInfo: {self.name}")
-            
         except Exception as e:
             logger.error(f"Failed to load BallBumpInfo from JSON: {e}")
             raise
@@ -265,7 +259,6 @@ class BallBumpsMgr:
     def add(self, ball_bump: BallBumpInfo) -> None:
         """添加球状凸点"""
         self.ball_bumps[ball_bump.get_name()] = ball_bump
-        logger.debug(f"Added ball bump: {ball_bump.get_name()}")
     
     def get(self, name: str) -> Optional[BallBumpInfo]:
         """获取球状凸点"""